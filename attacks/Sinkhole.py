@@ -1,4 +1,5 @@
 import numpy as np
+from core.NodeStore import NodeStore, NORMAL
 from .network_attack_base import NetworkAttackBase
 
 class Sinkhole(NetworkAttackBase):
@@ -8,7 +9,8 @@ class Sinkhole(NetworkAttackBase):
     to attract traffic from other nodes.
     """
     
-    def __init__(self, field, attack_type="outside", attack_range=200):
+    def __init__(self, field, attack_type="outside", attack_range=200, routing=None,
+                 grid_size=100, regions=(2, 2)):
         """
         Initialize the sinkhole attack.
         
@@ -20,78 +22,162 @@ class Sinkhole(NetworkAttackBase):
             Type of attack ("outside" or "inside")
         attack_range : int
             Range of attack influence in meters
+        routing : BaseRoutingProtocol, optional
+            Routing protocol to repair incrementally after nodes are hijacked
+        grid_size : float
+            Side length of the density grid cells in meters
+        regions : tuple
+            Number of regions along (x, y) used for attacker placement
         """
-        super().__init__(field, attack_type, attack_range)
-        self.grid_size = 100  # Grid size for density calculation
+        super().__init__(field, attack_type, attack_range, routing)
+        self.grid_size = grid_size  # Grid size for density calculation
+        self.regions = tuple(regions)
         self.malicious_nodes = []
 
+    def _node_arrays(self):
+        """(노드 ID, x 좌표, y 좌표, normal 여부) 배열 - NodeStore면 열을 그대로 사용"""
+        nodes = self.field.nodes
+        if isinstance(nodes, NodeStore):
+            return nodes.node_id, nodes.pos_x, nodes.pos_y, nodes.node_type == NORMAL
+        values = list(nodes.values())
+        count = len(values)
+        return (np.fromiter((node.node_id for node in values), dtype=np.int64, count=count),
+                np.fromiter((node.pos_x for node in values), dtype=np.float64, count=count),
+                np.fromiter((node.pos_y for node in values), dtype=np.float64, count=count),
+                np.fromiter((node.node_type == "normal" for node in values), dtype=bool, count=count))
+
+    def _region_bounds(self):
+        """구역 경계 (x 경계, y 경계)와 구역당 격자 칸 수 (x, y)"""
+        regions_x, regions_y = self.regions
+        x_bounds = np.array([i * self.field.width / regions_x for i in range(regions_x + 1)])
+        y_bounds = np.array([j * self.field.height / regions_y for j in range(regions_y + 1)])
+        cells_x = max(int(np.ceil((self.field.width / regions_x) / self.grid_size)), 1)
+        cells_y = max(int(np.ceil((self.field.height / regions_y) / self.grid_size)), 1)
+        return x_bounds, y_bounds, cells_x, cells_y
+
+    def density_grid(self):
+        """필드를 regions 구역으로 나누고 구역마다 grid_size 격자로 노드 수를 센 밀도 격자
+
+        모든 노드의 좌표 배열을 한 번에 구역/칸 번호로 바꿔 np.bincount로 센다
+        (histogram2d와 같은 binning). 구역 번호는 위쪽 행부터 왼쪽에서 오른쪽 순서이며
+        (2x2이면 Q1: 좌상, Q2: 우상, Q3: 좌하, Q4: 우하), 칸은 구역의 왼쪽 아래 모서리 기준이다.
+
+        Returns:
+            (counts, cell_of_node, node_ids, normal)
+            counts[r, i, j]: r번 구역의 x 방향 i번째, y 방향 j번째 칸의 노드 수
+            cell_of_node: 노드별 counts.ravel() 인덱스 (필드 밖의 노드는 -1)
+        """
+        node_ids, pos_x, pos_y, normal = self._node_arrays()
+        regions_x, regions_y = self.regions
+        x_bounds, y_bounds, cells_x, cells_y = self._region_bounds()
+
+        region_x = np.searchsorted(x_bounds, pos_x, side='right') - 1
+        region_y = np.searchsorted(y_bounds, pos_y, side='right') - 1
+        inside = (region_x >= 0) & (region_x < regions_x) & (region_y >= 0) & (region_y < regions_y)
+        region_x = np.where(inside, region_x, 0)
+        region_y = np.where(inside, region_y, 0)
+
+        grid_x = np.minimum(((pos_x - x_bounds[region_x]) / self.grid_size).astype(np.int64), cells_x - 1)
+        grid_y = np.minimum(((pos_y - y_bounds[region_y]) / self.grid_size).astype(np.int64), cells_y - 1)
+        region = (regions_y - 1 - region_y) * regions_x + region_x
+        cell_of_node = np.where(inside, (region * cells_x + grid_x) * cells_y + grid_y, -1)
+
+        num_cells = regions_x * regions_y * cells_x * cells_y
+        counts = np.bincount(cell_of_node[inside], minlength=num_cells)
+        return counts.reshape(regions_x * regions_y, cells_x, cells_y), cell_of_node, node_ids, normal
+
     def calculate_node_density(self):
-        """필드를 4개 구역으로 나누고 각 구역의 노드 밀도 계산"""
-        density_map = {}
-        bs_x = self.field.base_station['x']
-        bs_y = self.field.base_station['y']
-        
-        # 필드를 4개 구역으로 나눔
-        quadrants = {
-            'Q1': {'x_range': (0, self.field.width/2), 'y_range': (self.field.height/2, self.field.height)},
-            'Q2': {'x_range': (self.field.width/2, self.field.width), 'y_range': (self.field.height/2, self.field.height)},
-            'Q3': {'x_range': (0, self.field.width/2), 'y_range': (0, self.field.height/2)},
-            'Q4': {'x_range': (self.field.width/2, self.field.width), 'y_range': (0, self.field.height/2)}
-        }
-        
-        # 각 구역별로 그리드 밀도 계산
-        for quadrant, ranges in quadrants.items():
-            density_map[quadrant] = {}
-            
-            # 구역 중심점 계산
-            quadrant_center_x = (ranges['x_range'][0] + ranges['x_range'][1]) / 2
-            quadrant_center_y = (ranges['y_range'][0] + ranges['y_range'][1]) / 2
-            
-            # 해당 구역의 노드들에 대해 그리드 밀도 계산
-            for node in self.field.nodes.values():
-                if (ranges['x_range'][0] <= node.pos_x < ranges['x_range'][1] and 
-                    ranges['y_range'][0] <= node.pos_y < ranges['y_range'][1]):
-                    
-                    grid_x = int((node.pos_x - ranges['x_range'][0]) / self.grid_size)
-                    grid_y = int((node.pos_y - ranges['y_range'][0]) / self.grid_size)
-                    grid_key = (grid_x, grid_y)
-                    
-                    if grid_key not in density_map[quadrant]:
-                        density_map[quadrant][grid_key] = {
-                            'nodes': [],
-                            'center_x': ranges['x_range'][0] + (grid_x + 0.5) * self.grid_size,
-                            'center_y': ranges['y_range'][0] + (grid_y + 0.5) * self.grid_size,
-                            'distance_to_center': 0
-                        }
-                    
-                    density_map[quadrant][grid_key]['nodes'].append(node.node_id)
-                    
-                    # 그리드 중심점과 구역 중심점 사이의 거리 계산
-                    center_x = density_map[quadrant][grid_key]['center_x']
-                    center_y = density_map[quadrant][grid_key]['center_y']
-                    distance_to_center = np.sqrt(
-                        (center_x - quadrant_center_x)**2 + 
-                        (center_y - quadrant_center_y)**2
-                    )
-                    density_map[quadrant][grid_key]['distance_to_center'] = distance_to_center
-        
-        # 각 구역에서 가장 적절한 위치 선정 
+        """구역마다 노드가 많고 구역 중심에 가까운 격자 칸을 골라 {구역 이름: (x, y, 노드 수)} 반환
+
+        칸의 점수는 노드 수 / (칸 중심과 구역 중심 사이 거리 + 1)이며, 점수가 같으면
+        먼저 배치된 노드가 있는 칸을 고른다. 노드가 없는 구역은 결과에서 빠진다.
+        """
+        counts, cell_of_node, _, _ = self.density_grid()
+        regions_x, regions_y = self.regions
+        x_bounds, y_bounds, cells_x, cells_y = self._region_bounds()
+        num_regions = regions_x * regions_y
+
+        # 구역별 원점과 중심 (구역 번호 순서)
+        region = np.arange(num_regions)
+        region_x = region % regions_x
+        region_y = regions_y - 1 - region // regions_x
+        origin_x = x_bounds[region_x]
+        origin_y = y_bounds[region_y]
+        center_x = (origin_x + x_bounds[region_x + 1]) / 2
+        center_y = (origin_y + y_bounds[region_y + 1]) / 2
+
+        # 칸 중심 좌표와 점수 (구역 x 칸 x 칸)
+        cell_x = origin_x[:, None, None] + (np.arange(cells_x)[None, :, None] + 0.5) * self.grid_size
+        cell_y = origin_y[:, None, None] + (np.arange(cells_y)[None, None, :] + 0.5) * self.grid_size
+        cell_x, cell_y = np.broadcast_arrays(cell_x, cell_y)
+        distance_to_center = np.sqrt((cell_x - center_x[:, None, None])**2 +
+                                     (cell_y - center_y[:, None, None])**2)
+        counts = counts.reshape(num_regions, -1)
+        score = np.where(counts > 0, counts / (distance_to_center.reshape(num_regions, -1) + 1), -np.inf)
+
+        # 칸마다 처음 나타난 노드의 행 번호 (동점일 때 먼저 배치된 노드의 칸 선택)
+        num_nodes = len(cell_of_node)
+        inside = cell_of_node >= 0
+        first_row = np.full(counts.size, num_nodes, dtype=np.int64)
+        np.minimum.at(first_row, cell_of_node[inside], np.flatnonzero(inside))
+        first_row = first_row.reshape(num_regions, -1)
+
+        best_score = score.max(axis=1)
+        tied = (score == best_score[:, None]) & (counts > 0)
+        best_cell = np.where(tied, first_row, num_nodes + 1).argmin(axis=1)
+
+        cell_x = cell_x.reshape(num_regions, -1)
+        cell_y = cell_y.reshape(num_regions, -1)
         best_locations = {}
-        for quadrant in quadrants:
-            if density_map[quadrant]:
-                # 노드 수가 많고 중심에 가까운 그리드 선택
-                grids = sorted(
-                    density_map[quadrant].items(),
-                    key=lambda x: (len(x[1]['nodes']) / (x[1]['distance_to_center'] + 1)),
-                    reverse=True
-                )
-                if grids:
-                    best_locations[quadrant] = (grids[0][1]['center_x'], 
-                                            grids[0][1]['center_y'], 
-                                            len(grids[0][1]['nodes']))
-        
+        for r in np.flatnonzero(counts.sum(axis=1) > 0):
+            cell = best_cell[r]
+            best_locations[f"Q{r + 1}"] = (float(cell_x[r, cell]), float(cell_y[r, cell]),
+                                          int(counts[r, cell]))
         return best_locations
 
+    def dense_candidates(self, num_candidates):
+        """노드 수가 많은 칸부터 normal 노드를 모아 num_candidates개 이상이 될 때까지의 후보 노드 ID 배열"""
+        counts, cell_of_node, node_ids, normal = self.density_grid()
+        counts = counts.ravel()
+        num_dense = max(num_candidates, 1)
+        while True:
+            dense_cells = self.top_k(counts, num_dense)
+            dense_cells = dense_cells[counts[dense_cells] > 0]
+
+            # 밀도 순위 순서로 (같은 칸 안에서는 행 순서로) normal 노드 나열
+            rank = np.full(len(counts) + 1, len(dense_cells), dtype=np.int64)
+            rank[dense_cells] = np.arange(len(dense_cells))
+            node_rank = rank[cell_of_node]  # 필드 밖의 노드(-1)는 마지막 칸 -> 순위 밖
+            rows = np.flatnonzero((node_rank < len(dense_cells)) & normal)
+            rows = rows[np.argsort(node_rank[rows], kind='stable')]
+
+            # 후보가 충분해지는 칸까지만 사용
+            per_rank = np.bincount(node_rank[rows], minlength=len(dense_cells))
+            enough = np.flatnonzero(np.cumsum(per_rank) >= num_candidates)
+            if len(enough):
+                return node_ids[rows[:per_rank[:enough[0] + 1].sum()]]
+            if len(dense_cells) < num_dense:
+                return node_ids[rows]  # 모든 칸을 사용해도 부족
+            num_dense *= 2
+
+    @staticmethod
+    def top_k(values, k):
+        """값이 큰 순서로 상위 k개의 인덱스 (같은 값은 앞 인덱스 우선)
+
+        전체를 정렬하지 않고 np.argpartition으로 k번째 값을 찾은 뒤 그 이상인 후보만 정렬한다.
+        """
+        values = np.asarray(values)
+        k = min(k, len(values))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        if k < len(values):
+            threshold = values[np.argpartition(values, len(values) - k)[len(values) - k]]
+            candidates = np.flatnonzero(values >= threshold)
+        else:
+            candidates = np.arange(len(values))
+        order = np.argsort(-values[candidates], kind='stable')
+        return candidates[order[:k]]
+
     def affect_nodes_in_range(self, attacker_id):
         """공격 노드 주변의 노드들이 영향을 받도록 처리"""
         attacker = self.field.nodes[attacker_id]
@@ -105,25 +191,26 @@ class Sinkhole(NetworkAttackBase):
         attacker.next_hop = "BS"
         attacker.energy_level = attacker.initial_energy
         
-        # 주변 노드들의 라우팅을 강제로 공격자 노드로 변경
-        for node_id, node in self.field.nodes.items():
-            if node_id != attacker_id and node.node_type == "normal":
-                distance = np.sqrt(
-                    (node.pos_x - attacker.pos_x)**2 + 
-                    (node.pos_y - attacker.pos_y)**2
-                )
-                
-                if distance <= self.attack_range:
-                    node.next_hop = attacker_id
-                    # 공격 범위 내의 모든 노드는 malicious node와 1-hop 거리로 설정
-                    node.hop_count = 1
-                    node.node_type = "affected"
-                    # distance_to_bs를 공격자 노드까지의 거리로 업데이트
-                    node.distance_to_bs = distance
-                    affected_nodes += 1
+        # 주변 노드들의 라우팅을 강제로 공격자 노드로 변경 (공간 인덱스 반경 질의)
+        hijacked_nodes = []
+        for node_id, distance in self.get_nodes_in_range(attacker_id, return_distance=True):
+            node = self.field.nodes[node_id]
+            if node.node_type == "normal":
+                hijacked_nodes.append(node_id)
+                node.next_hop = attacker_id
+                # 공격 범위 내의 모든 노드는 malicious node와 1-hop 거리로 설정
+                node.hop_count = 1
+                node.node_type = "affected"
+                # distance_to_bs를 공격자 노드까지의 거리로 업데이트
+                node.distance_to_bs = distance
+                affected_nodes += 1
         
         print(f"Attacker {attacker_id} affected {affected_nodes} nodes within {self.attack_range}m range")
 
+        # 탈취된 노드 아래의 서브트리만 라우팅 복구
+        if self.routing is not None and self.routing.incremental_repair:
+            self.routing.repair_routing([attacker_id] + hijacked_nodes)
+
 
     def execute_attack(self, num_attackers=1):
         if self.attack_type == "outside":
@@ -138,12 +225,11 @@ class Sinkhole(NetworkAttackBase):
         """두 개의 구역에 공격자 배치"""
         best_locations = self.calculate_node_density()
         
-        # 노드 수가 많은 순서로 구역 정렬
-        sorted_quadrants = sorted(
-            best_locations.items(),
-            key=lambda x: x[1][2],  # x[1][2]는 노드 수
-            reverse=True
-        )
+        # 노드 수가 많은 순서로 상위 구역 선택
+        names = list(best_locations)
+        node_counts = [best_locations[name][2] for name in names]
+        sorted_quadrants = [(names[i], best_locations[names[i]])
+                            for i in self.top_k(node_counts, num_attackers)]
         
         # 상위 두 구역에 공격자 배치
         for i in range(min(num_attackers, len(sorted_quadrants))):
@@ -166,22 +252,15 @@ class Sinkhole(NetworkAttackBase):
             attacker.next_hop = "BS"
             attacker.hop_count = 1  # Changed from 0 to 1 to match test expectations
             
-            self.field.nodes[attacker_id] = attacker
-            self.malicious_nodes.append(attacker_id)
+            self.field.add_node(attacker)
+            self.add_malicious_node(attacker_id)
             
             # 주변 노드들에 영향 주기
             self.affect_nodes_in_range(attacker_id)
 
     def launch_inside_attack(self, num_attackers=1):
         """내부 노드를 공격자로 변환"""
-        dense_grids = self.calculate_node_density()
-        candidate_nodes = []
-        
-        # 밀도 높은 지역의 노드들을 후보로 선정
-        for grid_pos, nodes in dense_grids:
-            candidate_nodes.extend(nodes)
-            if len(candidate_nodes) >= num_attackers * 3:  # 충분한 후보 확보
-                break
+        candidate_nodes = self.dense_candidates(num_attackers * 3)  # 충분한 후보 확보
         
         # 후보 중에서 랜덤하게 선택
         target_nodes = np.random.choice(candidate_nodes, 
@@ -197,7 +276,7 @@ class Sinkhole(NetworkAttackBase):
             node.next_hop = "BS"
             node.hop_count = 1
             # 저장할 때도 정수형으로 저장
-            self.malicious_nodes.append(int_node_id)
+            self.add_malicious_node(int_node_id)
             
             # 내부 공격자도 주변 노드에 영향 주기
             self.affect_nodes_in_range(int_node_id)
@@ -221,81 +300,35 @@ class Sinkhole(NetworkAttackBase):
         self.field.find_neighbors()
 
     def get_malicious_node_path(self, source_node):
-        """소스 노드에서 malicious 노드로의 경로를 찾는 메소드"""
+        """소스 노드에서 가장 가까운(홉 수 기준) malicious 노드를 거쳐 BS로 가는 경로
+
+        공격 상태마다 한 번 계산한 다중 출발점 BFS 트리(Field.get_malicious_paths)의
+        predecessor를 따라간다. malicious 노드는 BS와 직접 연결된다고 광고하므로 경로는 "BS"로 끝난다.
+        """
         if source_node not in self.field.nodes:
             return None
-            
-        # malicious 노드 찾기
-        malicious_nodes = [node_id for node_id, node in self.field.nodes.items() 
-                         if node.node_type in ["malicious_inside", "malicious_outside"]]
-        
-        if not malicious_nodes:
-            return None
-            
-        # 가장 가까운 malicious 노드 찾기
-        min_distance = float('inf')
-        closest_malicious = None
-        
-        for malicious_id in malicious_nodes:
-            distance = self.field.calculate_distance(source_node, malicious_id)
-            if distance < min_distance:
-                min_distance = distance
-                closest_malicious = malicious_id
-                
-        if closest_malicious is None:
+        path = self.field.get_malicious_paths().path(source_node)
+        if path is None:
             return None
-            
-        # 소스 노드에서 malicious 노드까지의 경로 찾기
-        path = self.field.find_path(source_node, closest_malicious)
-        
-        if path:
-            # malicious 노드에서 BS까지의 경로 찾기
-            bs_path = self.field.find_path(closest_malicious, "BS")
-            if bs_path:
-                # 두 경로를 합치기 (malicious 노드는 한 번만 포함)
-                return path[:-1] + bs_path
-                
-        # 경로를 찾지 못한 경우, affected 노드의 next_hop을 따라가기
-        current_node = self.field.nodes[source_node]
-        path = [source_node]
-        
-        while current_node.next_hop is not None:
-            next_hop = current_node.next_hop
-            if next_hop == "BS":
-                path.append("BS")
-                break
-                
-            if next_hop in malicious_nodes:
-                path.append(next_hop)
-                path.append("BS")
-                return path
-                
-            path.append(next_hop)
-            current_node = self.field.nodes[next_hop]
-            
-        return None
+        return path + ["BS"]
 
     def get_affected_and_neighbor_nodes(self):
-        """affected 노드와 그 이웃 노드들을 반환하는 메소드"""
-        affected_nodes = set()
-        neighbor_nodes = set()
-        
-        # affected 노드 찾기
-        for node_id, node in self.field.nodes.items():
-            if node.node_type == "affected":
-                affected_nodes.add(node_id)
-                # affected 노드의 이웃 노드들 추가
-                for neighbor_id in node.neighbors:
-                    if self.field.nodes[neighbor_id].node_type == "normal":
-                        neighbor_nodes.add(neighbor_id)
-                        
-        # affected 노드가 없는 경우, malicious 노드의 이웃 노드들을 affected로 설정
-        if not affected_nodes:
-            for node_id, node in self.field.nodes.items():
-                if node.node_type in ["malicious_inside", "malicious_outside"]:
-                    for neighbor_id in node.neighbors:
-                        if self.field.nodes[neighbor_id].node_type == "normal":
-                            self.field.nodes[neighbor_id].node_type = "affected"
-                            affected_nodes.add(neighbor_id)
-                            
-        return affected_nodes, neighbor_nodes
\ No newline at end of file
+        """affected 노드와 그 이웃 노드들을 반환하는 메소드 (노드 분류 인덱스 사용)"""
+        self._ensure_affected_nodes()
+        categories = self.field.get_categories()
+        return set(categories.members("affected")), set(categories.members("affected_neighbor"))
+
+    def _ensure_affected_nodes(self):
+        """affected 노드가 없는 경우, malicious 노드의 이웃 노드들을 affected로 설정"""
+        categories = self.field.get_categories()
+        if categories.count("affected"):
+            return
+        for node_id in list(categories.members("malicious")):
+            for neighbor_id in self.field.nodes[node_id].neighbors:
+                if self.field.nodes[neighbor_id].node_type == "normal":
+                    self.field.nodes[neighbor_id].node_type = "affected"
+
+    def sample_report_source(self):
+        """affected 노드와 그 이웃 노드 중 하나를 균등하게 선택 (없으면 None) - O(1)"""
+        self._ensure_affected_nodes()
+        return self.field.get_categories().sample("affected", "affected_neighbor")
\ No newline at end of file
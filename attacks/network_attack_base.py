@@ -1,11 +1,13 @@
 import logging
+import numpy as np
+from core.NodeStore import NodeStore, ACTIVE
 
 logger = logging.getLogger('wsn_simulation')
 
 class NetworkAttackBase:
     """네트워크 공격의 기본 클래스"""
     
-    def __init__(self, field, attack_type="outside", attack_range=200):
+    def __init__(self, field, attack_type="outside", attack_range=200, routing=None):
         """
         Initialize the network attack.
         
@@ -17,11 +19,19 @@ class NetworkAttackBase:
             Type of attack ("outside" or "inside")
         attack_range : int
             Range of attack influence in meters
+        routing : BaseRoutingProtocol, optional
+            Routing protocol to repair incrementally (when its
+            incremental_repair is enabled) after nodes are hijacked
         """
         self.field = field
         self.attack_type = attack_type
         self.attack_range = attack_range
+        self.routing = routing
         self.malicious_nodes = []
+        # 노드 ID로 색인한 가장 가까운 malicious 노드까지의 거리와 그 ID (_nearest_attackers에서 계산)
+        self.nearest_attacker_distance = None
+        self.nearest_attacker_id = None
+        self._attacker_index_key = None  # 배열을 계산한 노드 집합 (id, 노드 수)
     
     def analyze_network_statistics(self):
         """네트워크 통계 분석 및 출력"""
@@ -35,7 +45,23 @@ class NetworkAttackBase:
         nodes_with_tx = []
         nodes_with_rx = []
         
-        for node_id, node in self.field.nodes.items():
+        if isinstance(self.field.nodes, NodeStore):
+            # 열 단위 저장소: 네트워크 전체 통계를 벡터 연산으로 계산
+            store = self.field.nodes
+            node_ids = store.node_id
+            consumed = store.total_consumed_energy
+            active_nodes = int(np.count_nonzero(store.status == ACTIVE))
+            total_energy = float(consumed.sum())
+            total_tx = int(store.tx_count.sum())
+            total_rx = int(store.rx_count.sum())
+            nodes_with_energy = node_ids[consumed > 0].tolist()
+            nodes_with_tx = node_ids[store.tx_count > 0].tolist()
+            nodes_with_rx = node_ids[store.rx_count > 0].tolist()
+            node_items = []
+        else:
+            node_items = self.field.nodes.items()
+        
+        for node_id, node in node_items:
             if node.status == "active":
                 active_nodes += 1
                 
@@ -91,9 +117,63 @@ class NetworkAttackBase:
         }
     
     def add_malicious_node(self, node_id):
-        """Add a node to the list of malicious nodes"""
+        """Add a node to the list of malicious nodes
+
+        If the nearest-attacker arrays have been computed, they are updated
+        in one vectorized pass against the new attacker only.
+        """
         if node_id not in self.malicious_nodes:
             self.malicious_nodes.append(node_id)
+        if self.nearest_attacker_distance is None or node_id not in self.field.nodes:
+            return
+        if self._attacker_index_key != (id(self.field.nodes), len(self.field.nodes)):
+            self.nearest_attacker_distance = None  # 노드 집합이 바뀌어 다음 조회 때 다시 계산
+            return
+        self._update_nearest_attacker(node_id)
+
+    def _update_nearest_attacker(self, node_id):
+        """공격자 하나와 모든 노드 사이의 거리로 가장 가까운 공격자 배열 갱신"""
+        attacker = self.field.nodes[node_id]
+        distance = np.sqrt((self._xs_by_id - attacker.pos_x)**2 + (self._ys_by_id - attacker.pos_y)**2)
+        closer = distance < self.nearest_attacker_distance
+        self.nearest_attacker_distance[closer] = distance[closer]
+        self.nearest_attacker_id[closer] = node_id
+
+    def _node_positions_by_id(self):
+        """노드 ID로 색인한 (x, y) 배열 (없는 ID는 nan)"""
+        nodes = self.field.nodes
+        if isinstance(nodes, NodeStore):
+            node_ids, xs, ys = nodes.node_id, nodes.pos_x, nodes.pos_y
+        else:
+            count = len(nodes)
+            node_ids = np.fromiter(nodes.keys(), dtype=np.int64, count=count)
+            xs = np.fromiter((node.pos_x for node in nodes.values()), dtype=np.float64, count=count)
+            ys = np.fromiter((node.pos_y for node in nodes.values()), dtype=np.float64, count=count)
+        size = int(node_ids.max()) + 1 if len(node_ids) else 0
+        xs_by_id = np.full(size, np.nan)
+        ys_by_id = np.full(size, np.nan)
+        xs_by_id[node_ids] = xs
+        ys_by_id[node_ids] = ys
+        return xs_by_id, ys_by_id
+
+    def _nearest_attackers(self):
+        """노드 ID로 색인한 가장 가까운 malicious 노드까지의 거리 배열 (처음 조회할 때 계산)
+
+        필드의 모든 malicious 노드에 대해 노드 좌표 배열 전체와의 거리를 벡터 연산으로 구해
+        최솟값을 남긴다 (malicious 노드가 없거나 없는 ID이면 inf, ID는 -1).
+        이후 add_malicious_node로 추가된 공격자는 증분 갱신되며, 노드 집합이 바뀌면 다시 계산한다.
+        """
+        key = (id(self.field.nodes), len(self.field.nodes))
+        if self.nearest_attacker_distance is not None and self._attacker_index_key == key:
+            return self.nearest_attacker_distance
+
+        self._xs_by_id, self._ys_by_id = self._node_positions_by_id()
+        self._attacker_index_key = key
+        self.nearest_attacker_distance = np.full(len(self._xs_by_id), np.inf)
+        self.nearest_attacker_id = np.full(len(self._xs_by_id), -1, dtype=np.int64)
+        for attacker_id in self.field.get_categories().members("malicious"):
+            self._update_nearest_attacker(attacker_id)
+        return self.nearest_attacker_distance
     
     def is_node_in_range(self, node_id, attacker_id):
         """
@@ -118,6 +198,37 @@ class NetworkAttackBase:
                    
         return distance <= self.attack_range
     
+    def get_nodes_in_range(self, attacker_id, return_distance=False):
+        """
+        Return the nodes within the attack range of an attacker.
+        
+        Uses the field's spatial index, so the cost depends on the number of
+        nodes near the attacker rather than on the size of the field.
+        
+        Parameters:
+        -----------
+        attacker_id : int
+            ID of the attacker node
+        return_distance : bool
+            If True, return (node_id, distance) tuples
+            
+        Returns:
+        --------
+        list : IDs of nodes in range (excluding the attacker itself)
+        """
+        attacker = self.field.nodes[attacker_id]
+        in_range = self.field.query_radius(attacker.pos_x, attacker.pos_y,
+                                           self.attack_range, return_distance=True)
+        if return_distance:
+            return [(node_id, distance) for node_id, distance in in_range
+                    if node_id != attacker_id]
+        return [node_id for node_id, _ in in_range if node_id != attacker_id]
+    
+    @staticmethod
+    def _is_malicious(node):
+        """malicious 노드 여부"""
+        return node.node_type in ("malicious_inside", "malicious_outside")
+    
     def execute_attack(self):
         """
         Execute the network attack.
@@ -125,58 +236,58 @@ class NetworkAttackBase:
         """
         raise NotImplementedError("Subclasses must implement execute_attack()")
 
+    def schedule_attack(self, simulator, delay=0.0, on_executed=None, **attack_params):
+        """simulator에 공격 실행 사건 예약 (delay초 뒤 execute_attack(**attack_params) 호출)
+
+        공격이 실행되면 on_executed(malicious_nodes)를 호출한다.
+        """
+        return simulator.schedule(delay, self._on_attack, on_executed, attack_params)
+
+    def _on_attack(self, on_executed, attack_params):
+        malicious_nodes = self.execute_attack(**attack_params)
+        if on_executed is not None:
+            on_executed(malicious_nodes)
+
     def get_affected_and_neighbor_nodes(self):
-        """affected 노드와 그 이웃 노드들의 목록을 반환"""
-        affected_nodes = set()
-        neighbor_nodes = set()
-        
-        # affected 노드 찾기
-        for node_id, node in self.field.nodes.items():
-            if node.node_type == "affected":
-                affected_nodes.add(node_id)
-                # affected 노드의 이웃 노드들 추가
-                for neighbor_id in node.neighbor_nodes:
-                    if self.field.nodes[neighbor_id].node_type == "normal":
-                        neighbor_nodes.add(neighbor_id)
-        
-        return list(affected_nodes), list(neighbor_nodes)
+        """affected 노드와 그 이웃 노드들의 목록을 반환 (노드 분류 인덱스 사용)"""
+        categories = self.field.get_categories()
+        return list(categories.members("affected")), list(categories.members("affected_neighbor"))
 
     def get_malicious_node_path(self, source_node_id):
-        """소스 노드에서 가장 가까운 malicious 노드로의 경로 생성"""
+        """소스 노드에서 가장 가까운 malicious 노드로의 경로 생성
+
+        매 홉마다 방문하지 않은 이웃 중 가장 가까운 malicious 노드까지의 거리가 가장 짧은
+        이웃으로 이동한다. 거리는 _nearest_attackers 배열에서 읽으므로 홉당 비용은 이웃 수에 비례한다.
+        """
+        nodes = self.field.nodes
+        nearest_distance = self._nearest_attackers()
         path = [source_node_id]
+        visited = {source_node_id}
         current_id = source_node_id
         
         while True:
-            current_node = self.field.nodes[current_id]
+            current_node = nodes[current_id]
             # 현재 노드의 이웃 중 malicious 노드 찾기
             malicious_neighbors = [n_id for n_id in current_node.neighbor_nodes 
-                                if self.field.nodes[n_id].node_type in ["malicious_inside", "malicious_outside"]]
+                                if nodes[n_id].node_type in ["malicious_inside", "malicious_outside"]]
             
             if malicious_neighbors:
                 # malicious 노드를 찾았으면 경로에 추가하고 종료
                 path.append(malicious_neighbors[0])
                 break
             
-            # malicious 노드 방향으로 이동
-            min_distance = float('inf')
-            next_hop = None
-            
-            for neighbor_id in current_node.neighbor_nodes:
-                neighbor = self.field.nodes[neighbor_id]
-                if neighbor_id not in path:  # 순환 방지
-                    for mal_id, mal_node in self.field.nodes.items():
-                        if mal_node.node_type in ["malicious_inside", "malicious_outside"]:
-                            distance = ((neighbor.pos_x - mal_node.pos_x)**2 + 
-                                     (neighbor.pos_y - mal_node.pos_y)**2)**0.5
-                            if distance < min_distance:
-                                min_distance = distance
-                                next_hop = neighbor_id
-            
-            if next_hop is None:
+            # malicious 노드 방향으로 이동 (순환 방지: 방문한 노드 제외, 같은 거리면 앞선 이웃)
+            candidates = [n_id for n_id in current_node.neighbor_nodes if n_id not in visited]
+            if not candidates:
+                return None
+            distances = nearest_distance[candidates]
+            best = int(np.argmin(distances))
+            if not np.isfinite(distances[best]):
                 # malicious 노드로 가는 경로를 찾지 못함
                 return None
             
-            path.append(next_hop)
-            current_id = next_hop
+            current_id = candidates[best]
+            path.append(current_id)
+            visited.add(current_id)
         
-        return path 
\ No newline at end of file
+        return path 
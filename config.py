@@ -7,9 +7,13 @@ RANDOM_SEED = 42          # 랜덤 시드
 FIELD_SIZE = 2000         # 필드 크기 (m)
 NUM_NODES = 1000          # 센서 노드 수
 BS_POSITION = (1000, 1000)  # 베이스 스테이션 위치 (x, y)
+DEPLOYMENT_TYPE = "uniform"  # 노드 배치 분포 ("uniform", "grid", "poisson_disk", "cluster", "corridor")
+DEPLOYMENT_PARAMS = {}    # 배치 분포별 추가 파라미터 (예: {"num_clusters": 5})
 
 # Routing Parameters
 ROUTING_PROTOCOL = "dijkstra"  # 라우팅 프로토콜 타입 ("dijkstra", "LEACH")
+ROUTING_LINK_COST = "hop"  # 링크 비용 ("hop", "distance_squared", "residual_energy", "tx_energy")
+ROUTING_INCREMENTAL_REPAIR = False  # True이면 노드 탈취/에너지 고갈 때 영향받은 서브트리만 라우팅 복구
 
 # Attack Parameters
 ATTACK_TYPE = "outside"   # 공격 타입 ("outside" or "inside")
@@ -17,12 +21,45 @@ NUM_ATTACKERS = 1         # 공격자 수
 ATTACK_PROBABILITY = 50   # 각 보고서마다 공격이 발생할 확률 (0 ~ 100)
 ATTACK_TIMING = "0"      # 공격 시점 (보고서 발생 기준 "0", "30", "50", "70", "90")
 ATTACK_RANGE = 150        # 공격 영향 범위 (m)
+ATTACK_REGIONS = (2, 2)   # 공격자 배치 구역 수 (x, y) - 구역마다 밀도가 높은 격자 칸을 후보로 선정
+ATTACK_GRID_SIZE = 100    # 밀도 계산 격자 칸 크기 (m)
 
 # Report Parameters
 NUM_REPORTS = 100         # 생성할 보고서 수
+REPORT_INTERVAL = 1.0     # 보고서 발생 간격 (s, 시뮬레이션 시간)
+
+# Time-Series Recorder Parameters (보고서 진행에 따른 네트워크 상태와 수명 지표)
+RECORD_STRIDE = 1         # 표본 간격 (보고서 수, 0이면 기록 안 함)
+RECORD_CAPACITY = 10000   # 링 버퍼 크기 (가장 최근 표본 수)
+RECORD_QUANTILES = (0.1, 0.5, 0.9)  # 기록할 잔여 에너지 분위수
+RECORD_QUANTILE_SAMPLE = 256  # 분위수 계산에 쓸 최대 노드 수 (넘으면 일정 간격으로 골라 추정)
+LIFETIME_DEAD_FRACTIONS = (0.1, 0.5)  # 수명 지표로 기록할 비활성 노드 비율
+
+# Profiling Parameters (단계별 시간 측정과 프로파일러, utils/Instrumentation.py)
+PROFILE = False           # True이면 실행 단계와 주요 함수의 호출 수/시간을 재서 JSON 보고서로 저장
+PROFILE_MODE = None       # 추가 프로파일러 (None, "cprofile": 모든 함수, "sampling": 호출 스택 표본)
+PROFILE_SAMPLE_INTERVAL = 0.005  # 표본 프로파일러의 표본 간격 (s)
+PROFILE_REPORT_FILE = 'performance_report.json'  # results 폴더에 저장되는 성능 보고서
+
+# Sweep Parameters (sweep.py)
+SWEEP_GRID = {            # 파라미터별 값 리스트 - 모든 조합을 실행
+    "ATTACK_RANGE": [100, 150, 200],
+    "NUM_ATTACKERS": [1, 2],
+    "RANDOM_SEED": [42, 43, 44],
+}
+SWEEP_WORKERS = None      # 워커 프로세스 수 (None이면 CPU 코어 수)
+SWEEP_RESULTS_FILE = 'sweep_results.csv'  # results 폴더에 저장되는 스윕 결과 표
+
+# Topology Cache Parameters (배치 + 이웃 + 라우팅 결과를 재사용)
+TOPOLOGY_CACHE_DIR = None  # results 폴더 안의 캐시 폴더 이름 (None이면 캐시 사용 안 함)
+TOPOLOGY_CACHE_MAX_MB = 256  # 캐시 최대 크기 (MB), 넘으면 오래 쓰지 않은 항목부터 삭제
 
 # Save Parameters
 SAVE_FILE_NAME = 'final_nodes_state.csv'  # 결과 저장 파일명
+RESULT_FORMAT = "csv"     # 결과 파일 형식 ("csv" 또는 "columnar": .npz 열 배열, utils.data_handler.columnar_to_csv로 CSV 변환)
+STREAM_RESULTS = False     # True이면 보고서를 모으지 않고 백그라운드 스레드로 파일에 흘려 씀 (메모리 일정)
+STREAM_CHUNK_SIZE = 1000  # 스트리밍 기록 묶음 크기 (보고서 수)
+STREAM_MAX_PENDING_CHUNKS = 4  # 기록 대기 큐에 쌓일 수 있는 최대 묶음 수
 
 # Animation Parameters
 ENABLE_ANIMATION = False    # 애니메이션 활성화 여부
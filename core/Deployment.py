@@ -0,0 +1,187 @@
+"""노드 배치 분포별 좌표 생성 함수
+
+모든 함수는 np.random 전역 상태만 사용하므로 RANDOM_SEED가 같으면 같은 배치가
+만들어지며, (num_nodes, 2) 크기의 (x, y) 좌표 배열을 반환한다.
+"""
+import numpy as np
+
+
+def uniform_positions(num_nodes: int, width: float, height: float) -> np.ndarray:
+    """필드 전체에 균등 분포로 배치
+
+    한 번의 호출로 (x, y)를 번갈아 뽑으므로 노드마다 uniform을 두 번
+    호출하던 기존 배치와 같은 좌표가 생성된다.
+    """
+    return np.random.uniform(0, [width, height], size=(num_nodes, 2))
+
+
+def grid_positions(num_nodes: int, width: float, height: float, jitter: float = 0.5) -> np.ndarray:
+    """격자 셀 중심에 배치한 뒤 셀 크기 비율(jitter)만큼 무작위로 흔듦
+
+    셀 수가 노드 수보다 많으면 사용할 셀을 무작위로 고른다.
+    jitter=0이면 정확한 격자, 1이면 셀 전체 범위에서 흔든다.
+    """
+    if not 0 <= jitter <= 1:
+        raise ValueError("jitter는 0 이상 1 이하여야 합니다")
+    if num_nodes == 0:
+        return np.empty((0, 2))
+
+    cols = max(int(np.ceil(np.sqrt(num_nodes * width / height))), 1)
+    rows = int(np.ceil(num_nodes / cols))
+    cell_w = width / cols
+    cell_h = height / rows
+
+    cells = np.random.permutation(rows * cols)[:num_nodes]
+    cells.sort()
+    positions = np.empty((num_nodes, 2))
+    positions[:, 0] = (cells % cols + 0.5) * cell_w
+    positions[:, 1] = (cells // cols + 0.5) * cell_h
+    positions += np.random.uniform(-0.5, 0.5, size=(num_nodes, 2)) * jitter * [cell_w, cell_h]
+    return positions
+
+
+def poisson_disk_positions(num_nodes: int, width: float, height: float,
+                           min_distance: float = None, max_batches: int = 1000) -> np.ndarray:
+    """모든 노드 쌍이 min_distance 이상 떨어지도록 배치 (Poisson-disk)
+
+    후보 좌표를 묶음 단위로 뽑고, 셀 크기 min_distance/√2 격자(셀당 최대 1개)에서
+    주변 5x5 셀만 비교하여 기존 노드 및 같은 묶음의 앞선 후보와 너무 가까운 후보를
+    버린다. min_distance를 주지 않으면 노드 밀도로부터 충분히 채울 수 있는 값을 정한다.
+    """
+    if num_nodes == 0:
+        return np.empty((0, 2))
+    if min_distance is None:
+        min_distance = 0.5 * np.sqrt(width * height / num_nodes)
+    if min_distance <= 0:
+        raise ValueError("min_distance는 0보다 커야 합니다")
+
+    cell_size = min_distance / np.sqrt(2)
+    grid_h = int(np.ceil(height / cell_size)) + 5  # 2셀 테두리 포함
+    grid_w = int(np.ceil(width / cell_size)) + 5
+    grid = np.full(grid_w * grid_h, -1, dtype=np.int64)  # 1차원 셀 번호 -> 노드 번호
+    batch_grid = np.zeros(grid_w * grid_h, dtype=np.int64)
+    offsets = [dx * grid_h + dy for dx in range(-2, 3) for dy in range(-2, 3) if (dx, dy) != (0, 0)]
+    min_distance_sq = min_distance ** 2
+
+    positions = np.empty((num_nodes, 2))
+    count = 0
+    for _ in range(max_batches):
+        needed = num_nodes - count
+        candidates = np.random.uniform(0, [width, height], size=(max(2 * needed, 64), 2))
+        cells = ((candidates[:, 0] / cell_size).astype(np.int64) + 2) * grid_h + \
+                (candidates[:, 1] / cell_size).astype(np.int64) + 2
+
+        # 빈 셀에 떨어진 후보 중 셀마다 첫 번째 후보만 유지
+        free = np.flatnonzero(grid[cells] < 0)
+        _, first = np.unique(cells[free], return_index=True)
+        keep = np.sort(free[first])
+        candidates, cells = candidates[keep], cells[keep]
+
+        # 같은 묶음의 후보를 임시 격자에 기록 (후보 번호 + 1, 0은 비어 있음)
+        order = np.arange(1, len(keep) + 1)
+        batch_grid[cells] = order
+
+        valid = np.ones(len(keep), dtype=bool)
+        for offset in offsets:
+            check = np.flatnonzero(valid)
+            neighbor_cells = cells[check] + offset
+
+            placed = grid[neighbor_cells]
+            close = placed >= 0
+            if close.any():
+                diff = positions[placed[close]] - candidates[check[close]]
+                valid[check[close][(diff ** 2).sum(axis=1) < min_distance_sq]] = False
+
+            earlier = batch_grid[neighbor_cells]
+            close = (earlier > 0) & (earlier < order[check])
+            if close.any():
+                diff = candidates[earlier[close] - 1] - candidates[check[close]]
+                valid[check[close][(diff ** 2).sum(axis=1) < min_distance_sq]] = False
+        batch_grid[cells] = 0
+
+        accepted = np.flatnonzero(valid)[:needed]
+        positions[count:count + len(accepted)] = candidates[accepted]
+        grid[cells[accepted]] = np.arange(count, count + len(accepted))
+        count += len(accepted)
+        if count == num_nodes:
+            return positions
+
+    raise ValueError(f"min_distance={min_distance}로는 {num_nodes}개 노드를 배치할 수 없습니다 "
+                     f"({count}개 배치됨)")
+
+
+def cluster_positions(num_nodes: int, width: float, height: float, centers=None,
+                      num_clusters: int = 5, std: float = None, weights=None) -> np.ndarray:
+    """핫스팟(centers) 주변에 가우시안 분포로 배치
+
+    centers를 주지 않으면 num_clusters개의 중심을 필드에서 균등하게 뽑는다.
+    weights는 클러스터별 노드 비율이며, 필드 밖으로 나간 좌표는 다시 뽑는다.
+    """
+    if centers is None:
+        centers = np.random.uniform(0, [width, height], size=(num_clusters, 2))
+    centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+    if std is None:
+        std = 0.05 * min(width, height)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)
+        weights = weights / weights.sum()
+
+    labels = np.random.choice(len(centers), size=num_nodes, p=weights)
+    positions = centers[labels] + np.random.normal(0, std, size=(num_nodes, 2))
+
+    outside = np.flatnonzero((positions < 0).any(axis=1) |
+                             (positions[:, 0] > width) | (positions[:, 1] > height))
+    for _ in range(100):
+        if len(outside) == 0:
+            break
+        redrawn = centers[labels[outside]] + np.random.normal(0, std, size=(len(outside), 2))
+        positions[outside] = redrawn
+        still = (redrawn < 0).any(axis=1) | (redrawn[:, 0] > width) | (redrawn[:, 1] > height)
+        outside = outside[still]
+    np.clip(positions, 0, [width, height], out=positions)
+    return positions
+
+
+def corridor_positions(num_nodes: int, width: float, height: float, corridor_width: float = None,
+                       orientation: str = "horizontal", center: float = None) -> np.ndarray:
+    """필드를 가로지르는 띠(corridor) 안에 균등 분포로 배치
+
+    orientation이 "horizontal"이면 y = center 주변, "vertical"이면 x = center 주변에
+    폭 corridor_width의 띠를 만든다 (기본: 필드 중앙, 필드 폭의 10%).
+    """
+    if orientation == "horizontal":
+        length, span = width, height
+    elif orientation == "vertical":
+        length, span = height, width
+    else:
+        raise ValueError(f"알 수 없는 orientation: {orientation}")
+    if corridor_width is None:
+        corridor_width = 0.1 * span
+    if center is None:
+        center = span / 2
+    low = max(center - corridor_width / 2, 0)
+    high = min(center + corridor_width / 2, span)
+
+    positions = np.random.uniform([0, low], [length, high], size=(num_nodes, 2))
+    if orientation == "vertical":
+        positions = positions[:, ::-1].copy()
+    return positions
+
+
+DISTRIBUTIONS = {
+    "uniform": uniform_positions,
+    "grid": grid_positions,
+    "poisson_disk": poisson_disk_positions,
+    "cluster": cluster_positions,
+    "corridor": corridor_positions,
+}
+
+
+def generate_positions(distribution: str, num_nodes: int, width: float, height: float,
+                       **params) -> np.ndarray:
+    """분포 이름으로 (num_nodes, 2) 좌표 배열 생성"""
+    generator = DISTRIBUTIONS.get(distribution.lower())
+    if generator is None:
+        raise ValueError(f"알 수 없는 배치 분포: {distribution} "
+                         f"(사용 가능: {', '.join(DISTRIBUTIONS)})")
+    return generator(num_nodes, width, height, **params)
@@ -1,43 +1,193 @@
+import sys
+from collections import OrderedDict, deque
 import numpy as np
 from core.nodes.MicazMotes import MicazMotes
+from core.NodeStore import NodeStore, ACTIVE, NEXT_HOP_NONE
+from core.SpatialGrid import SpatialGrid
+from core.NodeCategories import NodeCategories
+from core.MaliciousPathTree import MaliciousPathTree
+from core.NetworkStatistics import NetworkStatistics
+from core.Deployment import generate_positions
 
 class Field:
+    PATH_CACHE_SIZE = 1024  # find_path 결과 LRU 캐시 항목 수
+
     def __init__(self, width: float, height: float):
         self.width = width
         self.height = height
-        self.nodes = {}
+        self.nodes = NodeStore()  # node_id -> MicazMotes (열 단위 저장소)
         self.base_station = None
+        self.spatial_grid = None  # 반경/최근접 질의용 공간 인덱스
+        self._indexed_nodes = None  # spatial_grid가 색인한 노드 딕셔너리
+        self._categories = None  # 노드 분류 인덱스 (get_categories에서 생성)
+        self._malicious_paths = None  # 공격자 방향 BFS 트리 (get_malicious_paths에서 생성)
+        self._statistics = None  # 실시간 네트워크 통계 (get_statistics에서 생성)
+        self._path_cache = OrderedDict()  # (출발, 도착, 양방향 여부) -> 경로 튜플 (최근 사용 순)
+        self._path_graph_key = None  # 경로 탐색 자료가 만들어진 노드 집합 (id, 노드 수)
+        self._bs_links = None  # BS와 직접 통신 가능한 노드 ID 집합 (가상 BS 정점의 이웃)
+        self._reverse_links = None  # node_id -> 그 노드를 이웃으로 둔 노드 ID 리스트 (양방향 탐색용)
+
+    def deploy_nodes(self, num_nodes: int, distribution: str = "uniform", **params):
+        """노드 배치 (기본: 균등 분포)
+
+        distribution은 "uniform", "grid", "poisson_disk", "cluster", "corridor" 중
+        하나이며, params는 core.Deployment의 해당 분포 함수에 전달된다.
+        모든 좌표를 한 번에 생성하고 노드 저장소도 한 번에 채운다.
+        """
+        positions = generate_positions(distribution, num_nodes, self.width, self.height, **params)
+        node_ids = np.arange(1, num_nodes + 1)
+        # 같은 ID가 새 위치로 다시 배치되므로 노드 수로는 알 수 없음 - 공간 인덱스 폐기
+        self.spatial_grid = None
+        self._indexed_nodes = None
+
+        if not isinstance(self.nodes, NodeStore):
+            for node_id, (x, y) in zip(node_ids.tolist(), positions.tolist()):
+                self.nodes[node_id] = MicazMotes(node_id, x, y)
+            self.invalidate_topology()
+            return
+
+        # 같은 ID의 기존 노드는 새 노드로 교체
+        self.nodes.delete_many(node_ids[self.nodes.rows_of(node_ids) >= 0])
+        MicazMotes.create_many(node_ids, positions[:, 0], positions[:, 1], self.nodes)
+        self.invalidate_topology()
+
+    def set_base_station(self, x: float, y: float, comm_range: float = None,
+                         energy_threshold: float = 0.0):
+        """베이스 스테이션 설정
 
-    def deploy_nodes(self, num_nodes: int):
-        """균등 분포로 노드 배치"""
-        for node_id in range(1, num_nodes + 1):
-            x = np.random.uniform(0, self.width)
-            y = np.random.uniform(0, self.height)
-            new_node = MicazMotes(node_id, x, y)
-            self.nodes[node_id] = new_node
-
-    def set_base_station(self, x: float, y: float):
-        """베이스 스테이션 설정"""
-        self.base_station = {"x": x, "y": y}
+        comm_range는 BS와 직접 통신 가능한 거리(None이면 각 노드의 comm_range)이고,
+        energy_threshold는 중계 노드가 가져야 하는 최소 잔여 에너지(초과)이다.
+        """
+        self.base_station = {"x": x, "y": y, "comm_range": comm_range,
+                             "energy_threshold": energy_threshold}
+        self.invalidate_topology()
+        if isinstance(self.nodes, NodeStore):
+            # 모든 노드의 거리를 한 번의 벡터 연산으로 계산
+            store = self.nodes
+            store.distance_to_bs[:] = np.sqrt((store.pos_x - x)**2 + (store.pos_y - y)**2)
+            return
         for node in self.nodes.values():
             node.calculate_distance_to_bs(x, y)
 
     def find_neighbors(self):
-        """각 노드의 이웃 노드 찾기"""
-        for node_id, node in self.nodes.items():
-            for other_id, other_node in self.nodes.items():
-                if node_id != other_id:
-                    distance = np.sqrt(
-                        (node.pos_x - other_node.pos_x)**2 + 
-                        (node.pos_y - other_node.pos_y)**2
-                    )
-                    if distance <= node.comm_range:
-                        node.add_neighbor(other_id)
+        """각 노드의 이웃 노드 찾기 (균일 격자 공간 해시 기반)"""
+        if not self.nodes:
+            return
+
+        node_ids = list(self.nodes.keys())
+        nodes = list(self.nodes.values())
+        num_nodes = len(nodes)
+        xs, ys, ranges = self._node_columns(node_ids)
+
+        # 셀 크기 = 최대 통신 범위 → 인접 3x3 셀만 비교하면 충분
+        self.spatial_grid = SpatialGrid(max(ranges.max(), 1e-9))
+        self.spatial_grid.build(node_ids, xs, ys)
+        self._indexed_nodes = self.nodes
+        src, dst = SpatialGrid.neighbor_pairs(xs, ys, ranges, self.spatial_grid.cell_size)
+
+        # 노드별 이웃 구간 (dst는 self.nodes 삽입 순서와 같은 행 순서로 정렬됨)
+        bounds = np.searchsorted(src, np.arange(num_nodes + 1)).tolist()
+        neighbor_ids = np.asarray(node_ids, dtype=object)[dst].tolist()
+
+        for row, node in enumerate(nodes):
+            found = neighbor_ids[bounds[row]:bounds[row + 1]]
+            if not found:
+                continue
+            if not node.neighbor_nodes:
+                node.neighbor_nodes.extend(found)
+            else:
+                for other_id in found:
+                    node.add_neighbor(other_id)
+
+        if self._categories is not None:
+            self._categories.rebuild()  # affected_neighbor는 이웃 리스트 기준
+        if self._malicious_paths is not None:
+            self._malicious_paths.rebuild()
+        self.invalidate_topology()
+
+    def add_node(self, node):
+        """노드를 필드에 추가하고 공간 인덱스에도 반영"""
+        self.nodes[node.node_id] = node
+        if self.spatial_grid is not None and self._indexed_nodes is self.nodes:
+            self.spatial_grid.insert(node.node_id, node.pos_x, node.pos_y)
+        self.invalidate_topology()
+        return node
+
+    def _node_columns(self, node_ids):
+        """node_ids 순서의 (x 좌표, y 좌표, 통신 범위) 배열 (NodeStore이면 열 배열에서 바로 읽음)"""
+        if isinstance(self.nodes, NodeStore):
+            store = self.nodes
+            # 삭제가 있었으면 행 순서가 삽입 순서와 다를 수 있으므로 node_ids 순서로 모음
+            rows = store.rows_of(np.asarray(node_ids, dtype=np.int64))
+            return store.pos_x[rows], store.pos_y[rows], store.comm_range[rows]
+        nodes = [self.nodes[node_id] for node_id in node_ids]
+        count = len(nodes)
+        return (np.fromiter((node.pos_x for node in nodes), dtype=float, count=count),
+                np.fromiter((node.pos_y for node in nodes), dtype=float, count=count),
+                np.fromiter((node.comm_range for node in nodes), dtype=float, count=count))
+
+    def get_spatial_index(self) -> SpatialGrid:
+        """현재 노드 집합과 일치하는 공간 인덱스 반환 (필요 시 구성/동기화)"""
+        grid = self.spatial_grid
+        if grid is None or self._indexed_nodes is not self.nodes:
+            node_ids = list(self.nodes.keys())
+            xs, ys, ranges = self._node_columns(node_ids)
+            grid = SpatialGrid(ranges.max() if len(ranges) else 100)
+            grid.build(node_ids, xs, ys)
+            self.spatial_grid = grid
+            self._indexed_nodes = self.nodes
+        elif len(grid) != len(self.nodes):
+            # add_node를 거치지 않고 self.nodes에 직접 추가/삭제된 노드 반영
+            for node_id in [node_id for node_id in grid.positions if node_id not in self.nodes]:
+                grid.remove(node_id)
+            for node_id, node in self.nodes.items():
+                if node_id not in grid:
+                    grid.insert(node_id, node.pos_x, node.pos_y)
+        return grid
+
+    def get_categories(self) -> NodeCategories:
+        """노드 분류 인덱스 (normal/affected/malicious/inactive/routable/affected_neighbor)"""
+        if self._categories is None:
+            self._categories = NodeCategories(self)
+        return self._categories
+
+    def get_malicious_paths(self) -> MaliciousPathTree:
+        """모든 malicious 노드에서 시작하는 BFS 트리 (공격자로 향하는 최단 홉 경로)"""
+        if self._malicious_paths is None:
+            self._malicious_paths = MaliciousPathTree(self)
+        return self._malicious_paths
+
+    def get_statistics(self) -> NetworkStatistics:
+        """송수신과 상태 변경에 맞춰 누적되는 네트워크 통계 (snapshot()이 O(1))"""
+        if self._statistics is None:
+            self._statistics = NetworkStatistics(self)
+        return self._statistics
+
+    def query_radius(self, x: float, y: float, radius: float, return_distance: bool = False):
+        """(x, y)에서 radius 이내에 있는 노드 ID 리스트 반환"""
+        return self.get_spatial_index().query_radius(x, y, radius, return_distance)
+
+    def nearest(self, x: float, y: float, k: int = 1, predicate=None):
+        """(x, y)에서 가장 가까운 노드 k개를 (node_id, distance) 리스트로 반환
+
+        predicate는 노드 객체를 받아 후보 여부를 반환하는 함수이다.
+        """
+        node_filter = None
+        if predicate is not None:
+            node_filter = lambda node_id: predicate(self.nodes[node_id])
+        return self.get_spatial_index().nearest(x, y, k, node_filter)
 
     def find_unconnected_nodes(self):
         """다음 홉이 없는 노드 찾기"""
         unconnected_nodes = []
-        for node_id, node in self.nodes.items():
+        if isinstance(self.nodes, NodeStore):
+            # next_hop이 없는 행만 골라 순회
+            rows = np.flatnonzero(self.nodes.next_hop == NEXT_HOP_NONE)
+            nodes = [self.nodes.view_at(row) for row in rows.tolist()]
+            candidates = [(node.node_id, node) for node in nodes]
+        else:
+            candidates = self.nodes.items()
+        for node_id, node in candidates:
             if node.next_hop is None:
                 unconnected_nodes.append({
                     'node_id': node_id,
@@ -49,7 +199,10 @@ class Field:
     def get_network_stats(self):
         """네트워크 상태 정보 반환"""
         total_nodes = len(self.nodes)
-        active_nodes = sum(1 for node in self.nodes.values() if node.status == "active")
+        if isinstance(self.nodes, NodeStore):
+            active_nodes = int(np.count_nonzero(self.nodes.status == ACTIVE))
+        else:
+            active_nodes = sum(1 for node in self.nodes.values() if node.status == "active")
         avg_neighbors = np.mean([len(node.neighbor_nodes) for node in self.nodes.values()])
         
         return {
@@ -58,34 +211,189 @@ class Field:
             "average_neighbors": avg_neighbors
         }
     
+    def memory_usage(self) -> dict:
+        """노드 저장에 사용되는 메모리(bytes) 측정
+
+        노드 상태 열, 노드 뷰 객체, ID 매핑에 드는 바이트와 이웃 리스트에 드는
+        바이트를 나누어 반환한다. MicazMotes.TARGET_BYTES_PER_NODE와 비교할 값은
+        'bytes_per_node'이다.
+        """
+        num_nodes = len(self.nodes)
+        if num_nodes == 0:
+            return {'num_nodes': 0, 'bytes_per_node': 0, 'neighbor_bytes_per_node': 0}
+
+        node_bytes = sys.getsizeof(self.nodes)  # 딕셔너리 해시 테이블
+        for node_id, node in self.nodes.items():
+            node_bytes += sys.getsizeof(node) + sys.getsizeof(node_id)
+        if isinstance(self.nodes, NodeStore):
+            store = self.nodes
+            node_bytes += sum(column.itemsize for column in store._data.values()) * store.capacity
+            node_bytes += store._row_of_id.nbytes + sys.getsizeof(store._views)
+
+        neighbor_bytes = sum(sys.getsizeof(node.neighbor_nodes) for node in self.nodes.values())
+
+        return {
+            'num_nodes': num_nodes,
+            'bytes_per_node': node_bytes / num_nodes,
+            'neighbor_bytes_per_node': neighbor_bytes / num_nodes
+        }
+
     def create_node(self, node_id: int, pos_x: float, pos_y: float):
         """새로운 센서 노드 생성"""
-        from nodes.MicazMotes import MicazMotes
         return MicazMotes(node_id, pos_x, pos_y)
 
-    def find_path(self, source_id, target_id):
-        """두 노드 사이의 최단 경로를 찾는 메소드"""
+    def invalidate_topology(self):
+        """이웃 리스트, 노드 집합, BS 위치가 바뀌었음을 표시 (find_path 캐시와 탐색 자료 폐기)
+
+        find_neighbors, add_node, deploy_nodes, set_base_station이 호출하며,
+        이웃 리스트를 직접 고친 뒤에도 호출해야 한다.
+        """
+        self._path_cache.clear()
+        self._path_graph_key = None
+        self._bs_links = None
+        self._reverse_links = None
+
+    def _sync_path_graph(self):
+        """노드 집합이 (add_node를 거치지 않고) 바뀌었으면 탐색 자료 폐기"""
+        key = (id(self.nodes), len(self.nodes))
+        if self._path_graph_key != key:
+            self.invalidate_topology()
+            self._path_graph_key = key
+
+    def _get_bs_links(self) -> set:
+        """BS와 직접 통신 가능한 노드 ID 집합 (BS comm_range, None이면 각 노드의 comm_range 이내)"""
+        if self._bs_links is None:
+            self._bs_links = set()
+            if self.base_station is not None and self.nodes:
+                x, y = self.base_station['x'], self.base_station['y']
+                bs_range = self.base_station.get('comm_range')
+                if isinstance(self.nodes, NodeStore):
+                    store = self.nodes
+                    ranges = store.comm_range if bs_range is None else bs_range
+                    in_range = np.sqrt((store.pos_x - x)**2 + (store.pos_y - y)**2) <= ranges
+                    self._bs_links = set(store.node_id[in_range].tolist())
+                else:
+                    for node_id, node in self.nodes.items():
+                        limit = node.comm_range if bs_range is None else bs_range
+                        if ((node.pos_x - x)**2 + (node.pos_y - y)**2)**0.5 <= limit:
+                            self._bs_links.add(node_id)
+        return self._bs_links
+
+    def _get_reverse_links(self) -> dict:
+        """node_id -> 그 노드를 이웃으로 둔 노드 ID 리스트 ("BS"는 BS와 직접 통신 가능한 노드)"""
+        if self._reverse_links is None:
+            reverse_links = {node_id: [] for node_id in self.nodes}
+            for node_id, node in self.nodes.items():
+                for neighbor_id in node.neighbor_nodes:
+                    if neighbor_id in reverse_links:
+                        reverse_links[neighbor_id].append(node_id)
+            reverse_links["BS"] = list(self._get_bs_links())
+            self._reverse_links = reverse_links
+        return self._reverse_links
+
+    def _forward_links(self, node_id, bs_links):
+        """node_id에서 한 홉에 갈 수 있는 정점 (이웃 노드, BS 범위 안이면 가상 BS 정점)"""
+        if node_id == "BS":
+            return ()
+        neighbor_ids = self.nodes[node_id].neighbor_nodes
+        if node_id in bs_links:
+            return list(neighbor_ids) + ["BS"]
+        return neighbor_ids
+
+    def find_path(self, source_id, target_id, bidirectional: bool = False):
+        """두 노드 (또는 노드와 "BS") 사이의 최단 홉 경로를 찾는 메소드 (없으면 None)
+
+        이웃 리스트를 따라가는 BFS이며, BS는 BS와 직접 통신 가능한 모든 노드와 연결된
+        가상 정점이다. 큐는 deque, 경로는 부모 포인터로 복원한다. bidirectional이면 출발점과
+        도착점에서 번갈아(작은 쪽부터) 넓혀 가며 만나는 지점에서 경로를 잇는다.
+        최근 결과는 LRU 캐시(PATH_CACHE_SIZE개)에 보관하며 토폴로지가 바뀌면 비운다.
+        """
         if source_id not in self.nodes or (target_id != "BS" and target_id not in self.nodes):
             return None
-            
-        # BFS를 사용하여 최단 경로 찾기
-        queue = [(source_id, [source_id])]
-        visited = set([source_id])
-        
+        self._sync_path_graph()
+        key = (source_id, target_id, bidirectional)
+        cache = self._path_cache
+        if key in cache:
+            cache.move_to_end(key)
+            path = cache[key]
+        else:
+            if source_id == target_id:
+                path = (source_id,)
+            elif bidirectional:
+                path = self._bidirectional_search(source_id, target_id)
+            else:
+                path = self._breadth_first_search(source_id, target_id)
+            cache[key] = path
+            if len(cache) > self.PATH_CACHE_SIZE:
+                cache.popitem(last=False)
+        return list(path) if path is not None else None
+
+    @staticmethod
+    def _trace(parent, node_id) -> list:
+        """부모 포인터를 따라 node_id에서 출발점까지의 정점 리스트"""
+        path = []
+        while node_id is not None:
+            path.append(node_id)
+            node_id = parent[node_id]
+        return path
+
+    def _breadth_first_search(self, source_id, target_id):
+        """출발점에서만 넓혀 가는 BFS (부모 포인터)"""
+        nodes = self.nodes
+        bs_links = self._get_bs_links()
+        parent = {source_id: None}
+        queue = deque([source_id])
         while queue:
-            current_id, path = queue.pop(0)
-            
-            if current_id == target_id:
-                return path
-                
-            current_node = self.nodes[current_id]
-            for neighbor_id in current_node.neighbors:
-                if neighbor_id not in visited:
-                    visited.add(neighbor_id)
-                    queue.append((neighbor_id, path + [neighbor_id]))
-                    
+            current_id = queue.popleft()
+            for neighbor_id in self._forward_links(current_id, bs_links):
+                if neighbor_id in parent or (neighbor_id != "BS" and neighbor_id not in nodes):
+                    continue
+                parent[neighbor_id] = current_id
+                if neighbor_id == target_id:
+                    return tuple(reversed(self._trace(parent, neighbor_id)))
+                queue.append(neighbor_id)
         return None
 
+    def _bidirectional_search(self, source_id, target_id):
+        """출발점과 도착점에서 수준 단위로 번갈아 넓혀 가는 BFS
+
+        양쪽 깊이의 합이 지금까지 찾은 가장 짧은 경로 길이 이상이 되면 더 짧은 경로는 없다.
+        """
+        nodes = self.nodes
+        bs_links = self._get_bs_links()
+        reverse_links = self._get_reverse_links()
+        parents = ({source_id: None}, {target_id: None})  # (정방향, 역방향) 부모 포인터
+        depths = ({source_id: 0}, {target_id: 0})
+        frontiers = ([source_id], [target_id])
+        levels = [0, 0]
+        best_length, meeting = float('inf'), None
+
+        while frontiers[0] and frontiers[1] and levels[0] + levels[1] < best_length:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            parent, depth, other_depth = parents[side], depths[side], depths[1 - side]
+            next_frontier = []
+            for current_id in frontiers[side]:
+                links = (self._forward_links(current_id, bs_links) if side == 0
+                         else reverse_links.get(current_id, ()))
+                for neighbor_id in links:
+                    if neighbor_id in parent or (neighbor_id != "BS" and neighbor_id not in nodes):
+                        continue
+                    parent[neighbor_id] = current_id
+                    depth[neighbor_id] = depth[current_id] + 1
+                    next_frontier.append(neighbor_id)
+                    if neighbor_id in other_depth:
+                        length = depth[neighbor_id] + other_depth[neighbor_id]
+                        if length < best_length:
+                            best_length, meeting = length, neighbor_id
+            frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+            levels[side] += 1
+
+        if meeting is None:
+            return None
+        forward = self._trace(parents[0], meeting)
+        backward = self._trace(parents[1], meeting)
+        return tuple(reversed(forward)) + tuple(backward[1:])
+
     def calculate_distance(self, node1_id, node2_id):
         """두 노드 사이의 거리를 계산하는 메소드"""
         if node1_id not in self.nodes or node2_id not in self.nodes:
@@ -0,0 +1,176 @@
+import numpy as np
+from core.NodeStore import NodeStore
+
+
+class MaliciousPathTree:
+    """모든 malicious 노드에서 동시에 시작하는 다중 출발점 BFS 트리
+
+    노드 x가 y로 보낼 수 있는 링크(y가 x의 이웃이거나 x의 next_hop)를 거꾸로 따라가며
+    malicious 노드들로부터 한 번에 BFS를 하여, 노드마다 가장 가까운(홉 수 기준)
+    malicious 노드 쪽 다음 노드(predecessor)와 홉 수(distance)를 배열로 저장한다.
+    공격자로 향하는 경로는 predecessor를 따라가는 포인터 이동만으로 얻는다.
+
+    Field.nodes가 NodeStore이면 node_type/next_hop 변경 알림(노드 추가/삭제 포함)을 받아
+    공격자 집합이나 링크가 바뀌었을 때만 다음 조회에서 다시 계산한다.
+    이웃 리스트를 다시 만든 뒤에는 rebuild()를 호출해야 한다 (Field.find_neighbors가 호출).
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self.builds = 0  # BFS를 다시 계산한 횟수
+        self.node_ids = np.empty(0, dtype=np.int64)  # 위치 -> 노드 ID
+        self.predecessor = np.empty(0, dtype=np.int64)  # 위치 -> 공격자 쪽 다음 노드의 위치 (-1: 공격자/도달 불가)
+        self.distance = np.empty(0, dtype=np.int64)  # 위치 -> 가장 가까운 공격자까지의 홉 수 (-1: 도달 불가)
+        self._index = None  # 노드 ID -> 위치 (NodeStore가 아닐 때만 사용, NodeStore는 행 번호)
+        self._sources = set()  # BFS 출발점으로 사용한 malicious 노드 ID
+        self._stale = True
+        self._nodes = None
+        self._attach()
+
+    # ------------------------------------------------------------------
+    # 변경 추적
+    # ------------------------------------------------------------------
+    def _attach(self):
+        """현재 Field.nodes의 변경 알림을 구독하고 재계산 예약"""
+        if isinstance(self._nodes, NodeStore):
+            self._nodes.unobserve('node_type', self._on_node_type)
+            self._nodes.unobserve('next_hop', self.invalidate)
+        self._nodes = self.field.nodes
+        if isinstance(self._nodes, NodeStore):
+            self._nodes.observe('node_type', self._on_node_type)
+            self._nodes.observe('next_hop', self.invalidate)
+        self.rebuild()
+
+    def _on_node_type(self, node_id):
+        """node_type 변경 알림 - malicious 여부가 바뀐 경우에만 재계산 표시"""
+        node = self.field.nodes.get(node_id)
+        is_malicious = node is not None and node.node_type in ("malicious_inside", "malicious_outside")
+        if is_malicious != (node_id in self._sources):
+            self._stale = True
+
+    def invalidate(self, node_id):
+        """node_id의 링크(next_hop)가 바뀌었거나 노드가 추가/삭제되었음을 표시"""
+        self._stale = True
+
+    def rebuild(self):
+        """다음 조회 때 BFS 트리를 처음부터 다시 계산하도록 표시"""
+        self._stale = True
+
+    def sync(self):
+        """표시된 변경이 있으면 BFS 트리를 다시 계산"""
+        if self.field.nodes is not self._nodes:
+            self._attach()
+        elif not isinstance(self._nodes, NodeStore):
+            # 변경 알림을 받을 수 없는 저장소는 매번 다시 계산
+            self._stale = True
+        if self._stale:
+            self._build()
+            self._stale = False
+
+    # ------------------------------------------------------------------
+    # BFS
+    # ------------------------------------------------------------------
+    def _node_arrays(self):
+        """(위치별 노드 리스트, 노드 ID 배열, next_hop 노드 ID 배열 - 노드가 아니면 -1)"""
+        nodes = self.field.nodes
+        if isinstance(nodes, NodeStore):
+            self._index = None
+            views = [nodes.view_at(row) for row in range(nodes.size)]
+            return views, nodes.node_id.copy(), nodes.next_hop.copy()
+        views = list(nodes.values())
+        node_ids = np.fromiter(nodes.keys(), dtype=np.int64, count=len(views))
+        self._index = {node_id: i for i, node_id in enumerate(nodes.keys())}
+        next_hops = np.fromiter((node.next_hop if isinstance(node.next_hop, (int, np.integer))
+                                 and not isinstance(node.next_hop, bool) else -1 for node in views),
+                                dtype=np.int64, count=len(views))
+        return views, node_ids, next_hops
+
+    def _positions(self, node_ids) -> np.ndarray:
+        """노드 ID 배열을 위치 배열로 변환 (없는 ID는 -1)"""
+        if self._index is None:
+            return self.field.nodes.rows_of(node_ids)
+        index = self._index
+        return np.fromiter((index.get(node_id, -1) for node_id in np.asarray(node_ids).tolist()),
+                           dtype=np.int64, count=len(node_ids))
+
+    def _build(self):
+        """malicious 노드들에서 링크를 거꾸로 따라가는 수준별(level-synchronous) BFS"""
+        views, node_ids, next_hops = self._node_arrays()
+        num_nodes = len(views)
+
+        # 전달 링크 (sender -> receiver): 이웃 리스트 + next_hop
+        counts = np.fromiter((len(node.neighbor_nodes) for node in views), dtype=np.int64, count=num_nodes)
+        neighbor_ids = np.fromiter((neighbor_id for node in views for neighbor_id in node.neighbor_nodes),
+                                   dtype=np.int64, count=int(counts.sum()))
+        senders = np.concatenate([np.repeat(np.arange(num_nodes), counts), np.arange(num_nodes)])
+        receivers = self._positions(np.concatenate([neighbor_ids, next_hops]))
+        linked = receivers >= 0
+        senders, receivers = senders[linked], receivers[linked]
+
+        # receiver 기준 CSR (receiver에서 BFS를 넓힐 때 sender들을 한 번에 모음)
+        order = np.argsort(receivers, kind='stable')
+        senders = senders[order]
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(receivers, minlength=num_nodes), out=offsets[1:])
+
+        predecessor = np.full(num_nodes, -1, dtype=np.int64)
+        distance = np.full(num_nodes, -1, dtype=np.int64)
+        malicious = self.field.get_categories().members("malicious")
+        self._sources = set(malicious)
+        sources = self._positions(malicious)
+        frontier = sources[sources >= 0]
+        distance[frontier] = 0
+        level = 0
+        while len(frontier):
+            starts = offsets[frontier]
+            lengths = offsets[frontier + 1] - starts
+            total = int(lengths.sum())
+            if total == 0:
+                break
+            gather = np.arange(total) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+            candidates = senders[gather]
+            via = np.repeat(frontier, lengths)
+            new = distance[candidates] < 0
+            # 같은 노드가 여러 번 나오면 처음 만난 링크 사용
+            frontier, first = np.unique(candidates[new], return_index=True)
+            level += 1
+            distance[frontier] = level
+            predecessor[frontier] = via[new][first]
+
+        self.node_ids = node_ids
+        self.predecessor = predecessor
+        self.distance = distance
+        self._node_id_list = node_ids.tolist()
+        self._predecessor_list = predecessor.tolist()
+        self.builds += 1
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _position(self, node_id) -> int:
+        if self._index is None:
+            return self.field.nodes.row_of(node_id) if isinstance(node_id, (int, np.integer)) else -1
+        return self._index.get(node_id, -1)
+
+    def hops(self, node_id):
+        """node_id에서 가장 가까운 malicious 노드까지의 홉 수 (도달 불가면 None)"""
+        self.sync()
+        position = self._position(node_id)
+        if position < 0 or self.distance[position] < 0:
+            return None
+        return int(self.distance[position])
+
+    def path(self, node_id):
+        """node_id에서 가장 가까운 malicious 노드까지의 노드 ID 경로 (도달 불가면 None)"""
+        self.sync()
+        position = self._position(node_id)
+        if position < 0 or self.distance[position] < 0:
+            return None
+        node_ids = self._node_id_list
+        predecessor = self._predecessor_list
+        path = [node_ids[position]]
+        position = predecessor[position]
+        while position >= 0:
+            path.append(node_ids[position])
+            position = predecessor[position]
+        return path
@@ -0,0 +1,201 @@
+import heapq
+import numpy as np
+from core.NodeStore import NodeStore, ACTIVE
+
+
+class NetworkStatistics:
+    """네트워크 전체 통계를 노드 상태 변경에 맞춰 누적하는 실시간 집계기
+
+    총 소비 에너지, 총 송신/수신 수, 활성 노드 수, 송신/수신/에너지 소비가 있었던 노드 수,
+    잔여 에너지 최솟값/최댓값을 유지하므로 snapshot()은 노드 수와 무관하게 O(1)(상각)이다.
+
+    갱신 경로:
+        - MicazMotes.transmit_packet/receive_packet과 ReportBatch.apply가 직접 기록
+        - status/energy_level 변경 알림 (노드 뷰를 통한 변경)
+        - 노드 추가/삭제나 열 배열을 직접 고친 경우에는 다음 조회 때 전체를 다시 계산
+          (열을 직접 고친 뒤에는 resync()를 호출해야 한다)
+    잔여 에너지 최솟값/최댓값은 지연 삭제 힙으로 유지하며, 힙이 노드 수보다 많이 커지면 다시 만든다.
+    Field.nodes가 NodeStore가 아니면 조회할 때마다 전체 노드를 훑는다.
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self.total_energy = 0.0
+        self.total_tx = 0
+        self.total_rx = 0
+        self.nodes_with_energy = 0
+        self.nodes_with_tx = 0
+        self.nodes_with_rx = 0
+        self._inactive = set()  # 비활성 노드 ID
+        self._min_heap = []  # (잔여 에너지, 노드 ID) - 지연 삭제
+        self._max_heap = []  # (-잔여 에너지, 노드 ID) - 지연 삭제
+        self._size = 0  # 집계에 반영된 노드 수
+        self._stale = True
+        self._nodes = None
+        self._attach()
+
+    # ------------------------------------------------------------------
+    # 변경 추적
+    # ------------------------------------------------------------------
+    def _attach(self):
+        """현재 Field.nodes에 집계기를 연결하고 전체 재계산 예약"""
+        if isinstance(self._nodes, NodeStore):
+            self._nodes.unobserve('status', self._on_status)
+            self._nodes.unobserve('energy_level', self._on_energy)
+            if self._nodes.statistics is self:
+                self._nodes.statistics = None
+        self._nodes = self.field.nodes
+        if isinstance(self._nodes, NodeStore):
+            self._nodes.observe('status', self._on_status)
+            self._nodes.observe('energy_level', self._on_energy)
+            self._nodes.statistics = self
+        self.resync()
+
+    def resync(self):
+        """다음 조회 때 모든 노드로 통계를 다시 계산하도록 표시"""
+        self._stale = True
+
+    def _on_status(self, node_id):
+        """status 변경 알림 (노드 추가/삭제 알림 포함)"""
+        if self._stale:
+            return
+        node = self._nodes.get(node_id)
+        if node is None or len(self._nodes) != self._size:
+            self._stale = True
+        elif node.status == "inactive":
+            self._inactive.add(node_id)
+        else:
+            self._inactive.discard(node_id)
+
+    def _on_energy(self, node_id):
+        """energy_level 변경 알림 - 새 값을 최솟값/최댓값 힙에 추가"""
+        if self._stale:
+            return
+        node = self._nodes.get(node_id)
+        if node is None or len(self._nodes) != self._size:
+            self._stale = True
+            return
+        energy = node.energy_level
+        heapq.heappush(self._min_heap, (energy, node_id))
+        heapq.heappush(self._max_heap, (-energy, node_id))
+        if len(self._min_heap) > 2 * self._size + 1024:
+            self._rebuild_heaps()
+
+    def record_packet(self, node, energy: float, is_tx: bool):
+        """노드 하나의 송신(is_tx) 또는 수신 기록 (카운터와 소비 에너지가 갱신된 뒤 호출)"""
+        if self._stale:
+            return
+        self.total_energy += energy
+        if is_tx:
+            self.total_tx += 1
+            if node.tx_count == 1:
+                self.nodes_with_tx += 1
+        else:
+            self.total_rx += 1
+            if node.rx_count == 1:
+                self.nodes_with_rx += 1
+        if energy > 0 and node.total_consumed_energy == energy:
+            self.nodes_with_energy += 1
+
+    def record_batch(self, rows, tx, rx, consumed, energy):
+        """여러 노드의 송수신을 한 번에 기록 (열 배열에 반영하기 전에 호출)
+
+        rows: 저장소 행, tx/rx: 노드별 송신/수신 수, consumed: 노드별 소비 에너지,
+        energy: 반영 후 잔여 에너지
+        """
+        if self._stale:
+            return
+        data = self._nodes._data
+        self.total_energy += float(np.sum(consumed))
+        self.total_tx += int(np.sum(tx))
+        self.total_rx += int(np.sum(rx))
+        self.nodes_with_tx += int(np.count_nonzero((data['tx_count'][rows] == 0) & (tx > 0)))
+        self.nodes_with_rx += int(np.count_nonzero((data['rx_count'][rows] == 0) & (rx > 0)))
+        self.nodes_with_energy += int(np.count_nonzero((data['total_consumed_energy'][rows] == 0) &
+                                                       (consumed > 0)))
+        node_ids = data['node_id'][rows].tolist()
+        for node_id, value in zip(node_ids, np.asarray(energy, dtype=float).tolist()):
+            heapq.heappush(self._min_heap, (value, node_id))
+            heapq.heappush(self._max_heap, (-value, node_id))
+        if len(self._min_heap) > 2 * self._size + 1024:
+            self._rebuild_heaps()
+
+    # ------------------------------------------------------------------
+    # 전체 재계산
+    # ------------------------------------------------------------------
+    def _rebuild_now(self):
+        """모든 노드의 열 배열로 통계를 다시 계산 (벡터 연산)"""
+        store = self._nodes
+        self._size = len(store)
+        consumed = store.total_consumed_energy
+        self.total_energy = float(consumed.sum())
+        self.total_tx = int(store.tx_count.sum())
+        self.total_rx = int(store.rx_count.sum())
+        self.nodes_with_energy = int(np.count_nonzero(consumed > 0))
+        self.nodes_with_tx = int(np.count_nonzero(store.tx_count > 0))
+        self.nodes_with_rx = int(np.count_nonzero(store.rx_count > 0))
+        self._inactive = set(store.node_id[store.status != ACTIVE].tolist())
+        self._rebuild_heaps()
+        self._stale = False
+
+    def _rebuild_heaps(self):
+        """현재 잔여 에너지로 최솟값/최댓값 힙을 다시 만듦"""
+        store = self._nodes
+        node_ids = store.node_id.tolist()
+        energies = store.energy_level.tolist()
+        self._min_heap = list(zip(energies, node_ids))
+        self._max_heap = [(-energy, node_id) for energy, node_id in self._min_heap]
+        heapq.heapify(self._min_heap)
+        heapq.heapify(self._max_heap)
+
+    def _heap_top(self, heap, sign: float):
+        """현재 값과 다른(지연 삭제된) 항목을 버리고 힙의 맨 위 값 반환 (노드가 없으면 None)"""
+        nodes = self._nodes
+        while heap:
+            value, node_id = heap[0]
+            node = nodes.get(node_id)
+            if node is not None and node.energy_level == sign * value:
+                return sign * value
+            heapq.heappop(heap)
+        return None
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def snapshot(self) -> dict:
+        """현재 네트워크 통계 (analyze_network_statistics의 합계 항목 + 잔여 에너지 최솟값/최댓값)"""
+        if self.field.nodes is not self._nodes:
+            self._attach()
+        if not isinstance(self._nodes, NodeStore):
+            return self._scan()
+        if self._stale or len(self._nodes) != self._size:
+            self._rebuild_now()
+        return {
+            'active_nodes': self._size - len(self._inactive),
+            'total_nodes': self._size,
+            'total_energy': self.total_energy,
+            'total_tx': self.total_tx,
+            'total_rx': self.total_rx,
+            'nodes_with_energy': self.nodes_with_energy,
+            'nodes_with_tx': self.nodes_with_tx,
+            'nodes_with_rx': self.nodes_with_rx,
+            'min_energy': self._heap_top(self._min_heap, 1.0),
+            'max_energy': self._heap_top(self._max_heap, -1.0),
+        }
+
+    def _scan(self) -> dict:
+        """변경 알림을 받을 수 없는 저장소의 통계 (전체 노드 순회)"""
+        nodes = list(self._nodes.values())
+        energies = [node.energy_level for node in nodes]
+        return {
+            'active_nodes': sum(1 for node in nodes if node.status == "active"),
+            'total_nodes': len(nodes),
+            'total_energy': float(sum(node.total_consumed_energy for node in nodes)),
+            'total_tx': sum(node.tx_count for node in nodes),
+            'total_rx': sum(node.rx_count for node in nodes),
+            'nodes_with_energy': sum(1 for node in nodes if node.total_consumed_energy > 0),
+            'nodes_with_tx': sum(1 for node in nodes if node.tx_count > 0),
+            'nodes_with_rx': sum(1 for node in nodes if node.rx_count > 0),
+            'min_energy': min(energies) if energies else None,
+            'max_energy': max(energies) if energies else None,
+        }
@@ -0,0 +1,227 @@
+import numpy as np
+from core.NodeStore import (NodeStore, NORMAL, AFFECTED, MALICIOUS_INSIDE, MALICIOUS_OUTSIDE,
+                            INACTIVE, NEXT_HOP_NONE)
+
+
+class NodeCategories:
+    """노드 분류별 ID 목록을 상태 변경에 맞춰 유지하는 인덱스
+
+    분류:
+        normal / affected / malicious  - node_type 기준 (malicious는 inside/outside 모두)
+        inactive                       - status가 "inactive"인 노드
+        routable                       - next_hop이 있는 노드 (보고서 소스 후보)
+        affected_neighbor              - affected 노드의 이웃인 normal 노드
+
+    분류마다 ID 리스트와 ID -> 위치 딕셔너리를 두어 추가/삭제(마지막 원소와 자리 바꿈)와
+    균등 표본 추출이 O(1)이다. Field.nodes가 NodeStore이면 node_type/status/next_hop 변경
+    알림을 받아 바뀐 노드만 표시해 두고 다음 조회 때 반영한다.
+    affected_neighbor는 노드가 affected가 될 때의 이웃 리스트를 기준으로 하므로,
+    이웃 리스트를 다시 만든 뒤에는 rebuild()를 호출해야 한다 (Field.find_neighbors가 호출).
+    """
+
+    CATEGORIES = ("normal", "affected", "malicious", "inactive", "routable", "affected_neighbor")
+    WATCHED_COLUMNS = ("node_type", "status", "next_hop")
+
+    def __init__(self, field):
+        self.field = field
+        self._members = {}  # 분류 -> 노드 ID 리스트
+        self._index = {}  # 분류 -> {노드 ID: 리스트 위치}
+        self._affected_counts = {}  # 노드 ID -> 이웃 중 affected 노드 수
+        self._counted_neighbors = {}  # affected 노드 ID -> 집계에 사용한 이웃 튜플
+        self._dirty = set()
+        self._stale = True  # 전체 재구성 필요 여부
+        self._nodes = None
+        self._attach()
+
+    # ------------------------------------------------------------------
+    # 변경 추적
+    # ------------------------------------------------------------------
+    def _attach(self):
+        """현재 Field.nodes의 상태 변경 알림을 구독하고 전체 재구성 예약"""
+        if isinstance(self._nodes, NodeStore):
+            for column in self.WATCHED_COLUMNS:
+                self._nodes.unobserve(column, self.invalidate)
+        self._nodes = self.field.nodes
+        if isinstance(self._nodes, NodeStore):
+            for column in self.WATCHED_COLUMNS:
+                self._nodes.observe(column, self.invalidate)
+        self.rebuild()
+
+    def invalidate(self, node_id):
+        """node_id의 상태가 바뀌었음을 표시 (다음 조회 때 반영)"""
+        self._dirty.add(node_id)
+
+    def rebuild(self):
+        """모든 노드의 분류를 처음부터 다시 계산하도록 표시"""
+        self._stale = True
+        self._dirty = set()
+
+    def sync(self):
+        """표시된 변경을 반영 - 비용은 바뀐 노드 수(affected 전환 시 이웃 수 포함)에 비례"""
+        if self.field.nodes is not self._nodes:
+            self._attach()
+        elif not isinstance(self._nodes, NodeStore):
+            # 변경 알림을 받을 수 없는 저장소는 매번 전체 재구성
+            self.rebuild()
+        if self._stale or len(self._dirty) * 2 >= len(self._nodes):
+            self._rebuild_now()
+            return
+        dirty = self._dirty
+        self._dirty = set()
+        for node_id in dirty:
+            self._update(node_id)
+
+    def _rebuild_now(self):
+        nodes = self.field.nodes
+        self._stale = True  # 집계가 끝날 때까지 affected_neighbor 개별 갱신 생략
+        self._dirty = set()
+
+        if isinstance(nodes, NodeStore):
+            node_ids = np.fromiter(nodes.keys(), dtype=np.int64, count=len(nodes))
+            rows = nodes.rows_of(node_ids)
+            node_types = nodes.node_type[rows]
+            next_hops = nodes.next_hop[rows]
+            masks = {
+                "normal": node_types == NORMAL,
+                "affected": node_types == AFFECTED,
+                "malicious": (node_types == MALICIOUS_INSIDE) | (node_types == MALICIOUS_OUTSIDE),
+                "inactive": nodes.status[rows] == INACTIVE,
+                "routable": (next_hops != NEXT_HOP_NONE) & (next_hops != 0),
+            }
+            self._members = {name: node_ids[mask].tolist() for name, mask in masks.items()}
+        else:
+            self._members = {name: [] for name in self.CATEGORIES[:-1]}
+            for node_id, node in nodes.items():
+                for name, member in self._classify(node).items():
+                    if member:
+                        self._members[name].append(node_id)
+        self._index = {name: {node_id: i for i, node_id in enumerate(members)}
+                       for name, members in self._members.items()}
+
+        # affected 노드의 이웃별 집계
+        self._affected_counts = {}
+        self._counted_neighbors = {}
+        for node_id in self._members["affected"]:
+            self._count_neighbors(node_id, 1)
+        normal = self._index["normal"]
+        self._members["affected_neighbor"] = [node_id for node_id, count in self._affected_counts.items()
+                                              if count > 0 and node_id in normal]
+        self._index["affected_neighbor"] = {node_id: i for i, node_id
+                                            in enumerate(self._members["affected_neighbor"])}
+        self._stale = False
+
+    @staticmethod
+    def _classify(node) -> dict:
+        """노드 하나의 분류 소속 여부 (affected_neighbor 제외)"""
+        node_type = node.node_type
+        return {
+            "normal": node_type == "normal",
+            "affected": node_type == "affected",
+            "malicious": node_type in ("malicious_inside", "malicious_outside"),
+            "inactive": node.status == "inactive",
+            "routable": bool(node.next_hop),
+        }
+
+    def _update(self, node_id):
+        """바뀐 노드 하나의 분류 갱신"""
+        node = self.field.nodes.get(node_id)
+        was_affected = node_id in self._index["affected"]
+        if node is None:
+            for name in self.CATEGORIES:
+                self._remove(name, node_id)
+            if was_affected:
+                self._count_neighbors(node_id, -1)
+            return
+
+        for name, member in self._classify(node).items():
+            if member:
+                self._add(name, node_id)
+            else:
+                self._remove(name, node_id)
+        is_affected = node_id in self._index["affected"]
+        if is_affected != was_affected:
+            self._count_neighbors(node_id, 1 if is_affected else -1)
+        self._update_affected_neighbor(node_id)
+
+    def _count_neighbors(self, node_id, delta: int):
+        """affected 노드의 이웃별 집계를 delta만큼 바꾸고 affected_neighbor 갱신"""
+        if delta > 0:
+            neighbors = tuple(self.field.nodes[node_id].neighbor_nodes)
+            self._counted_neighbors[node_id] = neighbors
+        else:
+            neighbors = self._counted_neighbors.pop(node_id, ())
+        counts = self._affected_counts
+        for neighbor_id in neighbors:
+            count = counts.get(neighbor_id, 0) + delta
+            if count:
+                counts[neighbor_id] = count
+            else:
+                counts.pop(neighbor_id, None)
+            if not self._stale:
+                self._update_affected_neighbor(neighbor_id)
+
+    def _update_affected_neighbor(self, node_id):
+        if node_id in self._index["normal"] and self._affected_counts.get(node_id, 0) > 0:
+            self._add("affected_neighbor", node_id)
+        else:
+            self._remove("affected_neighbor", node_id)
+
+    def _add(self, name, node_id):
+        index = self._index[name]
+        if node_id not in index:
+            index[node_id] = len(self._members[name])
+            self._members[name].append(node_id)
+
+    def _remove(self, name, node_id):
+        index = self._index[name]
+        position = index.pop(node_id, None)
+        if position is None:
+            return
+        members = self._members[name]
+        last_id = members.pop()
+        if last_id != node_id:
+            # 마지막 원소를 빈 자리로 옮김
+            members[position] = last_id
+            index[last_id] = position
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _check(self, name):
+        if name not in self.CATEGORIES:
+            raise ValueError(f"알 수 없는 노드 분류: {name} (사용 가능: {', '.join(self.CATEGORIES)})")
+
+    def members(self, name) -> list:
+        """분류에 속한 노드 ID 리스트 (내부 리스트이므로 수정하지 말 것)"""
+        self._check(name)
+        self.sync()
+        return self._members[name]
+
+    def count(self, name) -> int:
+        """분류에 속한 노드 수"""
+        return len(self.members(name))
+
+    def contains(self, name, node_id) -> bool:
+        """node_id가 분류에 속하는지 여부"""
+        self._check(name)
+        self.sync()
+        return node_id in self._index[name]
+
+    def sample(self, *names):
+        """names 분류들의 합집합에서 노드 ID 하나를 균등하게 뽑음 (비어 있으면 None)
+
+        분류가 하나이면 그 리스트에 np.random.choice를 쓴 것과 같은 난수를 소비한다.
+        분류끼리 겹치는 노드는 겹친 만큼 더 자주 뽑힌다.
+        """
+        for name in names:
+            self._check(name)
+        self.sync()
+        total = sum(len(self._members[name]) for name in names)
+        if total == 0:
+            return None
+        k = np.random.randint(0, total)
+        for name in names:
+            members = self._members[name]
+            if k < len(members):
+                return members[k]
+            k -= len(members)
@@ -0,0 +1,389 @@
+import numpy as np
+
+# node_type 정수 코드 (작은 정수 enum)
+NODE_TYPES = ("normal", "affected", "malicious_inside", "malicious_outside")
+NODE_TYPE_CODES = {name: code for code, name in enumerate(NODE_TYPES)}
+NORMAL, AFFECTED, MALICIOUS_INSIDE, MALICIOUS_OUTSIDE = range(len(NODE_TYPES))
+
+# status 정수 코드
+STATUSES = ("inactive", "active")
+STATUS_CODES = {name: code for code, name in enumerate(STATUSES)}
+INACTIVE, ACTIVE = range(len(STATUSES))
+
+# next_hop 센티널 (그 외 값은 다음 홉 노드 ID)
+NEXT_HOP_NONE = -1
+NEXT_HOP_BS = -2
+
+INF = float('inf')
+
+
+class NodeStore(dict):
+    """노드 상태를 열 단위 NumPy 배열로 보관하는 노드 저장소
+
+    딕셔너리처럼 node_id -> 노드 뷰(Sensors/MicazMotes)를 매핑하며,
+    각 노드 뷰의 상태 속성은 이 저장소의 한 행(row)을 가리킨다.
+    store.energy_level 처럼 열 이름으로 접근하면 사용 중인 행 전체의
+    배열 뷰가 반환되므로, 네트워크 전체 연산을 벡터 연산으로 작성할 수 있다.
+    """
+
+    COLUMNS = {
+        'node_id': np.int64,
+        'pos_x': np.float64,
+        'pos_y': np.float64,
+        'status': np.int8,
+        'node_type': np.int8,
+        'next_hop': np.int64,
+        'hop_count': np.float64,
+        'route_changes': np.int64,
+        'distance_to_bs': np.float64,
+        'tx_count': np.int64,
+        'rx_count': np.int64,
+        'energy_level': np.float64,
+        'consumed_energy_tx': np.float64,
+        'consumed_energy_rx': np.float64,
+        'total_consumed_energy': np.float64,
+        'comm_range': np.float64,
+        'profile': np.int16,  # HardwareProfile.registry 번호
+    }
+
+    # 새 행의 기본값 (나머지 열은 0)
+    DEFAULTS = {
+        'status': ACTIVE,
+        'node_type': NORMAL,
+        'next_hop': NEXT_HOP_NONE,
+        'hop_count': INF,
+    }
+
+    def __init__(self, capacity: int = 16):
+        super().__init__()
+        self._size = 0
+        self._data = {}
+        for name, dtype in self.COLUMNS.items():
+            self._data[name] = np.zeros(max(capacity, 1), dtype=dtype)
+        self._row_of_id = np.full(max(capacity, 1), -1, dtype=np.int64)  # node_id - _id_base -> 행
+        self._id_base = None  # _row_of_id가 시작하는 node_id (첫 ID로 정함, 크기는 ID 범위에 비례)
+        self._views = [None] * max(capacity, 1)  # 행 -> 노드 뷰
+        self._observers = {}  # 열 이름 -> 변경 알림 콜백 리스트
+        self.statistics = None  # 송수신을 기록할 NetworkStatistics (Field.get_statistics에서 연결)
+
+    def __getattr__(self, name):
+        # 열 이름으로 접근하면 사용 중인 행의 배열 뷰 반환
+        data = self.__dict__.get('_data')
+        if data is not None and name in data:
+            return data[name][:self._size]
+        raise AttributeError(f"'NodeStore' object has no attribute '{name}'")
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data['node_id'])
+
+    # ------------------------------------------------------------------
+    # 행 관리
+    # ------------------------------------------------------------------
+    def _reserve(self, capacity: int):
+        """최소 capacity 행을 담을 수 있도록 열 배열 확장"""
+        if capacity <= self.capacity:
+            return
+        new_capacity = max(capacity, self.capacity * 2)
+        for name, column in self._data.items():
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._data[name] = grown
+        self._views.extend([None] * (new_capacity - len(self._views)))
+
+    def _map_ids(self, node_ids, rows):
+        """node_id -> 행 조회 배열 갱신"""
+        node_ids = np.asarray(node_ids, dtype=np.int64)
+        if len(node_ids) == 0:
+            return
+        if node_ids.min() < 0:
+            raise ValueError("node_id는 0 이상의 정수여야 합니다")
+        min_id, max_id = int(node_ids.min()), int(node_ids.max())
+        if self._id_base is None:
+            self._id_base = min_id
+        table, base = self._row_of_id, self._id_base
+        end = base + len(table)
+        if min_id < base or max_id >= end:
+            # 필요한 쪽으로 두 배씩 확장 (ID가 아니라 ID 범위에 비례하는 크기)
+            new_base = max(min(min_id, base - len(table)), 0) if min_id < base else base
+            new_end = max(max_id + 1, end + len(table)) if max_id >= end else end
+            grown = np.full(new_end - new_base, -1, dtype=np.int64)
+            grown[base - new_base:end - new_base] = table
+            self._row_of_id, self._id_base = grown, new_base
+        self._row_of_id[node_ids - self._id_base] = rows
+
+    def allocate(self, node_id) -> int:
+        """node_id에 대한 새 행을 기본값으로 할당하고 행 번호 반환"""
+        return int(self.allocate_many([node_id])[0])
+
+    def allocate_many(self, node_ids) -> np.ndarray:
+        """여러 노드의 행을 한 번에 할당하고 행 번호 배열 반환"""
+        node_ids = np.asarray(node_ids, dtype=np.int64)
+        count = len(node_ids)
+        start = self._size
+        self._reserve(start + count)
+        rows = np.arange(start, start + count)
+        for name, column in self._data.items():
+            column[start:start + count] = self.DEFAULTS.get(name, 0)
+        self._data['node_id'][start:start + count] = node_ids
+        self._size += count
+        self._map_ids(node_ids, rows)
+        return rows
+
+    def insert_views(self, rows, nodes):
+        """allocate_many로 할당한 행에 이미 연결된 노드 뷰들을 한 번에 등록"""
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) == 0:
+            return
+        start = int(rows[0])
+        if len(rows) == rows[-1] - start + 1:
+            self._views[start:start + len(rows)] = nodes
+        else:
+            for row, node in zip(rows.tolist(), nodes):
+                self._views[row] = node
+        node_ids = self._data['node_id'][rows].tolist()
+        dict.update(self, zip(node_ids, nodes))
+        if self._observers:
+            self._notify_all(node_ids)
+
+    def rows_of(self, node_ids) -> np.ndarray:
+        """노드 ID 배열을 행 번호 배열로 변환 (없는 ID는 -1)"""
+        node_ids = np.asarray(node_ids, dtype=np.int64)
+        rows = np.full(node_ids.shape, -1, dtype=np.int64)
+        if self._id_base is None:
+            return rows
+        offsets = node_ids - self._id_base
+        valid = (offsets >= 0) & (offsets < len(self._row_of_id))
+        rows[valid] = self._row_of_id[offsets[valid]]
+        return rows
+
+    def row_of(self, node_id) -> int:
+        """노드 ID의 행 번호 (없으면 -1)"""
+        if self._id_base is not None and 0 <= node_id - self._id_base < len(self._row_of_id):
+            return int(self._row_of_id[node_id - self._id_base])
+        return -1
+
+    def view_at(self, row: int):
+        """행 번호에 해당하는 노드 뷰"""
+        return self._views[row]
+
+    def column(self, name: str) -> np.ndarray:
+        """사용 중인 행의 열 배열 뷰 반환 (쓰기 시 노드 상태에 바로 반영)"""
+        return self._data[name][:self._size]
+
+    # ------------------------------------------------------------------
+    # 변경 알림
+    # ------------------------------------------------------------------
+    def observe(self, column: str, callback):
+        """노드 뷰를 통해 열 값이 바뀌거나 노드가 추가/삭제될 때 callback(node_id) 호출
+
+        열 배열을 직접 수정하면 알림이 가지 않는다.
+        """
+        self._observers.setdefault(column, []).append(callback)
+
+    def unobserve(self, column: str, callback):
+        """observe로 등록한 콜백 해제"""
+        callbacks = self._observers.get(column)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._observers[column]
+
+    def _notify_all(self, node_ids):
+        """관찰 중인 모든 열에 대해 node_ids의 변경 알림"""
+        for callbacks in self._observers.values():
+            for callback in list(callbacks):
+                for node_id in node_ids:
+                    callback(node_id)
+
+    # ------------------------------------------------------------------
+    # dict 인터페이스
+    # ------------------------------------------------------------------
+    def __setitem__(self, node_id, node):
+        if not hasattr(node, '_bind'):
+            raise TypeError("NodeStore에는 Sensors 기반 노드만 저장할 수 있습니다")
+
+        if node._store is self:
+            # 이미 이 저장소의 행을 가리키는 노드 (Field.deploy_nodes 등)
+            row = node._row
+        else:
+            old = dict.get(self, node_id)
+            if old is not None:
+                row = old._row  # 같은 ID의 기존 행 재사용
+                self._detach(old)
+            else:
+                row = self.allocate(node_id)
+            source_store, source_row = node._store, node._row
+            for name, column in self._data.items():
+                column[row] = source_store._data[name][source_row]
+            node._bind(self, row)
+
+        self._data['node_id'][row] = node_id
+        self._map_ids([node_id], [row])
+        self._views[row] = node
+        dict.__setitem__(self, node_id, node)
+        if self._observers:
+            self._notify_all([node_id])
+
+    def _detach(self, node):
+        """노드 뷰를 현재 상태를 복사한 1행짜리 독립 저장소로 분리"""
+        detached = NodeStore(capacity=1)
+        detached_row = detached.allocate(node.node_id)
+        for name, column in self._data.items():
+            detached._data[name][detached_row] = column[node._row]
+        node._bind(detached, detached_row)
+
+    def __delitem__(self, node_id):
+        node = dict.pop(self, node_id)
+        row = node._row
+        last = self._size - 1
+        self._detach(node)
+
+        # 마지막 행을 빈 자리로 옮겨 행을 조밀하게 유지
+        if row != last:
+            for column in self._data.values():
+                column[row] = column[last]
+            moved = self._views[last]
+            moved._bind(self, row)
+            self._views[row] = moved
+            self._row_of_id[moved.node_id - self._id_base] = row
+        self._views[last] = None
+        self._row_of_id[node_id - self._id_base] = -1
+        self._size -= 1
+        if self._observers:
+            self._notify_all([node_id])
+
+    def delete_many(self, node_ids):
+        """여러 노드를 한 번에 삭제 (Field.deploy_nodes의 재배치 등)
+
+        삭제된 노드 뷰는 현재 상태를 복사한 하나의 독립 저장소로 함께 옮겨지고,
+        남은 행은 순서를 유지한 채 앞으로 당겨진다.
+        """
+        node_ids = np.asarray(node_ids, dtype=np.int64)
+        if len(node_ids) == 0:
+            return
+        rows = self.rows_of(node_ids)
+        if np.any(rows < 0):
+            raise KeyError(int(node_ids[rows < 0][0]))
+        id_list = node_ids.tolist()
+        nodes = [dict.pop(self, node_id) for node_id in id_list]
+
+        # 삭제된 노드 뷰를 한 번에 분리
+        detached = NodeStore(capacity=len(id_list))
+        detached_rows = detached.allocate_many(node_ids)
+        for name, column in self._data.items():
+            detached._data[name][detached_rows] = column[rows]
+        for node, row in zip(nodes, detached_rows.tolist()):
+            node._bind(detached, row)
+
+        # 남은 행을 순서대로 앞으로 당김
+        keep = np.ones(self._size, dtype=bool)
+        keep[rows] = False
+        kept_rows = np.flatnonzero(keep)
+        count = len(kept_rows)
+        for column in self._data.values():
+            column[:count] = column[kept_rows]
+        views = self._views
+        kept_views = [views[row] for row in kept_rows.tolist()]
+        for row, node in enumerate(kept_views):
+            if node._row != row:
+                node._bind(self, row)
+        views[:count] = kept_views
+        views[count:self._size] = [None] * (self._size - count)
+        self._row_of_id[node_ids - self._id_base] = -1
+        self._map_ids(self._data['node_id'][:count], np.arange(count))
+        self._size = count
+        if self._observers:
+            self._notify_all(id_list)
+
+    def pop(self, node_id, *default):
+        if node_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(node_id)
+        node = dict.__getitem__(self, node_id)
+        del self[node_id]
+        return node
+
+    def popitem(self):
+        if not self:
+            raise KeyError('popitem(): NodeStore is empty')
+        node_id = next(reversed(dict.keys(self)))
+        return node_id, self.pop(node_id)
+
+    def clear(self):
+        for node_id in list(self.keys()):
+            del self[node_id]
+
+    def setdefault(self, node_id, node=None):
+        if node_id not in self:
+            self[node_id] = node
+        return dict.__getitem__(self, node_id)
+
+    def update(self, *args, **kwargs):
+        for node_id, node in dict(*args, **kwargs).items():
+            self[node_id] = node
+
+    def copy(self):
+        return dict(self)
+
+
+class StoreColumn:
+    """노드 속성을 NodeStore의 열과 연결하는 디스크립터"""
+
+    def __init__(self, kind: str = 'float'):
+        self.kind = kind
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, node, owner=None):
+        if node is None:
+            return self
+        value = node._store._data[self.name].item(node._row)
+        kind = self.kind
+        if kind == 'float' or kind == 'int':
+            return value
+        if kind == 'hop':
+            return int(value) if value != INF else INF
+        if kind == 'next_hop':
+            if value == NEXT_HOP_NONE:
+                return None
+            if value == NEXT_HOP_BS:
+                return "BS"
+            return value
+        if kind == 'node_type':
+            return NODE_TYPES[value]
+        if kind == 'status':
+            return STATUSES[value]
+        return value
+
+    def __set__(self, node, value):
+        kind = self.kind
+        if kind == 'next_hop':
+            if value is None:
+                value = NEXT_HOP_NONE
+            elif value == "BS":
+                value = NEXT_HOP_BS
+            else:
+                value = int(value)
+        elif kind == 'node_type':
+            if value not in NODE_TYPE_CODES:
+                raise ValueError(f"알 수 없는 node_type: {value}")
+            value = NODE_TYPE_CODES[value]
+        elif kind == 'status':
+            if value not in STATUS_CODES:
+                raise ValueError(f"알 수 없는 status: {value}")
+            value = STATUS_CODES[value]
+        store = node._store
+        store._data[self.name][node._row] = value
+        if store._observers:
+            callbacks = store._observers.get(self.name)
+            if callbacks:
+                for callback in list(callbacks):
+                    callback(node.node_id)
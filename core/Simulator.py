@@ -0,0 +1,115 @@
+import heapq
+
+INF = float('inf')
+
+
+class Simulator:
+    """이산 사건(discrete-event) 시뮬레이션 커널
+
+    사건이 예약된 시각들을 float 힙으로, 시각별 사건을 예약 순서대로 담은 리스트(bucket)로
+    관리한다. run()은 가장 이른 시각의 사건들을 예약 순서대로 꺼내 시계(now)를 그 시각으로
+    옮긴 뒤 callback(*args)를 호출하며, 콜백 안에서 schedule()로 새 사건을 예약할 수 있다.
+    같은 시각의 사건은 힙 연산 한 번으로 처리되므로 주기적인 동시 트래픽에서 특히 빠르다.
+    사건은 [callback, args] 리스트이며, 취소하면 callback 자리를 None으로 바꿔 건너뛴다.
+    """
+
+    def __init__(self, start_time: float = 0.0):
+        self.now = start_time  # 현재 시뮬레이션 시각 (seconds)
+        self.events_processed = 0
+        self._times = []  # 사건이 있는 시각의 힙
+        self._buckets = {}  # 시각 -> 사건 리스트 (예약 순서)
+
+    def __len__(self):
+        """대기 중인 사건 수 (취소된 사건 포함)"""
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def schedule(self, delay: float, callback, *args) -> list:
+        """현재 시각으로부터 delay초 뒤에 callback(*args) 예약 (cancel에 쓸 사건 반환)"""
+        if delay < 0:
+            raise ValueError("delay는 0 이상이어야 합니다")
+        return self._insert(self.now + delay, callback, args)
+
+    def schedule_at(self, time: float, callback, *args) -> list:
+        """시각 time에 callback(*args) 예약"""
+        if time < self.now:
+            raise ValueError(f"과거 시각에는 사건을 예약할 수 없습니다 (now={self.now}, time={time})")
+        return self._insert(time, callback, args)
+
+    def _insert(self, time, callback, args) -> list:
+        event = [callback, args]
+        bucket = self._buckets.get(time)
+        if bucket is None:
+            self._buckets[time] = [event]
+            heapq.heappush(self._times, time)
+        else:
+            bucket.append(event)
+        return event
+
+    @staticmethod
+    def cancel(event):
+        """예약된 사건 취소 (이미 처리된 사건이면 아무 일도 없음)"""
+        event[0] = None
+
+    def peek(self) -> float:
+        """다음 사건이 예약된 시각 (없으면 inf, 취소된 사건의 시각일 수 있음)"""
+        return self._times[0] if self._times else INF
+
+    def step(self) -> bool:
+        """사건 하나 처리 (처리할 사건이 없으면 False)"""
+        return self.run(max_events=1) == 1
+
+    def run(self, until: float = None, max_events: int = None) -> int:
+        """사건 큐가 빌 때까지(또는 until 시각/max_events 개까지) 처리하고 처리한 사건 수 반환
+
+        until을 주면 그 시각 이하의 사건만 처리하고 시계를 until로 옮긴다.
+        """
+        times = self._times
+        buckets = self._buckets
+        pop = heapq.heappop
+        limit = INF if until is None else until
+        budget = INF if max_events is None else max_events
+        processed = 0
+        try:
+            while times and times[0] <= limit and processed < budget:
+                time = pop(times)
+                bucket = buckets.pop(time)
+                self.now = time
+                if len(bucket) == 1:
+                    # 시각마다 사건이 하나뿐인 경우의 빠른 경로
+                    event = bucket[0]
+                    callback = event[0]
+                    if callback is not None:
+                        event[0] = None
+                        callback(*event[1])
+                        processed += 1
+                    continue
+                for index, event in enumerate(bucket):
+                    callback = event[0]
+                    if callback is None:
+                        continue
+                    if processed >= budget:
+                        self._requeue(time, bucket[index:])
+                        break
+                    event[0] = None  # 처리된 사건은 cancel해도 영향 없음
+                    try:
+                        callback(*event[1])
+                    except BaseException:
+                        self._requeue(time, bucket[index + 1:])
+                        raise
+                    processed += 1
+        finally:
+            self.events_processed += processed
+        if until is not None and processed < budget and self.now < until:
+            self.now = until
+        return processed
+
+    def _requeue(self, time, events):
+        """처리하지 못한 같은 시각의 사건을 (그 사이 예약된 사건보다 앞에) 되돌림"""
+        if not events:
+            return
+        bucket = self._buckets.get(time)
+        if bucket is None:
+            self._buckets[time] = events
+            heapq.heappush(self._times, time)
+        else:
+            bucket[:0] = events
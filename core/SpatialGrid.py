@@ -0,0 +1,204 @@
+import heapq
+import math
+import numpy as np
+
+
+class SpatialGrid:
+    """균일 격자 해시 기반 공간 인덱스 (셀 크기 = 통신 범위)"""
+
+    # 자기 셀을 포함한 인접 3x3 셀 오프셋
+    NEIGHBOR_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("cell_size는 0보다 커야 합니다")
+        self.cell_size = float(cell_size)
+        self.cells = {}      # (cell_x, cell_y) -> 노드 ID 리스트
+        self.positions = {}  # 노드 ID -> (x, y)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, node_id):
+        return node_id in self.positions
+
+    def cell_key(self, x: float, y: float) -> tuple:
+        """좌표가 속한 셀의 키 반환"""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def build(self, node_ids, xs, ys):
+        """노드 좌표 배열로 격자를 한 번에 구성"""
+        self.cells = {}
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        cell_xs = np.floor(xs / self.cell_size).astype(np.int64).tolist()
+        cell_ys = np.floor(ys / self.cell_size).astype(np.int64).tolist()
+        self.positions = dict(zip(node_ids, zip(xs.tolist(), ys.tolist())))
+        for node_id, key in zip(node_ids, zip(cell_xs, cell_ys)):
+            bucket = self.cells.get(key)
+            if bucket is None:
+                self.cells[key] = [node_id]
+            else:
+                bucket.append(node_id)
+
+    def insert(self, node_id, x: float, y: float):
+        """노드를 격자에 추가 (이미 있으면 위치 갱신)"""
+        if node_id in self.positions:
+            self.remove(node_id)
+        self.positions[node_id] = (x, y)
+        self.cells.setdefault(self.cell_key(x, y), []).append(node_id)
+
+    def remove(self, node_id):
+        """노드를 격자에서 제거"""
+        position = self.positions.pop(node_id, None)
+        if position is None:
+            return
+        key = self.cell_key(*position)
+        bucket = self.cells.get(key)
+        if bucket is not None:
+            bucket.remove(node_id)
+            if not bucket:
+                del self.cells[key]
+
+    def _cell_bounds(self):
+        """비어있지 않은 셀들의 최소/최대 셀 좌표"""
+        cell_xs = [key[0] for key in self.cells]
+        cell_ys = [key[1] for key in self.cells]
+        return min(cell_xs), max(cell_xs), min(cell_ys), max(cell_ys)
+
+    def query_radius(self, x: float, y: float, radius: float, return_distance: bool = False):
+        """(x, y)에서 radius 이내에 있는 노드 ID 리스트 반환
+
+        return_distance가 True이면 (node_id, distance) 튜플 리스트를 반환한다.
+        """
+        results = []
+        if radius < 0 or not self.cells:
+            return results
+
+        min_cx, min_cy = self.cell_key(x - radius, y - radius)
+        max_cx, max_cy = self.cell_key(x + radius, y + radius)
+
+        # 탐색할 셀이 실제 셀 수보다 많으면 비어있지 않은 셀만 순회
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self.cells):
+            buckets = [bucket for (cx, cy), bucket in self.cells.items()
+                       if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy]
+        else:
+            buckets = [self.cells[(cx, cy)]
+                       for cx in range(min_cx, max_cx + 1)
+                       for cy in range(min_cy, max_cy + 1)
+                       if (cx, cy) in self.cells]
+
+        positions = self.positions
+        for bucket in buckets:
+            for node_id in bucket:
+                node_x, node_y = positions[node_id]
+                distance = math.sqrt((node_x - x)**2 + (node_y - y)**2)
+                if distance <= radius:
+                    results.append((node_id, distance) if return_distance else node_id)
+        return results
+
+    def nearest(self, x: float, y: float, k: int = 1, predicate=None):
+        """(x, y)에서 가장 가까운 노드 k개를 (node_id, distance) 리스트로 반환
+
+        중심 셀에서 링 단위로 탐색 범위를 넓히며, predicate(node_id)가
+        False인 노드는 건너뛴다. 거리가 같으면 노드 ID가 작은 쪽이 앞선다.
+        """
+        if k <= 0 or not self.cells:
+            return []
+
+        center_x, center_y = self.cell_key(x, y)
+        min_cx, max_cx, min_cy, max_cy = self._cell_bounds()
+        max_ring = max(center_x - min_cx, max_cx - center_x,
+                       center_y - min_cy, max_cy - center_y, 0)
+
+        best = []  # (-distance, -node_id) 최대 힙, 크기 k 유지
+        positions = self.positions
+        for ring in range(max_ring + 1):
+            if ring == 0:
+                ring_cells = [(center_x, center_y)]
+            else:
+                ring_cells = [(center_x + dx, center_y + dy)
+                              for dx in range(-ring, ring + 1)
+                              for dy in (-ring, ring)]
+                ring_cells += [(center_x + dx, center_y + dy)
+                               for dx in (-ring, ring)
+                               for dy in range(-ring + 1, ring)]
+
+            for key in ring_cells:
+                bucket = self.cells.get(key)
+                if bucket is None:
+                    continue
+                for node_id in bucket:
+                    if predicate is not None and not predicate(node_id):
+                        continue
+                    node_x, node_y = positions[node_id]
+                    distance = math.sqrt((node_x - x)**2 + (node_y - y)**2)
+                    entry = (-distance, -node_id)
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+
+            # 다음 링의 셀은 최소 ring * cell_size 만큼 떨어져 있음
+            if len(best) == k and -best[0][0] <= ring * self.cell_size:
+                break
+
+        return [(-neg_id, -neg_distance) for neg_distance, neg_id in sorted(best, reverse=True)]
+
+    @staticmethod
+    def neighbor_pairs(xs, ys, ranges, cell_size: float):
+        """인접 셀만 비교하여 통신 범위 내 (src, dst) 행 쌍을 계산
+
+        src 노드의 통신 범위(ranges[src]) 이내에 있는 dst 노드를 이웃으로 보며,
+        결과는 (src, dst) 오름차순으로 정렬되어 반환된다.
+        cell_size는 ranges의 최댓값 이상이어야 한다.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        ranges = np.asarray(ranges, dtype=float)
+        num_nodes = len(xs)
+        if num_nodes == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        # 셀 좌표를 0 이상의 정수로 옮긴 뒤 1차원 키로 변환
+        cell_xs = np.floor(xs / cell_size).astype(np.int64)
+        cell_ys = np.floor(ys / cell_size).astype(np.int64)
+        cell_xs -= cell_xs.min() - 1
+        cell_ys -= cell_ys.min() - 1
+        width = int(cell_ys.max()) + 2
+        keys = cell_xs * width + cell_ys
+
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        rows = np.arange(num_nodes)
+
+        src_parts = []
+        dst_parts = []
+        for dx, dy in SpatialGrid.NEIGHBOR_OFFSETS:
+            target = keys + (dx * width + dy)
+            start = np.searchsorted(sorted_keys, target, side='left')
+            end = np.searchsorted(sorted_keys, target, side='right')
+            counts = end - start
+            total = int(counts.sum())
+            if total == 0:
+                continue
+
+            # 각 노드의 후보 구간 [start, end)를 평탄화
+            src = np.repeat(rows, counts)
+            offsets = np.cumsum(counts) - counts
+            dst = order[start[src] + (np.arange(total) - offsets[src])]
+
+            distance = np.sqrt((xs[src] - xs[dst])**2 + (ys[src] - ys[dst])**2)
+            mask = (src != dst) & (distance <= ranges[src])
+            src_parts.append(src[mask])
+            dst_parts.append(dst[mask])
+
+        if not src_parts:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        src = np.concatenate(src_parts)
+        dst = np.concatenate(dst_parts)
+        pair_order = np.lexsort((dst, src))
+        return src[pair_order], dst[pair_order]
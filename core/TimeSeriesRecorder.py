@@ -0,0 +1,269 @@
+import math
+import numpy as np
+from core.NodeStore import NodeStore, ACTIVE
+
+
+class TimeSeriesRecorder:
+    """보고서 진행에 따른 네트워크 상태 시계열과 네트워크 수명(lifetime) 지표 기록기
+
+    보고서를 stride개 보낼 때마다 표본 하나를 미리 할당한 링 버퍼(capacity x 항목 수의
+    NumPy 배열)의 한 행에 기록하며, 버퍼가 차면 가장 오래된 표본부터 덮어쓴다.
+    표본 항목:
+        time, reports               - 시각(시뮬레이션 시각이 없으면 보낸 보고서 수)과 누적 보고서 수
+        alive_nodes, dead_nodes     - 활성/비활성 노드 수
+        energy_q<백분위>            - 잔여 에너지 분위수 (np.quantile의 linear 보간, 노드가
+                                      quantile_sample개보다 많으면 저장소 행을 일정 간격으로 골라 추정)
+        sent, delivered, captured   - 직전 표본 이후 보낸/BS에 도착한/malicious 노드를 지난 보고서 수
+        delivery_ratio              - 지금까지의 도착 보고서 수 / 보낸 보고서 수
+
+    수명 지표(milestones)는 보고서마다 검사하므로 표본 간격과 무관하게 보고서 단위로 정확하다:
+        first_node_death    - 처음으로 노드가 비활성이 된 시점
+        dead_<백분율>pct    - 비활성 노드 비율이 death_fractions의 각 값에 도달한 시점
+        bs_partition        - BS와 직접 통신 가능한 노드가 모두 비활성이 된 시점 (BS 고립)
+
+    Field.nodes가 NodeStore이면 status/node_type 변경 알림을 받아 두었다가 바뀐 경우에만
+    활성 노드 수와 malicious 노드 집합을 다시 구하므로, 보고서마다의 비용은 카운터 갱신 정도이다.
+    NodeStore가 아니면 보고서마다 전체 노드를 훑는다.
+    """
+
+    def __init__(self, field, capacity: int = 10000, stride: int = 1,
+                 quantiles=(0.1, 0.5, 0.9), death_fractions=(0.1, 0.5), quantile_sample: int = 256):
+        if capacity < 1 or stride < 1:
+            raise ValueError("capacity와 stride는 1 이상이어야 합니다")
+        self.field = field
+        self.capacity = capacity
+        self.stride = stride
+        self.quantiles = tuple(quantiles)
+        self.death_fractions = tuple(death_fractions)
+        self.quantile_sample = quantile_sample
+
+        self._quantile_columns = tuple(f"energy_q{q * 100:g}" for q in self.quantiles)
+        self.columns = ('time', 'reports', 'alive_nodes', 'dead_nodes') + self._quantile_columns + \
+            ('sent', 'delivered', 'captured', 'delivery_ratio')
+        self._float_columns = ('time', 'delivery_ratio') + self._quantile_columns
+        self._buffer = np.zeros((capacity, len(self.columns)), dtype=np.float64)
+        self.samples = 0  # 지금까지 기록한 표본 수 (capacity를 넘으면 오래된 표본은 덮어씀)
+
+        # 누적 보고서 수와 직전 표본 시점의 값
+        self.sent = 0
+        self.delivered = 0
+        self.captured = 0
+        self._sampled = (0, 0, 0)
+        self._now = 0.0
+
+        self.milestones = {'first_node_death': None}
+        for fraction in self.death_fractions:
+            self.milestones[f"dead_{fraction * 100:g}pct"] = None
+        self.milestones['bs_partition'] = None
+
+        self._dead = 0  # 비활성 노드 수
+        self._total = 0  # 전체 노드 수
+        self._counts_stale = True  # status가 바뀌어 노드 수를 다시 세야 하는지 여부
+        self._malicious = None  # malicious 노드 ID 집합 (node_type이 바뀌면 None)
+        self._quantile_plan = None  # (노드 수, 표본 간격, 작업 배열, [(아래 순위, 위 순위, 보간 비율)])
+        self._nodes = None
+        self._attach()
+
+    # ------------------------------------------------------------------
+    # 변경 추적
+    # ------------------------------------------------------------------
+    def _attach(self):
+        """현재 Field.nodes의 status/node_type 변경 알림을 구독"""
+        if isinstance(self._nodes, NodeStore):
+            self._nodes.unobserve('status', self._on_status)
+            self._nodes.unobserve('node_type', self._on_node_type)
+        self._nodes = self.field.nodes
+        if isinstance(self._nodes, NodeStore):
+            self._nodes.observe('status', self._on_status)
+            self._nodes.observe('node_type', self._on_node_type)
+        self._counts_stale = True
+        self._malicious = None
+        self._quantile_plan = None
+
+    def _on_status(self, node_id):
+        """status 변경 알림 (노드 추가/삭제 알림 포함)"""
+        self._counts_stale = True
+
+    def _on_node_type(self, node_id):
+        """node_type 변경 알림 (노드 추가/삭제 알림 포함)"""
+        self._malicious = None
+
+    def _sync(self) -> bool:
+        """Field.nodes가 바뀌었으면 다시 연결 (변경 알림을 받을 수 있으면 True)"""
+        if self.field.nodes is not self._nodes:
+            self._attach()
+        if isinstance(self._nodes, NodeStore):
+            return True
+        self._counts_stale = True
+        self._malicious = None
+        return False
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def record_report(self, report, now=None, delivered: bool = False):
+        """보고서 하나를 보냄 (delivered=True이면 도착까지 함께 기록)
+
+        now는 시뮬레이션 시각이며, None이면 보낸 보고서 수를 시각으로 쓴다.
+        보낸 보고서가 직전 표본 이후 stride개가 되면 표본을 기록한다.
+        """
+        self._sync()
+        self.sent += 1
+        if delivered:
+            self.delivered += 1
+        if self._is_captured(report['path']):
+            self.captured += 1
+        self._now = self.sent if now is None else now
+        self._check_milestones()
+        if self.sent - self._sampled[0] >= self.stride:
+            self.sample()
+
+    def record_reports(self, reports, now=None, delivered: int = None):
+        """한 번에 처리한 보고서 묶음 기록 (ReportBatch - 노드 상태는 묶음 단위로만 관측 가능)
+
+        delivered는 묶음 중 BS에 도착한 보고서 수이며, None이면 경로가 "BS"로 끝나는 보고서를 센다.
+        """
+        if not reports:
+            return
+        self._sync()
+        self.sent += len(reports)
+        if delivered is None:
+            delivered = sum(1 for report in reports if report['path'] and report['path'][-1] == "BS")
+        self.delivered += delivered
+        self.captured += sum(1 for report in reports if self._is_captured(report['path']))
+        self._now = self.sent if now is None else now
+        self._check_milestones()
+        if self.sent - self._sampled[0] >= self.stride:
+            self.sample()
+
+    def record_delivery(self, report, now=None):
+        """보고서가 BS에 도착함 (사건 단위 전송의 도착 사건)"""
+        self._sync()
+        self.delivered += 1
+        if now is not None:
+            self._now = now
+        self._check_milestones()
+
+    def finish(self, now=None):
+        """실행이 끝났을 때 마지막 표본 이후의 변화를 표본 하나로 기록"""
+        self._sync()
+        if now is not None:
+            self._now = now
+        self._check_milestones()
+        if self.samples == 0 or (self.sent, self.delivered, self.captured) != self._sampled:
+            self.sample()
+
+    def _is_captured(self, path) -> bool:
+        """경로가 malicious 노드를 지나는지 여부 (싱크홀에 잡힌 트래픽)"""
+        if self._malicious is None:
+            self._malicious = set(self.field.get_categories().members("malicious"))
+        return bool(self._malicious) and not self._malicious.isdisjoint(path)
+
+    def sample(self):
+        """현재 네트워크 상태를 링 버퍼에 표본 하나로 기록"""
+        self._sync()
+        self._check_milestones()
+        sent, delivered, captured = self._sampled
+        self._buffer[self.samples % self.capacity] = (
+            self._now, self.sent, self._total - self._dead, self._dead,
+            *self._energy_quantiles(),
+            self.sent - sent, self.delivered - delivered, self.captured - captured,
+            self.delivered / self.sent if self.sent else np.nan)
+        self.samples += 1
+        self._sampled = (self.sent, self.delivered, self.captured)
+
+    def _energy_quantiles(self):
+        """잔여 에너지 분위수 (미리 할당한 작업 배열에 복사해 정렬, 노드가 없으면 NaN)"""
+        nodes = self._nodes
+        if isinstance(nodes, NodeStore):
+            energies = nodes._data['energy_level']  # 사용 중인 행은 앞쪽 nodes.size개
+            count = nodes.size
+        else:
+            energies = np.fromiter((node.energy_level for node in nodes.values()), dtype=float,
+                                   count=len(nodes))
+            count = len(energies)
+        if count == 0:
+            return [np.nan] * len(self.quantiles)
+
+        plan = self._quantile_plan
+        if plan is None or plan[0] != count:
+            # 노드가 quantile_sample개보다 많으면 step개마다 하나씩 (복사 없는 슬라이스)
+            step = -(-count // self.quantile_sample)
+            size = len(range(0, count, step))
+            ranks = []
+            for q in self.quantiles:
+                position = q * (size - 1)
+                lower = int(math.floor(position))
+                ranks.append((lower, min(lower + 1, size - 1), position - lower))
+            plan = (count, step, np.empty(size), ranks)
+            self._quantile_plan = plan
+        _, step, ordered, ranks = plan
+        np.copyto(ordered, energies[:count:step])
+        ordered.sort()
+        item = ordered.item
+        return [item(lower) + (item(upper) - item(lower)) * fraction if fraction else item(lower)
+                for lower, upper, fraction in ranks]
+
+    # ------------------------------------------------------------------
+    # 수명 지표
+    # ------------------------------------------------------------------
+    def _count_nodes(self) -> bool:
+        """status가 바뀌었으면 활성/비활성 노드 수를 다시 셈 (다시 셌으면 True)"""
+        if not self._counts_stale:
+            return False
+        nodes = self._nodes
+        if isinstance(nodes, NodeStore):
+            active = int(np.count_nonzero(nodes.status == ACTIVE))
+        else:
+            active = sum(1 for node in nodes.values() if node.status == "active")
+        self._total = len(nodes)
+        self._dead = self._total - active
+        self._counts_stale = False
+        return True
+
+    def _check_milestones(self):
+        """노드 상태가 바뀌었으면 아직 도달하지 않은 수명 지표 검사"""
+        if not self._count_nodes():
+            return
+        dead, total = self._dead, self._total
+        milestones = self.milestones
+        if dead >= 1 and milestones['first_node_death'] is None:
+            self._reach('first_node_death')
+        for fraction in self.death_fractions:
+            name = f"dead_{fraction * 100:g}pct"
+            if milestones[name] is None and total and dead >= math.ceil(fraction * total):
+                self._reach(name)
+        if milestones['bs_partition'] is None and self._bs_isolated():
+            self._reach('bs_partition')
+
+    def _reach(self, name):
+        self.milestones[name] = {'time': self._now, 'reports': self.sent, 'dead_nodes': self._dead}
+
+    def _bs_isolated(self) -> bool:
+        """BS와 직접 통신 가능한 활성 노드가 하나도 없는지 여부 (BS가 없으면 False)"""
+        if self.field.base_station is None:
+            return False
+        bs_links = self.field._get_bs_links()
+        nodes = self._nodes
+        if isinstance(nodes, NodeStore):
+            rows = nodes.rows_of(np.fromiter(bs_links, dtype=np.int64, count=len(bs_links)))
+            return not np.any(nodes.status[rows] == ACTIVE)
+        return not any(nodes[node_id].status == "active" for node_id in bs_links)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def __len__(self):
+        """링 버퍼에 남아 있는 표본 수"""
+        return min(self.samples, self.capacity)
+
+    def series(self) -> dict:
+        """열 이름 -> 남아 있는 표본의 시간 순 배열 (복사본)"""
+        rows = self._buffer[np.arange(self.samples - len(self), self.samples) % self.capacity]
+        return {name: rows[:, i] if name in self._float_columns else rows[:, i].astype(np.int64)
+                for i, name in enumerate(self.columns)}
+
+    def lifetime(self) -> dict:
+        """수명 지표별 도달 시각 ('<지표>_time', 도달하지 않았으면 None)"""
+        return {f"{name}_time": None if reached is None else reached['time']
+                for name, reached in self.milestones.items()}
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import numpy as np
+from core.Field import Field
+from core.NodeStore import NodeStore
+from core.nodes.MicazMotes import MicazMotes
+from core.nodes.HardwareProfile import HardwareProfile
+
+
+class TopologyCache:
+    """배치 + 이웃 탐색 + 라우팅 설정 결과를 디스크에 보관하는 내용 주소 방식 캐시
+
+    같은 시드, 노드 수, 필드 크기, 배치 분포, BS 위치, 통신 범위(하드웨어 프로필),
+    라우팅 설정이면 같은 토폴로지가 만들어지므로, 그 입력들의 해시를 키로 하여
+    노드 상태 열, 이웃 리스트(CSR: 오프셋 + 이웃 ID), 라우팅 결과와 토폴로지 구성 직후의
+    난수 생성기 상태를 .npz 파일 하나에 저장한다. load()는 deploy_nodes/find_neighbors/
+    setup_routing을 다시 실행하지 않고 바로 시뮬레이션할 수 있는 Field와 라우팅을 복원한다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 삭제한다.
+    """
+
+    VERSION = 1  # 저장 형식이나 토폴로지 생성 방식이 바뀌면 올려서 기존 항목을 무효화
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        if not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def key(cls, **inputs) -> str:
+        """토폴로지를 결정하는 입력들의 해시 (예: seed, num_nodes, field_size, ...)
+
+        통신 범위와 초기 에너지가 바뀌어도 다른 키가 되도록 하드웨어 프로필 상수를 함께 넣는다.
+        """
+        profiles = [{name: getattr(profile, name) for name in HardwareProfile.__slots__}
+                    for profile in HardwareProfile.registry]
+        payload = json.dumps({'version': cls.VERSION, 'profiles': profiles, 'inputs': inputs},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        """키에 해당하는 캐시 파일 경로"""
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def __contains__(self, key):
+        return os.path.exists(self.path(key))
+
+    def load(self, key: str, routing_factory):
+        """캐시된 토폴로지로 (Field, 라우팅) 복원 (없으면 None)
+
+        routing_factory(field)는 라우팅 객체를 만드는 함수이며, setup_routing 대신
+        캐시된 next_hop/hop_count와 라우팅 테이블, 경로 비용이 적용된다.
+        난수 생성기 상태도 토폴로지를 처음 만들었을 때의 직후 상태로 되돌린다.
+        """
+        file_path = self.path(key)
+        try:
+            with np.load(file_path) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError, KeyError):
+            # 없는 항목이거나 다른 프로세스가 지우는 중/깨진 파일
+            self.misses += 1
+            return None
+        try:
+            os.utime(file_path)  # 최근 사용 시각 갱신 (LRU 삭제 기준)
+        except OSError:
+            pass
+
+        meta = json.loads(str(arrays['meta']))
+        field = Field(meta['width'], meta['height'])
+        store = field.nodes
+        node_ids = arrays['node_id']
+        nodes = MicazMotes.create_many(node_ids, arrays['pos_x'], arrays['pos_y'], store)
+        rows = store.rows_of(node_ids)
+        for name in NodeStore.COLUMNS:
+            store._data[name][rows] = arrays[name]
+
+        offsets = arrays['neighbor_offsets'].tolist()
+        neighbor_ids = arrays['neighbor_ids'].tolist()
+        for row, node in enumerate(nodes):
+            node.neighbor_nodes = neighbor_ids[offsets[row]:offsets[row + 1]]
+        field.base_station = meta['base_station']
+
+        routing = routing_factory(field)
+        next_hops = [node.next_hop for node in nodes]
+        routing.routing_table = dict(zip(node_ids.tolist(), next_hops))
+        if hasattr(routing, 'path_costs'):
+            routed = arrays['path_cost_ids'].tolist()
+            routing.path_costs = dict(zip(routed, arrays['path_costs'].tolist()))
+
+        np.random.set_state(('MT19937', arrays['rng_keys'], int(arrays['rng_pos']),
+                             int(arrays['rng_has_gauss']), float(arrays['rng_cached_gaussian'])))
+        self.hits += 1
+        return field, routing
+
+    def store(self, key: str, field, routing) -> bool:
+        """setup_routing까지 끝난 토폴로지와 현재 난수 상태를 저장 (NodeStore가 아니면 저장하지 않음)"""
+        if not isinstance(field.nodes, NodeStore):
+            return False
+        store = field.nodes
+        arrays = {name: store.column(name) for name in NodeStore.COLUMNS}
+
+        # 이웃 리스트를 CSR 형식으로 (행 순서 = store 행 순서)
+        nodes = [store.view_at(row) for row in range(store.size)]
+        counts = np.fromiter((len(node.neighbor_nodes) for node in nodes), dtype=np.int64, count=len(nodes))
+        offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        neighbor_ids = np.fromiter((neighbor_id for node in nodes for neighbor_id in node.neighbor_nodes),
+                                   dtype=np.int64, count=int(offsets[-1]))
+        if len(neighbor_ids) == 0 or neighbor_ids.max() <= np.iinfo(np.int32).max:
+            neighbor_ids = neighbor_ids.astype(np.int32)
+        arrays['neighbor_offsets'] = offsets
+        arrays['neighbor_ids'] = neighbor_ids
+
+        path_costs = getattr(routing, 'path_costs', {})
+        arrays['path_cost_ids'] = np.fromiter(path_costs.keys(), dtype=np.int64, count=len(path_costs))
+        arrays['path_costs'] = np.fromiter(path_costs.values(), dtype=np.float64, count=len(path_costs))
+
+        _, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+        arrays['rng_keys'] = keys
+        arrays['rng_pos'] = np.array(pos)
+        arrays['rng_has_gauss'] = np.array(has_gauss)
+        arrays['rng_cached_gaussian'] = np.array(cached_gaussian)
+        arrays['meta'] = np.array(json.dumps({'width': field.width, 'height': field.height,
+                                              'base_station': field.base_station}))
+
+        # 임시 파일에 쓴 뒤 교체 (같은 키를 동시에 쓰는 다른 워커가 깨진 파일을 읽지 않도록)
+        file_path = self.path(key)
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as cache_file:
+            np.savez(cache_file, **arrays)
+        os.replace(temp_path, file_path)
+        self.evict()
+        return True
+
+    def size(self) -> int:
+        """캐시 항목들의 전체 크기 (bytes)"""
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self) -> list:
+        """(최근 사용 시각, 경로, 크기) 리스트"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.npz'):
+                continue
+            file_path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, file_path, stat.st_size))
+        return entries
+
+    def evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 쓰지 않은 항목 삭제"""
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        for _, file_path, size in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        for _, file_path, _ in self._entries():
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
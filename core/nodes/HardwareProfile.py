@@ -0,0 +1,68 @@
+import numpy as np
+
+
+class HardwareProfile:
+    """같은 하드웨어를 쓰는 모든 노드가 공유하는 하드웨어 상수 (flyweight)
+
+    노드는 프로필 객체를 직접 들고 있지 않고 NodeStore의 'profile' 열에
+    프로필 번호(index)만 저장한다.
+    """
+    __slots__ = ('name', 'index', 'comm_range', 'data_rate', 'voltage',
+                 'tx_current', 'rx_current', 'tx_energy_per_byte',
+                 'rx_energy_per_byte', 'initial_energy')
+
+    registry = []  # index -> HardwareProfile
+
+    def __init__(self, name: str, comm_range: float, data_rate: float, voltage: float,
+                 tx_current: float, rx_current: float, tx_energy_per_byte: float,
+                 rx_energy_per_byte: float, initial_energy: float):
+        self.name = name
+        self.comm_range = comm_range
+        self.data_rate = data_rate
+        self.voltage = voltage
+        self.tx_current = tx_current
+        self.rx_current = rx_current
+        self.tx_energy_per_byte = tx_energy_per_byte
+        self.rx_energy_per_byte = rx_energy_per_byte
+        self.initial_energy = initial_energy
+
+        self.index = len(HardwareProfile.registry)
+        HardwareProfile.registry.append(self)
+
+    def __repr__(self):
+        return f"HardwareProfile({self.name!r})"
+
+    @classmethod
+    def column(cls, attribute: str) -> np.ndarray:
+        """프로필 번호로 인덱싱할 수 있는 상수 배열 (예: column('initial_energy')[store.profile])"""
+        return np.array([getattr(profile, attribute) for profile in cls.registry], dtype=float)
+
+
+class ProfileAttribute:
+    """노드의 하드웨어 프로필 상수를 읽기 전용 속성으로 노출하는 디스크립터"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, node, owner=None):
+        if node is None:
+            return self
+        return getattr(node.profile, self.name)
+
+    def __set__(self, node, value):
+        raise AttributeError(f"{self.name}은(는) 공유 하드웨어 프로필 상수입니다 "
+                             f"(별도 HardwareProfile을 만들어 지정하세요)")
+
+
+# MicaZ 모트 하드웨어 사양 (registry 0번)
+MICAZ_PROFILE = HardwareProfile(
+    "micaz",
+    comm_range=100,               # 실외환경 기준 (100m)
+    data_rate=250000,             # 250kbps
+    voltage=3.0,                  # 3V
+    tx_current=17.4e-3,           # 17.4mA
+    rx_current=19.7e-3,           # 19.7mA
+    tx_energy_per_byte=16.25e-6,  # 16.25 µJ per byte
+    rx_energy_per_byte=12.5e-6,   # 12.5 µJ per byte
+    initial_energy=1,             # 1 Joule
+)
@@ -1,29 +1,84 @@
 from core.nodes.Sensors import Sensors
+from core.nodes.HardwareProfile import HardwareProfile, ProfileAttribute, MICAZ_PROFILE
+from core.NodeStore import StoreColumn
 
 class MicazMotes(Sensors):
-   def __init__(self, node_id: int, pos_x: float, pos_y: float):
-       super().__init__(node_id, pos_x, pos_y)
+   """MicaZ 모트 노드
+
+   하드웨어 상수(data_rate, voltage, 전류, 바이트당 에너지, 초기 에너지)는
+   공유 HardwareProfile에 두고, 노드마다 달라지는 상태는 NodeStore 열에 둔다.
+   인스턴스는 __slots__만 사용하므로 노드당 메모리 목표는
+   TARGET_BYTES_PER_NODE(이웃 리스트 제외, Field.memory_usage()로 측정)이다.
+   """
+   __slots__ = ()
+
+   TARGET_BYTES_PER_NODE = 400
+
+   comm_range = StoreColumn('float')
+   energy_level = StoreColumn('float')
+   consumed_energy_tx = StoreColumn('float')
+   consumed_energy_rx = StoreColumn('float')
+   total_consumed_energy = StoreColumn('float')
+
+   # 공유 하드웨어 프로필 상수 (읽기 전용)
+   data_rate = ProfileAttribute()
+   voltage = ProfileAttribute()
+   tx_current = ProfileAttribute()
+   rx_current = ProfileAttribute()
+   tx_energy_per_byte = ProfileAttribute()
+   rx_energy_per_byte = ProfileAttribute()
+   initial_energy = ProfileAttribute()
+
+   def __init__(self, node_id: int, pos_x: float, pos_y: float, store=None,
+                profile: HardwareProfile = MICAZ_PROFILE):
+       super().__init__(node_id, pos_x, pos_y, store)
        
        # 하드웨어 특성
-       self.comm_range = 100  # 실외환경 기준 (100m)
-       self.data_rate = 250000  # 250kbps
-       
-       # 전력 관련 특성
-       self.voltage = 3.0  # 3V
-       self.tx_current = 17.4e-3  # 17.4mA
-       self.rx_current = 19.7e-3  # 19.7mA
-       
-       # 에너지 소비량 (Joule 단위)
-       self.tx_energy_per_byte = 16.25e-6  # 16.25 µJ per byte
-       self.rx_energy_per_byte = 12.5e-6   # 12.5 µJ per byte
+       self.profile = profile
+       self.comm_range = profile.comm_range  # 실외환경 기준 (100m), 노드별로 확장 가능
        
        # 에너지 관리
-       self.initial_energy = 1  # 1 Joule
-       self.energy_level = self.initial_energy
+       self.energy_level = profile.initial_energy
        self.consumed_energy_tx = 0  # Joules
        self.consumed_energy_rx = 0  # Joules
        self.total_consumed_energy = 0  # Joules
 
+   @classmethod
+   def create_many(cls, node_ids, xs, ys, store, profile: HardwareProfile = MICAZ_PROFILE) -> list:
+       """여러 노드의 행을 store에 한 번에 채우고 노드 뷰 리스트 반환
+
+       __init__과 같은 초기 상태를 열 단위로 기록하며, 반환된 뷰는
+       store.insert_views로 저장소에 등록된 상태이다.
+       """
+       rows = store.allocate_many(node_ids)
+       data = store._data
+       data['pos_x'][rows] = xs
+       data['pos_y'][rows] = ys
+       data['profile'][rows] = profile.index
+       data['comm_range'][rows] = profile.comm_range
+       data['energy_level'][rows] = profile.initial_energy
+
+       nodes = []
+       new_node = object.__new__
+       for node_id, row in zip(store.node_id[rows].tolist(), rows.tolist()):
+           node = new_node(cls)
+           node.node_id = node_id
+           node._store = store
+           node._row = row
+           node.neighbor_nodes = []
+           nodes.append(node)
+       store.insert_views(rows, nodes)
+       return nodes
+
+   @property
+   def profile(self) -> HardwareProfile:
+       """노드가 사용하는 공유 하드웨어 프로필"""
+       return HardwareProfile.registry[self._store._data['profile'].item(self._row)]
+
+   @profile.setter
+   def profile(self, profile: HardwareProfile):
+       self._store._data['profile'][self._row] = profile.index
+
    def add_neighbor(self, neighbor_id: int):
        """이웃 노드 추가"""
        if neighbor_id not in self.neighbor_nodes:
@@ -52,6 +107,10 @@ class MicazMotes(Sensors):
        
        if self.energy_level <= 0:
            self.status = "inactive"
+       
+       statistics = self._store.statistics
+       if statistics is not None:
+           statistics.record_packet(self, energy_consumed, is_tx=True)
            
        return energy_consumed
 
@@ -69,6 +128,10 @@ class MicazMotes(Sensors):
        
        if self.energy_level <= 0:
            self.status = "inactive"
+       
+       statistics = self._store.statistics
+       if statistics is not None:
+           statistics.record_packet(self, energy_consumed, is_tx=False)
            
        return energy_consumed
 
@@ -1,6 +1,32 @@
+from core.NodeStore import NodeStore, StoreColumn
+
+
 class Sensors:
-    """Sensors의 기본 노드 특성을 정의하는 기본 클래스"""
-    def __init__(self, node_id: int, pos_x: float, pos_y: float):
+    """Sensors의 기본 노드 특성을 정의하는 기본 클래스
+
+    상태 속성(위치, 상태, 라우팅 정보, 패킷 카운터)은 NodeStore의 한 행에
+    저장되며, 이 객체는 그 행을 가리키는 가벼운 뷰이다. store 없이 생성하면
+    1행짜리 독립 저장소를 사용하고, Field.nodes에 추가될 때 필드의 저장소로 옮겨진다.
+    """
+    __slots__ = ('node_id', '_store', '_row', 'neighbor_nodes')
+
+    pos_x = StoreColumn('float')
+    pos_y = StoreColumn('float')
+    status = StoreColumn('status')
+    node_type = StoreColumn('node_type')
+    next_hop = StoreColumn('next_hop')
+    hop_count = StoreColumn('hop')
+    route_changes = StoreColumn('int')
+    distance_to_bs = StoreColumn('float')
+    tx_count = StoreColumn('int')
+    rx_count = StoreColumn('int')
+
+    def __init__(self, node_id: int, pos_x: float, pos_y: float, store: NodeStore = None):
+        # 상태를 보관할 저장소 행 할당
+        if store is None:
+            store = NodeStore(capacity=1)
+        self._bind(store, store.allocate(node_id))
+
         # 노드 기본 설정
         self.node_id = node_id
         self.pos_x = pos_x
@@ -11,8 +37,7 @@ class Sensors:
         self.node_type = "normal"  # normal/malicious_inside/malicious_outside/affected
         
         # 통신 속성
-        self.neighbors = []  # 이웃 노드 ID 리스트
-        self.neighbor_nodes = []  # 이웃 노드 ID 리스트 (backward compatibility)
+        self.neighbor_nodes = []  # 이웃 노드 ID 리스트 (neighbors와 같은 객체)
         self.next_hop = None  # 다음 홉 (라우팅)
         self.hop_count = float('inf')  # 베이스스테이션까지의 홉 수
         self.route_changes = 0  # 라우팅 경로 변경 횟수
@@ -22,6 +47,20 @@ class Sensors:
         self.tx_count = 0  # 전송 패킷 카운터
         self.rx_count = 0  # 수신 패킷 카운터
         
+    def _bind(self, store: NodeStore, row: int):
+        """노드 뷰가 가리킬 저장소와 행 설정"""
+        self._store = store
+        self._row = row
+
+    @property
+    def neighbors(self) -> list:
+        """이웃 노드 ID 리스트 (neighbor_nodes의 별칭)"""
+        return self.neighbor_nodes
+
+    @neighbors.setter
+    def neighbors(self, neighbor_ids: list):
+        self.neighbor_nodes = neighbor_ids
+
     def get_node_id(self) -> int:
         """노드의 ID를 반환"""
         return self.node_id
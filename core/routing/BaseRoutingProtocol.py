@@ -1,31 +1,28 @@
 import os
 import csv
 import numpy as np
+from core.NodeStore import NodeStore
+from .RoutingTree import RoutingTree
+from .ReportBatch import ReportBatch
 
 class BaseRoutingProtocol:
     def __init__(self, field):
         self.field = field
+        self.tree = RoutingTree(field)  # next_hop 기반 라우팅 트리 인덱스 (경로 캐시)
+        self.incremental_repair = False  # True이면 노드가 죽을 때마다 repair_routing 호출
+        self.recorder = None  # 보고서마다 호출할 TimeSeriesRecorder (None이면 기록 안 함)
 
     def setup_routing(self):
         """라우팅 설정 - 자식 클래스에서 구현해야 함"""
         raise NotImplementedError("이 메서드는 자식 클래스에서 구현되어야 합니다")
 
+    def repair_routing(self, node_ids):
+        """고장/탈취된 노드에 대한 증분 라우팅 복구 - 자식 클래스에서 구현해야 함"""
+        raise NotImplementedError("이 메서드는 자식 클래스에서 구현되어야 합니다")
+
     def get_path_to_bs(self, node_id):
-        """특정 노드에서 BS까지의 경로 추적"""
-        path = []
-        current_id = node_id
-        
-        while current_id is not None:
-            path.append(str(current_id))
-            if current_id not in self.field.nodes:
-                break
-            current_node = self.field.nodes[current_id]
-            current_id = current_node.next_hop
-            if current_id == "BS":
-                path.append("BS")
-                break
-                
-        return path
+        """특정 노드에서 BS까지의 경로 [node_id, ..., "BS"] (정수 노드 ID, 라우팅 트리 캐시 사용)"""
+        return self.tree.get_path(node_id)
 
     def process_single_report(self, report_id, source_node=None):
         """단일 보고서 처리"""
@@ -33,18 +30,22 @@ class BaseRoutingProtocol:
         
         # 소스 노드 선택 (지정된 소스 노드가 없으면 랜덤 선택)
         if source_node is None:
-            # next_hop이 있는 노드만 선택
-            available_nodes = [nid for nid, n in self.field.nodes.items() if n.next_hop]
-            source_node_id = np.random.choice(available_nodes)
+            # next_hop이 있는 노드만 선택 (분류 인덱스에서 O(1) 추출)
+            source_node_id = self.field.get_categories().sample("routable")
+            if source_node_id is None:
+                raise ValueError("next_hop이 있는 소스 노드가 없습니다")
         else:
             source_node_id = source_node
         
         # 경로 추적
         path = self.get_path_to_bs(source_node_id)
+        if self.incremental_repair:
+            active_before = [node_id for node_id in path
+                             if node_id != "BS" and self.field.nodes[node_id].status == "active"]
         
         # 경로를 따라 패킷 전송 시뮬레이션
         for j in range(len(path)-1):
-            current_id = int(path[j])
+            current_id = path[j]
             current_node = self.field.nodes[current_id]
             
             # 현재 노드의 패킷 전송
@@ -56,19 +57,120 @@ class BaseRoutingProtocol:
                 # BS에 도달한 경우
                 continue
             else:
-                next_id = int(next_id)
                 next_node = self.field.nodes[next_id]
                 next_node.receive_packet(packet_size)
         
-        return {
+        # 이번 보고서 전송으로 에너지가 고갈된 노드의 서브트리만 복구
+        if self.incremental_repair:
+            failed = [node_id for node_id in active_before
+                      if self.field.nodes[node_id].status == "inactive"]
+            if failed:
+                self.repair_routing(failed)
+        
+        report = {
             'report_id': report_id + 1,
             'source_node': source_node_id,
             'path': path,
             'source_energy': self.field.nodes[source_node_id].energy_level
         }
+        if self.recorder is not None:
+            self.recorder.record_report(report, delivered=path[-1] == "BS")
+        return report
+
+    def send_report(self, simulator, report_id, source_node=None, packet_size=32,
+                    on_delivered=None, path=None):
+        """보고서 하나를 사건 단위 전송으로 예약 (simulator의 현재 시각에 출발)
+
+        각 홉에서 송신 사건이 패킷을 보내고, 송신 노드의 calculate_packet_time(packet_size)
+        뒤의 수신 사건에서 다음 노드가 받는다. BS에 도착하면 보고서에 도착 시각과
+        종단 간 지연(latency)을 기록하고 on_delivered(report)를 호출한다.
+        path를 주면 라우팅 경로 대신 그 경로를 따라 보낸다 (예: 공격자 경유 경로).
+        """
+        if path is None:
+            if source_node is None:
+                source_node = self.field.get_categories().sample("routable")
+                if source_node is None:
+                    raise ValueError("next_hop이 있는 소스 노드가 없습니다")
+            path = self.get_path_to_bs(source_node)
+        else:
+            source_node = path[0]
+
+        report = {
+            'report_id': report_id + 1,
+            'source_node': source_node,
+            'path': path,
+            'source_energy': self.field.nodes[source_node].energy_level,
+            'send_time': simulator.now,
+            'delivery_time': None,
+            'latency': None
+        }
+        if self.recorder is not None:
+            self.recorder.record_report(report, simulator.now)
+        if len(path) > 1:
+            simulator.schedule(0, self._on_transmit, simulator, report, 0, packet_size, on_delivered)
+        return report
+
+    def schedule_reports(self, simulator, num_reports, interval, source_node=None,
+                         packet_size=32, on_delivered=None) -> list:
+        """interval초마다 보고서를 보내는 타이머 사건 예약 (보고서는 반환된 리스트에 추가됨)"""
+        reports = []
+        if num_reports > 0:
+            simulator.schedule(0, self._on_report_timer, simulator, reports, num_reports,
+                               interval, source_node, packet_size, on_delivered)
+        return reports
+
+    def _on_report_timer(self, simulator, reports, num_reports, interval, source_node,
+                         packet_size, on_delivered):
+        reports.append(self.send_report(simulator, len(reports), source_node, packet_size, on_delivered))
+        if len(reports) < num_reports:
+            simulator.schedule(interval, self._on_report_timer, simulator, reports, num_reports,
+                               interval, source_node, packet_size, on_delivered)
+
+    def _on_transmit(self, simulator, report, hop, packet_size, on_delivered):
+        """송신 사건: path[hop] 노드가 패킷을 보내고 전송 시간 뒤의 수신 사건 예약"""
+        node_id = report['path'][hop]
+        node = self.field.nodes[node_id]
+        was_active = node.status == "active"
+        node.transmit_packet(packet_size)
+        if hop == 0:
+            report['source_energy'] = node.energy_level
+        self._repair_if_failed(node_id, node, was_active)
+        simulator.schedule(node.calculate_packet_time(packet_size), self._on_receive,
+                           simulator, report, hop + 1, packet_size, on_delivered)
+
+    def _on_receive(self, simulator, report, hop, packet_size, on_delivered):
+        """수신 사건: path[hop] 노드가 패킷을 받고 다음 홉으로 전달 (BS이면 도착 처리)"""
+        path = report['path']
+        node_id = path[hop]
+        if node_id == "BS":
+            report['delivery_time'] = simulator.now
+            report['latency'] = simulator.now - report['send_time']
+            if self.recorder is not None:
+                self.recorder.record_delivery(report, simulator.now)
+            if on_delivered is not None:
+                on_delivered(report)
+            return
+
+        node = self.field.nodes[node_id]
+        was_active = node.status == "active"
+        node.receive_packet(packet_size)
+        self._repair_if_failed(node_id, node, was_active)
+        if hop + 1 < len(path):
+            simulator.schedule(0, self._on_transmit, simulator, report, hop, packet_size, on_delivered)
+
+    def _repair_if_failed(self, node_id, node, was_active):
+        """방금 사건으로 에너지가 고갈된 노드의 서브트리 복구 (incremental_repair일 때)"""
+        if self.incremental_repair and was_active and node.status == "inactive":
+            self.repair_routing([node_id])
+
+    def simulate_reports(self, num_reports, source_node=None, batch=False):
+        """순차적으로 여러 보고서 전송 시뮬레이션
+
+        batch=True이면 simulate_report_batch로 한 번에 처리한다.
+        """
+        if batch:
+            return self.simulate_report_batch(num_reports, source_node)
 
-    def simulate_reports(self, num_reports, source_node=None):
-        """순차적으로 여러 보고서 전송 시뮬레이션"""
         reports = []
         
         # 각 보고서를 순차적으로 처리
@@ -78,6 +180,56 @@ class BaseRoutingProtocol:
         
         return reports
 
+    def simulate_report_batch(self, num_reports, source_node=None, packet_size=32):
+        """여러 보고서를 벡터 연산으로 한 번에 처리 (ReportBatch)
+
+        소스는 한 번의 np.random.choice로 모두 뽑으며, 같은 시드에서 순차 처리와 같은
+        소스를 고른다. incremental_repair가 켜져 있으면 노드가 처음 죽는 보고서까지만
+        반영하고 라우팅을 복구한 뒤, 나머지 보고서를 새 라우팅으로 다시 배치 처리한다.
+        노드 저장소가 NodeStore가 아니거나 라우팅에 순환이 있으면 순차 처리로 대체한다.
+        """
+        nodes = self.field.nodes
+        reports = []
+        while len(reports) < num_reports:
+            order_ids, _ = self.tree.subtree_arrays()
+            if not isinstance(nodes, NodeStore) or len(order_ids) < len(nodes):
+                for i in range(len(reports), num_reports):
+                    reports.append(self.process_single_report(i, source_node))
+                break
+
+            count = num_reports - len(reports)
+            if source_node is None:
+                available_nodes = self._available_sources()
+                state = np.random.get_state()
+                sources = np.random.choice(available_nodes, size=count)
+            else:
+                sources = np.full(count, source_node, dtype=np.int64)
+            batch = ReportBatch(self, sources, packet_size)
+
+            first_death = batch.first_death
+            if self.incremental_repair and first_death is not None and first_death < count - 1:
+                # 복구 후에는 소스 후보가 바뀌므로 첫 사망 보고서까지만 다시 뽑아 처리
+                if source_node is None:
+                    np.random.set_state(state)
+                    sources = np.random.choice(available_nodes, size=first_death + 1)
+                else:
+                    sources = sources[:first_death + 1]
+                batch = ReportBatch(self, sources, packet_size)
+
+            batch.apply()
+            batch_reports = batch.reports(len(reports))
+            if self.recorder is not None:
+                delivered = sum(1 for report in batch_reports if report['path'][-1] == "BS")
+                self.recorder.record_reports(batch_reports, delivered=delivered)
+            reports.extend(batch_reports)
+            if self.incremental_repair and batch.failed:
+                self.repair_routing(batch.failed)
+        return reports
+
+    def _available_sources(self) -> np.ndarray:
+        """next_hop이 있는 노드 ID 배열 (process_single_report의 소스 후보와 같은 순서)"""
+        return np.array(self.field.get_categories().members("routable"), dtype=np.int64)
+
     def _extend_communication_range(self):
         """통신 범위 확장"""
         extended_range = self.field.nodes[next(iter(self.field.nodes))].comm_range * 1.2
@@ -1,11 +1,17 @@
 from .BaseRoutingProtocol import BaseRoutingProtocol
+from .link_costs import get_link_cost
+import heapq
 import numpy as np
 
 
 class DijkstraRouting(BaseRoutingProtocol):
-    def __init__(self, field):
+    def __init__(self, field, link_cost="hop", packet_size: int = 32, incremental_repair: bool = False):
         super().__init__(field)
-        self.routing_table = {}  # 라우팅 테이블 초기화
+        self.routing_table = {}  # 라우팅 테이블 초기화 (node_id -> 다음 홉)
+        self.incremental_repair = incremental_repair
+        self.link_cost = link_cost  # 링크 비용 ("hop", "distance_squared", "residual_energy", "tx_energy" 또는 함수)
+        self.packet_size = packet_size  # 에너지 기반 링크 비용 계산용 패킷 크기 (bytes)
+        self.path_costs = {}  # node_id -> BS까지의 누적 링크 비용 (apply_dijkstra 결과)
 
     def setup_routing(self):
         """BS까지의 최단 경로 설정 - Dijkstra 알고리즘 기반"""
@@ -32,11 +38,17 @@ class DijkstraRouting(BaseRoutingProtocol):
         bs_x = self.field.base_station['x']
         bs_y = self.field.base_station['y']
 
-        # BS와 직접 연결 가능한 일반 노드들 처리
-        self._connect_direct_to_bs()
-            
-        # 나머지 노드들의 라우팅 설정 (Dijkstra 알고리즘 기반)
-        self._apply_dijkstra_routing()
+        if self.link_cost == "hop":
+            # BS와 직접 연결 가능한 일반 노드들 처리
+            self._connect_direct_to_bs()
+                
+            # 나머지 노드들의 라우팅 설정 (BFS, 최소 홉 수)
+            self._apply_dijkstra_routing()
+            self.path_costs = {node_id: float(node.hop_count) for node_id, node in self.field.nodes.items()
+                               if node.next_hop is not None}
+        else:
+            # 가중치 링크 비용 기반 Dijkstra
+            self.apply_dijkstra(self.link_cost)
 
         # 라우팅 테이블 업데이트
         for node_id, node in self.field.nodes.items():
@@ -63,35 +75,53 @@ class DijkstraRouting(BaseRoutingProtocol):
                     self.routing_table[node_id] = "BS"
 
     def _apply_dijkstra_routing(self):
-        """Dijkstra 알고리즘을 사용한 라우팅 적용"""
-        changes_made = True
-        while changes_made:
-            changes_made = False
-            for node_id, node in self.field.nodes.items():
-                if node.hop_count == float('inf'):
-                    # 이웃 노드들 중 최적의 next hop 찾기
-                    best_next_hop = None
-                    min_hop_count = float('inf')
-
-                    for neighbor_id in node.neighbor_nodes:
-                        neighbor = self.field.nodes[neighbor_id]
-                        # 에너지가 있는 이웃 노드만 고려
-                        if neighbor.hop_count < min_hop_count and neighbor.energy_level > 0:
-                            min_hop_count = neighbor.hop_count
-                            best_next_hop = neighbor_id
-
-                    if best_next_hop is not None:
-                        old_next_hop = node.next_hop
-                        node.next_hop = best_next_hop
-                        node.hop_count = min_hop_count + 1
-                        if old_next_hop != best_next_hop:
-                            if hasattr(node, 'route_changes'):
-                                node.route_changes += 1
-                            else:
-                                node.route_changes = 1
-                        # 라우팅 테이블 업데이트
-                        self.routing_table[node_id] = best_next_hop
-                        changes_made = True
+        """BS 인접 노드에서 시작하는 너비 우선 탐색으로 라우팅 트리 구성 - O(V+E)
+
+        _connect_direct_to_bs가 만든 홉 수 1인 노드들을 첫 프론티어로 삼아 한 층씩
+        넓혀 가며, 각 노드는 한 번만 방문한다. 다음 홉은 에너지가 있는 이웃 중
+        홉 수가 가장 작은 이웃이며, 같으면 neighbor_nodes 순서상 앞선 이웃을 고른다.
+        """
+        nodes = self.field.nodes
+        reverse_neighbors = self._reverse_neighbors()
+
+        hop = 1
+        frontier = [node_id for node_id, node in nodes.items() if node.hop_count == hop]
+        while frontier:
+            # 현재 층에서 중계 가능한 노드를 이웃으로 가진 미연결 노드 수집
+            candidates = []
+            discovered = set()
+            for node_id in frontier:
+                if nodes[node_id].energy_level <= 0:  # 에너지가 있는 이웃 노드만 중계
+                    continue
+                for candidate_id in reverse_neighbors[node_id]:
+                    if candidate_id not in discovered and nodes[candidate_id].hop_count == float('inf'):
+                        discovered.add(candidate_id)
+                        candidates.append(candidate_id)
+
+            next_frontier = []
+            for node_id in candidates:
+                node = nodes[node_id]
+                best_next_hop = None
+                for neighbor_id in node.neighbor_nodes:
+                    neighbor = nodes.get(neighbor_id)
+                    if neighbor is not None and neighbor.hop_count == hop and neighbor.energy_level > 0:
+                        best_next_hop = neighbor_id
+                        break
+
+                old_next_hop = node.next_hop
+                node.next_hop = best_next_hop
+                node.hop_count = hop + 1
+                if old_next_hop != best_next_hop:
+                    if hasattr(node, 'route_changes'):
+                        node.route_changes += 1
+                    else:
+                        node.route_changes = 1
+                # 라우팅 테이블 업데이트
+                self.routing_table[node_id] = best_next_hop
+                next_frontier.append(node_id)
+
+            frontier = next_frontier
+            hop += 1
 
     def _connect_nodes_iteratively(self, unconnected_nodes, connected_nodes):
         """연결되지 않은 노드들을 반복적으로 연결하는 확장 메서드"""
@@ -158,45 +188,257 @@ class DijkstraRouting(BaseRoutingProtocol):
                     # 에너지 소모 시뮬레이션
                     node.transmit_packet(32)  # 기본 패킷 크기로 에너지 소모 계산
 
-    def apply_dijkstra(self):
-        """Dijkstra 알고리즘 적용"""
-        # 초기화
-        distances = {node_id: float('inf') for node_id in self.field.nodes}
-        previous = {node_id: None for node_id in self.field.nodes}
-        unvisited = set(self.field.nodes.keys())
-        
-        # BS와 직접 연결된 노드들의 거리를 1로 설정
-        for node_id in self.routing_table:
-            if self.routing_table[node_id] == "BS":
-                distances[node_id] = 1
-                previous[node_id] = "BS"
-        
-        while unvisited:
-            # 가장 짧은 거리를 가진 노드 선택
-            current = min(unvisited, key=lambda x: distances[x])
-            if distances[current] == float('inf'):
-                break
-                
-            unvisited.remove(current)
-            
-            # 현재 노드의 이웃 노드들에 대해 거리 업데이트
-            for neighbor_id in self.field.nodes:
-                if neighbor_id != current and neighbor_id in unvisited:
-                    # 이웃 노드와의 거리 계산
-                    current_node = self.field.nodes[current]
-                    neighbor_node = self.field.nodes[neighbor_id]
-                    distance = np.sqrt((current_node.pos_x - neighbor_node.pos_x)**2 + 
-                                     (current_node.pos_y - neighbor_node.pos_y)**2)
-                    
-                    # 통신 범위 내에 있고, 에너지가 충분한 경우에만 연결 고려
-                    if (distance <= self.field.base_station['comm_range'] and 
-                        neighbor_node.energy_level > self.field.base_station['energy_threshold']):
-                        new_distance = distances[current] + 1
-                        if new_distance < distances[neighbor_id]:
-                            distances[neighbor_id] = new_distance
-                            previous[neighbor_id] = current
-        
+    def _reverse_neighbors(self):
+        """역방향 이웃: node_id -> node_id를 이웃으로 가진 노드들
+
+        통신 범위가 노드마다 다를 수 있으므로 이웃 관계는 방향성이 있으며,
+        노드 v의 다음 홉 후보는 v.neighbor_nodes에 있는 노드이다.
+        """
+        reverse_neighbors = {node_id: [] for node_id in self.field.nodes}
+        for node_id, node in self.field.nodes.items():
+            for neighbor_id in node.neighbor_nodes:
+                if neighbor_id in reverse_neighbors:
+                    reverse_neighbors[neighbor_id].append(node_id)
+        return reverse_neighbors
+
+    def apply_dijkstra(self, link_cost=None):
+        """이진 힙 기반 Dijkstra 알고리즘으로 라우팅 트리 구성 - O((V+E) log V)
+
+        BS와 직접 통신 가능한 일반 노드에서 시작하여 미리 계산된 이웃 리스트만 따라
+        BS까지의 누적 링크 비용이 가장 작은 다음 홉을 정한다. 잔여 에너지가
+        base_station['energy_threshold'] 이하인 노드는 중계하지 않는다.
+        누적 비용은 self.path_costs에 저장하고 반환한다.
+        """
+        cost_function = get_link_cost(self.link_cost if link_cost is None else link_cost)
+        nodes = self.field.nodes
+        bs_x = self.field.base_station['x']
+        bs_y = self.field.base_station['y']
+        bs_range = self.field.base_station.get('comm_range')
+        energy_threshold = self.field.base_station.get('energy_threshold', 0.0)
+        packet_size = self.packet_size
+
+        distances = {}  # node_id -> BS까지의 누적 비용
+        previous = {}  # node_id -> 다음 홉
+        hops = {}  # node_id -> BS까지의 홉 수
+        heap = []
+        order = 0  # 비용이 같을 때 먼저 넣은 항목 우선
+
+        # BS와 직접 연결 가능한 일반 노드들을 시작점으로 사용
+        for node_id, node in nodes.items():
+            if node.node_type == "normal" and node.energy_level > energy_threshold:
+                dist_to_bs = ((node.pos_x - bs_x)**2 + (node.pos_y - bs_y)**2)**0.5
+                if dist_to_bs <= (node.comm_range if bs_range is None else bs_range):
+                    distances[node_id] = cost_function(node, None, dist_to_bs, packet_size)
+                    previous[node_id] = "BS"
+                    hops[node_id] = 1
+                    heapq.heappush(heap, (distances[node_id], 1, order, node_id))
+                    order += 1
+
+        reverse_neighbors = self._reverse_neighbors()
+        visited = set()
+        while heap:
+            current_cost, current_hops, _, current_id = heapq.heappop(heap)
+            if current_id in visited:
+                continue
+            visited.add(current_id)
+
+            current = nodes[current_id]
+            if current.energy_level <= energy_threshold:  # 에너지가 있는 노드만 중계
+                continue
+
+            for sender_id in reverse_neighbors[current_id]:
+                if sender_id in visited:
+                    continue
+                sender = nodes[sender_id]
+                distance = ((sender.pos_x - current.pos_x)**2 + (sender.pos_y - current.pos_y)**2)**0.5
+                new_cost = current_cost + cost_function(sender, current, distance, packet_size)
+                if new_cost < distances.get(sender_id, float('inf')):
+                    distances[sender_id] = new_cost
+                    previous[sender_id] = current_id
+                    hops[sender_id] = current_hops + 1
+                    heapq.heappush(heap, (new_cost, current_hops + 1, order, sender_id))
+                    order += 1
+
         # 경로 설정
-        for node_id in self.field.nodes:
-            if node_id not in self.routing_table and previous[node_id] is not None:
-                self.routing_table[node_id] = previous[node_id]
\ No newline at end of file
+        for node_id, node in nodes.items():
+            old_next_hop = node.next_hop
+            node.next_hop = previous.get(node_id)
+            node.hop_count = hops.get(node_id, float('inf'))
+            if old_next_hop != node.next_hop and (node.next_hop is not None or old_next_hop is not None):
+                if hasattr(node, 'route_changes'):
+                    node.route_changes += 1
+                else:
+                    node.route_changes = 1
+            self.routing_table[node_id] = node.next_hop
+
+        self.path_costs = distances
+        return distances
+
+    @property
+    def children(self) -> dict:
+        """다음 홉 -> 그 노드를 다음 홉으로 쓰는 노드 ID 리스트 ("BS" 포함, self.tree 기준)"""
+        self.tree.sync()
+        return self.tree.children
+
+    def _can_relay(self, node) -> bool:
+        """활성 상태이고 에너지가 임계값보다 많은 노드만 중계 가능"""
+        energy_threshold = self.field.base_station.get('energy_threshold', 0.0)
+        return node.status == "active" and node.energy_level > energy_threshold
+
+    def repair_routing(self, node_ids):
+        """고장/탈취된 노드 아래의 서브트리만 떼어 내어 다시 연결 (증분 라우팅 복구)
+
+        node_ids의 노드 중 next_hop이 routing_table과 달라진 노드(공격으로 탈취된 노드 등)는
+        바뀐 경로를 그대로 트리에 반영하고, 그 밖의 노드는 더 이상 중계할 수 없는(죽은)
+        노드로 본다. 어느 경우든 그 노드 아래 서브트리의 노드만 살아 있는 이웃을 통해
+        현재 링크 비용 기준으로 다시 연결하므로, 비용은 네트워크 크기가 아니라
+        변경된 서브트리 크기에 비례한다. 다시 연결할 이웃이 없는 노드는 연결이 끊긴다.
+        next_hop이 실제로 바뀐 노드 ID 리스트를 반환하며, 이 노드들만 route_changes가 증가한다.
+        """
+        nodes = self.field.nodes
+        if not self.routing_table or self.field.base_station is None:
+            return []
+        cost_function = get_link_cost(self.link_cost)
+        hop_mode = self.link_cost == "hop"
+        bs_x = self.field.base_station['x']
+        bs_y = self.field.base_station['y']
+        bs_range = self.field.base_station.get('comm_range')
+        energy_threshold = self.field.base_station.get('energy_threshold', 0.0)
+        packet_size = self.packet_size
+        inf = float('inf')
+        changed = []
+
+        # 1. 외부에서 바뀐 경로 반영, 복구를 시작할 노드 수집
+        roots = []
+        rerouted = set()
+        for node_id in node_ids:
+            node = nodes.get(node_id)
+            if node is None or node_id in rerouted:
+                continue
+            roots.append(node_id)
+            old_parent = self.routing_table.get(node_id)
+            if node.next_hop == old_parent:
+                continue
+            rerouted.add(node_id)
+            self.routing_table[node_id] = node.next_hop
+            if hop_mode:
+                self.path_costs[node_id] = float(node.hop_count)
+            elif node.next_hop == "BS":
+                distance = ((node.pos_x - bs_x)**2 + (node.pos_y - bs_y)**2)**0.5
+                self.path_costs[node_id] = cost_function(node, None, distance, packet_size)
+            elif node.next_hop is not None and node.next_hop in nodes:
+                parent = nodes[node.next_hop]
+                distance = ((node.pos_x - parent.pos_x)**2 + (node.pos_y - parent.pos_y)**2)**0.5
+                self.path_costs[node_id] = (self.path_costs.get(node.next_hop, inf) +
+                                            cost_function(node, parent, distance, packet_size))
+            else:
+                self.path_costs.pop(node_id, None)
+            if hasattr(node, 'route_changes'):
+                node.route_changes += 1
+            else:
+                node.route_changes = 1
+            changed.append(node_id)
+
+        # 2. 서브트리 분리 (외부에서 경로가 바뀐 노드는 제외)
+        children = self.children
+        orphans = []
+        orphan_set = set()
+        stack = list(roots)
+        while stack:
+            for child_id in children.get(stack.pop(), ()):
+                if child_id not in orphan_set and child_id not in rerouted:
+                    orphan_set.add(child_id)
+                    orphans.append(child_id)
+                    stack.append(child_id)
+        if not orphans:
+            return changed
+        for node_id in orphans:
+            self.path_costs.pop(node_id, None)
+
+        # 3. 분리된 노드만 대상으로 하는 Dijkstra (경계의 살아 있는 이웃에서 시작)
+        def link(sender, receiver_id):
+            if receiver_id == "BS":
+                distance = ((sender.pos_x - bs_x)**2 + (sender.pos_y - bs_y)**2)**0.5
+                return cost_function(sender, None, distance, packet_size)
+            receiver = nodes[receiver_id]
+            distance = ((sender.pos_x - receiver.pos_x)**2 + (sender.pos_y - receiver.pos_y)**2)**0.5
+            return cost_function(sender, receiver, distance, packet_size)
+
+        def candidate_parents(node):
+            """(다음 홉 후보, 후보까지 확정된 누적 비용) - BS가 가장 먼저"""
+            if node.node_type == "normal" and node.energy_level > energy_threshold:
+                dist_to_bs = ((node.pos_x - bs_x)**2 + (node.pos_y - bs_y)**2)**0.5
+                if dist_to_bs <= (node.comm_range if bs_range is None else bs_range):
+                    yield "BS", 0.0
+            for neighbor_id in node.neighbor_nodes:
+                if neighbor_id in orphan_set:
+                    if neighbor_id in settled and self._can_relay(nodes[neighbor_id]):
+                        yield neighbor_id, settled[neighbor_id]
+                elif neighbor_id in self.path_costs and self._can_relay(nodes[neighbor_id]):
+                    yield neighbor_id, self.path_costs[neighbor_id]
+
+        reverse_neighbors = {node_id: [] for node_id in orphans}
+        for node_id in orphans:
+            for neighbor_id in nodes[node_id].neighbor_nodes:
+                if neighbor_id in orphan_set:
+                    reverse_neighbors[neighbor_id].append(node_id)
+
+        settled = {}  # node_id -> 확정된 누적 비용 (확정 순서 유지)
+        best = {}
+        heap = []
+        order = 0
+        for node_id in orphans:
+            node = nodes[node_id]
+            costs = [cost + link(node, parent_id) for parent_id, cost in candidate_parents(node)]
+            if costs:
+                best[node_id] = min(costs)
+                heapq.heappush(heap, (best[node_id], order, node_id))
+                order += 1
+        while heap:
+            cost, _, node_id = heapq.heappop(heap)
+            if node_id in settled or cost > best[node_id]:
+                continue
+            settled[node_id] = cost
+            node = nodes[node_id]
+            if not self._can_relay(node):
+                continue
+            for sender_id in reverse_neighbors[node_id]:
+                if sender_id in settled:
+                    continue
+                new_cost = cost + link(nodes[sender_id], node_id)
+                if new_cost < best.get(sender_id, inf):
+                    best[sender_id] = new_cost
+                    heapq.heappush(heap, (new_cost, order, sender_id))
+                    order += 1
+
+        # 4. 확정 순서대로 다음 홉 결정 (비용이 같으면 BS, 그다음 neighbor_nodes 순서)
+        assigned = {}
+        for node_id, cost in settled.items():
+            node = nodes[node_id]
+            for parent_id, parent_cost in candidate_parents(node):
+                if parent_id != node_id and parent_cost + link(node, parent_id) == cost and \
+                        (parent_id not in orphan_set or parent_id in assigned):
+                    assigned[node_id] = parent_id
+                    break
+        unreachable = [node_id for node_id in orphans if node_id not in assigned]
+        for node_id in list(assigned) + unreachable:
+            node = nodes[node_id]
+            old_next_hop = node.next_hop
+            new_next_hop = assigned.get(node_id)
+            node.next_hop = new_next_hop
+            if new_next_hop is None:
+                node.hop_count = inf
+            elif new_next_hop == "BS":
+                node.hop_count = 1
+            else:
+                node.hop_count = nodes[new_next_hop].hop_count + 1
+            if new_next_hop is not None:
+                self.path_costs[node_id] = settled[node_id]
+            self.routing_table[node_id] = new_next_hop
+            if old_next_hop != new_next_hop:
+                if hasattr(node, 'route_changes'):
+                    node.route_changes += 1
+                else:
+                    node.route_changes = 1
+                changed.append(node_id)
+        return changed
@@ -0,0 +1,161 @@
+import numpy as np
+from core.NodeStore import ACTIVE, NEXT_HOP_NONE
+from core.nodes.HardwareProfile import HardwareProfile
+
+
+class ReportBatch:
+    """여러 보고서를 한 번에 처리하는 벡터화 보고서 엔진
+
+    보고서 K개의 소스를 받아 라우팅 트리의 DFS 전위 순서 위에서 소스 수를 누적합하여
+    노드별 송신/수신 횟수를 구한다 (노드를 지나는 보고서 수 = 서브트리에서 출발한 보고서 수).
+    에너지 차감은 열 단위로 한 번에 적용하고, 배치 도중 에너지가 고갈되는 노드만
+    자신을 지나는 보고서를 순서대로 다시 따라가 고갈된 지점 이후의 송수신을 제외한다.
+
+    순차 처리(process_single_report)와 같은 규칙을 따른다:
+    비활성 노드는 송수신하지 않지만 패킷은 경로를 따라 계속 전달되며,
+    라우팅은 배치 도중 바뀌지 않는다 (증분 복구는 BaseRoutingProtocol에서 배치를 나눠 처리).
+    """
+
+    def __init__(self, routing, sources, packet_size: int = 32):
+        self.routing = routing
+        self.packet_size = packet_size
+        self.sources = np.asarray(sources, dtype=np.int64)
+
+        store = routing.field.nodes
+        data = store._data
+        self.order_ids, self.tout = routing.tree.subtree_arrays()
+        num_positions = len(self.order_ids)
+        self.rows = store.rows_of(self.order_ids)  # 전위 순서 위치 -> 저장소 행
+
+        # 보고서 소스의 전위 순서 위치와 위치별 누적 소스 수
+        position_of_row = np.full(store.size, -1, dtype=np.int64)
+        position_of_row[self.rows] = np.arange(num_positions)
+        self.source_positions = position_of_row[store.rows_of(self.sources)]
+        if (self.source_positions < 0).any():
+            raise KeyError("라우팅 트리에 없는 소스 노드가 있습니다")
+        self.own = np.bincount(self.source_positions, minlength=num_positions)
+        self.prefix = np.concatenate(([0], np.cumsum(self.own)))
+        self.by_position = np.argsort(self.source_positions, kind='stable')
+        traffic = self.prefix[self.tout] - self.prefix[:-1]
+
+        self.active = data['status'][self.rows] == ACTIVE
+        self.transmits = data['next_hop'][self.rows] != NEXT_HOP_NONE
+        profiles = data['profile'][self.rows]
+        self.tx_energy = HardwareProfile.column('tx_energy_per_byte')[profiles] * packet_size
+        self.rx_energy = HardwareProfile.column('rx_energy_per_byte')[profiles] * packet_size
+        self.initial_energy = data['energy_level'][self.rows].copy()
+
+        self.tx = np.where(self.active & self.transmits, traffic, 0)
+        self.rx = np.where(self.active, traffic - self.own, 0)
+        self.energy = self.initial_energy - (self.tx * self.tx_energy + self.rx * self.rx_energy)
+
+        # 배치 도중 에너지가 고갈되는 노드: 고갈된 보고서 이후의 송수신 제외
+        self.death_report = {}  # 전위 순서 위치 -> 에너지가 고갈된 보고서 번호
+        for position in np.flatnonzero(self.active & (traffic > 0) & (self.energy <= 0)).tolist():
+            self._replay(position)
+
+    def _reports_through(self, position: int) -> np.ndarray:
+        """position 노드를 지나는 보고서 번호 (보고서 순서)"""
+        start = self.prefix[position]
+        end = self.prefix[self.tout[position]]
+        return np.sort(self.by_position[start:end])
+
+    def _replay(self, position: int):
+        """position 노드의 송수신을 보고서 순서대로 따라가 에너지가 고갈되는 지점 확정"""
+        reports = self._reports_through(position)
+        # 보고서마다 수신(자신이 소스가 아니면) 후 송신(다음 홉이 있으면)
+        is_rx = self.source_positions[reports] != position
+        valid = np.column_stack((is_rx, np.full(len(reports), self.transmits[position]))).ravel()
+        event_is_tx = np.tile([False, True], len(reports))[valid]
+        event_reports = np.repeat(reports, 2)[valid]
+
+        tx = np.cumsum(event_is_tx)
+        rx = np.cumsum(~event_is_tx)
+        energy = self.initial_energy[position] - (tx * self.tx_energy[position] +
+                                                  rx * self.rx_energy[position])
+        dead = np.flatnonzero(energy <= 0)
+        if len(dead) == 0:
+            return
+        event = dead[0]
+        self.tx[position] = tx[event]
+        self.rx[position] = rx[event]
+        self.energy[position] = energy[event]
+        self.death_report[position] = int(event_reports[event])
+
+    @property
+    def first_death(self):
+        """처음으로 노드의 에너지가 고갈되는 보고서 번호 (없으면 None)"""
+        if not self.death_report:
+            return None
+        return min(self.death_report.values())
+
+    @property
+    def failed(self) -> list:
+        """배치 도중 에너지가 고갈된 노드 ID 리스트"""
+        return self.order_ids[sorted(self.death_report)].tolist()
+
+    def apply(self):
+        """노드별 송수신 횟수와 에너지 차감을 저장소 열에 한 번에 반영"""
+        store = self.routing.field.nodes
+        data = store._data
+        touched = np.flatnonzero((self.tx > 0) | (self.rx > 0))
+        rows = self.rows[touched]
+        tx = self.tx[touched]
+        rx = self.rx[touched]
+        tx_energy = tx * self.tx_energy[touched]
+        rx_energy = rx * self.rx_energy[touched]
+
+        if store.statistics is not None:
+            store.statistics.record_batch(rows, tx, rx, tx_energy + rx_energy, self.energy[touched])
+        data['tx_count'][rows] += tx
+        data['rx_count'][rows] += rx
+        data['consumed_energy_tx'][rows] += tx_energy
+        data['consumed_energy_rx'][rows] += rx_energy
+        data['total_consumed_energy'][rows] += tx_energy + rx_energy
+        data['energy_level'][rows] = self.energy[touched]
+
+        # 상태 변경은 노드 뷰를 통해 기록 (변경 알림 전달)
+        for node_id in self.failed:
+            store[node_id].status = "inactive"
+
+    def source_energies(self) -> np.ndarray:
+        """보고서마다 처리 직후 소스 노드의 에너지 (순차 처리의 'source_energy')"""
+        positions = self.source_positions
+        num_reports = len(positions)
+
+        # own_count[k]: k번째까지 같은 소스에서 출발한 보고서 수
+        own_count = np.empty(num_reports, dtype=np.int64)
+        sorted_positions = positions[self.by_position]
+        group_start = np.searchsorted(sorted_positions, sorted_positions)
+        own_count[self.by_position] = np.arange(num_reports) - group_start + 1
+
+        # through_count[k]: k번째까지 소스 노드를 지난 보고서 수 (서브트리가 자신뿐이면 own_count)
+        through_count = own_count.copy()
+        for position in np.unique(positions[self.tout[positions] > positions + 1]).tolist():
+            own_reports = self.by_position[self.prefix[position]:self.prefix[position + 1]]
+            through_count[own_reports] = np.searchsorted(
+                self._reports_through(position), own_reports, side='right')
+
+        tx = np.where(self.transmits[positions], through_count, 0)
+        rx = through_count - own_count
+        energies = self.initial_energy[positions] - (tx * self.tx_energy[positions] +
+                                                     rx * self.rx_energy[positions])
+        energies[~self.active[positions]] = self.initial_energy[positions][~self.active[positions]]
+        for position, report in self.death_report.items():
+            after = (positions == position) & (np.arange(num_reports) >= report)
+            energies[after] = self.energy[position]
+        return energies
+
+    def reports(self, first_report_id: int = 0) -> list:
+        """순차 처리와 같은 형식의 보고서 딕셔너리 리스트"""
+        get_path = self.routing.tree.get_path
+        energies = self.source_energies().tolist()
+        return [
+            {
+                'report_id': first_report_id + k + 1,
+                'source_node': source_id,
+                'path': get_path(source_id),
+                'source_energy': energies[k]
+            }
+            for k, source_id in enumerate(self.sources.tolist())
+        ]
@@ -0,0 +1,267 @@
+import numpy as np
+from core.NodeStore import NodeStore
+
+INF = float('inf')
+
+
+class RoutingTree:
+    """노드의 next_hop으로 이루어진 라우팅 트리 인덱스
+
+    parent(다음 홉), children(자식 리스트, "BS" 포함), depth(BS까지의 홉 수)와
+    DFS 전위 순서(subtree order)를 관리하며, BS까지의 정수 경로를 메모이즈한다.
+    Field.nodes가 NodeStore이면 next_hop 변경 알림을 받아 바뀐 노드만 표시해 두고,
+    다음 조회 때 바뀐 노드의 서브트리만 다시 계산한다.
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self.parent = {}  # node_id -> 다음 홉 (노드 ID, "BS" 또는 None)
+        self.children = {}  # 다음 홉 -> 자식 노드 ID 리스트
+        self.depth = {}  # node_id -> BS까지의 홉 수 (BS에 닿지 않으면 inf)
+        self._paths = {}  # node_id -> BS까지의 경로 튜플 (메모이즈)
+        self._dirty = set()  # next_hop이 바뀌어 다시 반영해야 하는 노드
+        self._order = None  # (전위 순서 리스트, tin, tout) - 트리가 바뀌면 None
+        self._arrays = None  # subtree_arrays() 캐시 (_order 기준)
+        self._nodes = None  # 알림을 구독 중인 노드 저장소
+        self._attach()
+
+    # ------------------------------------------------------------------
+    # 변경 추적
+    # ------------------------------------------------------------------
+    def _attach(self):
+        """현재 Field.nodes의 next_hop 변경 알림을 구독하고 전체 재구성 예약"""
+        if isinstance(self._nodes, NodeStore):
+            self._nodes.unobserve('next_hop', self.invalidate)
+        self._nodes = self.field.nodes
+        if isinstance(self._nodes, NodeStore):
+            self._nodes.observe('next_hop', self.invalidate)
+        self.rebuild()
+
+    def invalidate(self, node_id):
+        """node_id의 next_hop이 바뀌었음을 표시 (다음 조회 때 서브트리만 갱신)"""
+        self._dirty.add(node_id)
+
+    def rebuild(self):
+        """모든 노드의 next_hop으로 트리를 처음부터 다시 구성하도록 표시"""
+        self.parent = {}
+        self.children = {}
+        self.depth = {}
+        self._paths = {}
+        self._order = None
+        self._dirty = set(self.field.nodes.keys())
+
+    def sync(self):
+        """표시된 변경을 반영 - 비용은 바뀐 노드들의 서브트리 크기에 비례"""
+        if self.field.nodes is not self._nodes:
+            self._attach()
+        elif not isinstance(self._nodes, NodeStore):
+            # 변경 알림을 받을 수 없는 저장소는 매번 전체 재구성
+            self.rebuild()
+        if not self._dirty:
+            return
+
+        if len(self._dirty) * 2 >= len(self.parent) and self.parent:
+            # 절반 이상 바뀌면 자식 리스트를 고치는 것보다 처음부터 다시 구성하는 편이 빠름
+            self.rebuild()
+
+        nodes = self.field.nodes
+        parent = self.parent
+        children = self.children
+        dirty = self._dirty
+        self._dirty = set()
+        self._order = None
+
+        # 1. 바뀐 노드의 부모 포인터와 자식 리스트 갱신
+        roots = []
+        for node_id in dirty:
+            old_parent = parent.get(node_id)
+            node = nodes.get(node_id)
+            if node is None:
+                # 삭제된 노드: 자식들은 없는 노드를 가리키게 됨
+                if node_id in parent:
+                    self._unlink(node_id, old_parent)
+                    del parent[node_id]
+                    self.depth.pop(node_id, None)
+                roots.extend(children.get(node_id, ()))
+                continue
+            new_parent = node.next_hop
+            if node_id not in parent or old_parent != new_parent:
+                if node_id in parent:
+                    self._unlink(node_id, old_parent)
+                parent[node_id] = new_parent
+                if new_parent is not None:
+                    children.setdefault(new_parent, []).append(node_id)
+            roots.append(node_id)
+
+        # 2. 바뀐 노드들의 서브트리 수집
+        stale = set()
+        stack = roots
+        while stack:
+            node_id = stack.pop()
+            if node_id in stale or node_id not in parent:
+                continue
+            stale.add(node_id)
+            stack.extend(children.get(node_id, ()))
+
+        # 3. 서브트리의 depth 재계산 및 메모 경로 제거
+        depth = self.depth
+        resolved = set()
+        for node_id in stale:
+            self._paths.pop(node_id, None)
+            if node_id in resolved:
+                continue
+            chain = []
+            on_chain = set()
+            current = node_id
+            while True:
+                if current == "BS":
+                    base = 0
+                    break
+                if current is None or current not in parent:
+                    base = INF
+                    break
+                if current not in stale or current in resolved:
+                    base = depth[current]
+                    break
+                if current in on_chain:  # 순환 경로는 BS에 닿지 않음
+                    base = INF
+                    break
+                chain.append(current)
+                on_chain.add(current)
+                current = parent[current]
+            for chain_id in reversed(chain):
+                base = base + 1
+                depth[chain_id] = base
+                resolved.add(chain_id)
+
+    def _unlink(self, node_id, old_parent):
+        """old_parent의 자식 리스트에서 node_id 제거"""
+        if old_parent is None:
+            return
+        siblings = self.children.get(old_parent)
+        if siblings is not None:
+            try:
+                siblings.remove(node_id)
+            except ValueError:
+                return
+            if not siblings:
+                del self.children[old_parent]
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_children(self, node_id) -> list:
+        """node_id(또는 "BS")를 다음 홉으로 쓰는 노드 ID 리스트"""
+        self.sync()
+        return self.children.get(node_id, [])
+
+    def get_depth(self, node_id):
+        """BS까지의 홉 수 (BS에 닿지 않으면 inf)"""
+        self.sync()
+        return self.depth.get(node_id, INF)
+
+    def path_length(self, node_id) -> int:
+        """get_path(node_id)의 길이 - BS에 닿는 노드는 O(1)"""
+        self.sync()
+        depth = self.depth.get(node_id, INF)
+        if depth != INF:
+            return depth + 1
+        return len(self.get_path(node_id))
+
+    def get_path(self, node_id) -> list:
+        """node_id에서 BS까지의 경로 [node_id, ..., "BS"] (정수 노드 ID)
+
+        메모된 조상의 경로를 만나면 그 뒤는 재사용하므로 O(depth)이다.
+        BS에 닿지 않으면 next_hop이 끊긴 곳(또는 없는 노드 ID)에서 멈춘다.
+        """
+        self.sync()
+        if isinstance(node_id, np.integer):
+            node_id = int(node_id)  # np.random.choice 등으로 뽑은 ID
+        cached = self._paths.get(node_id)
+        if cached is not None:
+            return list(cached)
+
+        parent = self.parent
+        prefix = []
+        suffix = ()
+        seen = set()
+        current = node_id
+        while True:
+            cached = self._paths.get(current)
+            if cached is not None:
+                suffix = cached
+                break
+            prefix.append(current)
+            if current not in parent:
+                break
+            next_hop = parent[current]
+            if next_hop == "BS":
+                suffix = ("BS",)
+                break
+            if next_hop is None or next_hop in seen:
+                break
+            seen.add(current)
+            current = next_hop
+
+        path = tuple(prefix) + suffix
+        self._paths[node_id] = path
+        return list(path)
+
+    def subtree_order(self):
+        """DFS 전위 순서 (order, tin, tout)
+
+        order는 BS 트리부터 시작하는 노드 ID 리스트이고, node_id의 서브트리는
+        order[tin[node_id]:tout[node_id]]이다. 트리가 바뀌기 전까지 캐시된다.
+        """
+        self.sync()
+        if self._order is not None:
+            return self._order
+
+        order = []
+        tin = {}
+        tout = {}
+        roots = list(self.children.get("BS", ()))
+        roots += [node_id for node_id, next_hop in self.parent.items()
+                  if next_hop != "BS" and (next_hop is None or next_hop not in self.parent)]
+        for root in roots:
+            stack = [(root, False)]
+            while stack:
+                node_id, finished = stack.pop()
+                if finished:
+                    tout[node_id] = len(order)
+                    continue
+                tin[node_id] = len(order)
+                order.append(node_id)
+                stack.append((node_id, True))
+                for child_id in reversed(self.children.get(node_id, ())):
+                    stack.append((child_id, False))
+        self._order = (order, tin, tout)
+        return self._order
+
+    def get_subtree(self, node_id) -> list:
+        """node_id와 그 아래의 모든 노드 ID (전위 순서)"""
+        order, tin, tout = self.subtree_order()
+        if node_id not in tin:
+            return []
+        return order[tin[node_id]:tout[node_id]]
+
+    def is_in_subtree(self, node_id, ancestor_id) -> bool:
+        """node_id가 ancestor_id의 서브트리에 속하는지 여부 - O(1)"""
+        order, tin, tout = self.subtree_order()
+        if node_id not in tin or ancestor_id not in tin:
+            return False
+        return tin[ancestor_id] <= tin[node_id] < tout[ancestor_id]
+
+    def subtree_arrays(self):
+        """subtree_order()의 배열 버전 (order_ids, tout)
+
+        order_ids[i]는 전위 순서 i번째 노드 ID, tout[i]는 그 노드 서브트리의 끝 위치이므로
+        위치 i 노드의 서브트리는 order_ids[i:tout[i]]이다. 트리가 바뀌기 전까지 캐시된다.
+        """
+        order, tin, tout = self.subtree_order()
+        if self._arrays is None or self._arrays[0] is not order:
+            order_ids = np.array(order, dtype=np.int64)
+            tout_positions = np.fromiter((tout[node_id] for node_id in order),
+                                         dtype=np.int64, count=len(order))
+            self._arrays = (order, order_ids, tout_positions)
+        return self._arrays[1], self._arrays[2]
@@ -0,0 +1,51 @@
+"""Dijkstra 라우팅용 링크 비용 함수
+
+각 함수는 (sender, receiver, distance, packet_size)를 받아 sender가 receiver에게
+패킷을 보내는 링크의 비용을 반환한다. receiver가 None이면 BS로 보내는 링크이며,
+BS는 외부 전원을 쓰므로 수신 에너지 비용이 없다.
+"""
+
+
+def hop_cost(sender, receiver, distance: float, packet_size: int) -> float:
+    """링크마다 1 (최소 홉 수 경로)"""
+    return 1.0
+
+
+def distance_squared_cost(sender, receiver, distance: float, packet_size: int) -> float:
+    """링크 거리의 제곱 (자유 공간 증폭기 에너지 모델, 짧은 링크 선호)"""
+    return distance ** 2
+
+
+def residual_energy_cost(sender, receiver, distance: float, packet_size: int) -> float:
+    """중계 노드의 잔여 에너지 비율의 역수 (에너지가 적은 노드를 피함)"""
+    if receiver is None:
+        return 1.0
+    if receiver.energy_level <= 0:
+        return float('inf')
+    return receiver.initial_energy / receiver.energy_level
+
+
+def tx_energy_cost(sender, receiver, distance: float, packet_size: int) -> float:
+    """패킷 하나를 링크로 보낼 때 소모되는 송신 + 수신 에너지 (Joules)"""
+    energy = sender.tx_energy_per_byte * packet_size
+    if receiver is not None:
+        energy += receiver.rx_energy_per_byte * packet_size
+    return energy
+
+
+LINK_COSTS = {
+    "hop": hop_cost,
+    "distance_squared": distance_squared_cost,
+    "residual_energy": residual_energy_cost,
+    "tx_energy": tx_energy_cost,
+}
+
+
+def get_link_cost(link_cost):
+    """이름 또는 함수로 링크 비용 함수 반환"""
+    if callable(link_cost):
+        return link_cost
+    cost_function = LINK_COSTS.get(link_cost.lower())
+    if cost_function is None:
+        raise ValueError(f"알 수 없는 링크 비용: {link_cost} (사용 가능: {', '.join(LINK_COSTS)})")
+    return cost_function
@@ -3,12 +3,12 @@ from .DijkstraRouting import DijkstraRouting
 
 logger = logging.getLogger('wsn_simulation')
 
-def get_routing_protocol(protocol_name, wsn_field):
-    """선택한 라우팅 프로토콜을 반환"""
+def get_routing_protocol(protocol_name, wsn_field, link_cost="hop", incremental_repair=False):
+    """선택한 라우팅 프로토콜을 반환 (incremental_repair: 노드가 죽거나 탈취될 때 서브트리만 복구)"""
     protocol_name = protocol_name.lower()
     
     if protocol_name == "dijkstra":
-        return DijkstraRouting(wsn_field)
+        return DijkstraRouting(wsn_field, link_cost, incremental_repair=incremental_repair)
     # 나중에 다른 프로토콜을 추가할 수 있음
     # elif protocol_name == "aodv":
     #     return AODVRouting(wsn_field)
@@ -16,4 +16,4 @@ def get_routing_protocol(protocol_name, wsn_field):
     #     return LEACHRouting(wsn_field)
     else:
         logger.warning(f"Unknown routing protocol '{protocol_name}'. Using Dijkstra as default.")
-        return DijkstraRouting(wsn_field) 
\ No newline at end of file
+        return DijkstraRouting(wsn_field, link_cost, incremental_repair=incremental_repair) 
\ No newline at end of file
@@ -0,0 +1,21 @@
+# 파라미터 스윕 실행: python sweep.py (격자는 config.py의 SWEEP_GRID)
+
+import os
+import logging
+
+from utils.sweep import run_sweep
+from config import SWEEP_GRID, SWEEP_WORKERS, SWEEP_RESULTS_FILE, TOPOLOGY_CACHE_DIR
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    results_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results', SWEEP_RESULTS_FILE)
+    # 같은 시드/노드 수 조합은 토폴로지 캐시에서 배치와 라우팅을 재사용
+    base_params = {'TOPOLOGY_CACHE_DIR': TOPOLOGY_CACHE_DIR or 'topology_cache'}
+    rows = run_sweep(SWEEP_GRID, results_path, workers=SWEEP_WORKERS, base_params=base_params)
+    failed = [row for row in rows if row['status'] != 'ok']
+    logging.getLogger('wsn_simulation').info(
+        f"Sweep finished: {len(rows) - len(failed)} ok, {len(failed)} failed -> {results_path}")
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,22 @@ sys.path.insert(0, os.path.join(current_dir, 'test_attacks'))
 from test_Sinkhole import test_Sinkhole
 from test_Field import test_Field
 from test_MicazMotes import test_MicazMotes
+from test_SpatialGrid import test_SpatialGrid
+from test_NodeStore import test_NodeStore
+from test_HardwareProfile import test_HardwareProfile
+from test_RoutingTree import test_RoutingTree
+from test_NodeCategories import test_NodeCategories
+from test_MaliciousPathTree import test_MaliciousPathTree
+from test_NetworkStatistics import test_NetworkStatistics
+from test_TimeSeriesRecorder import test_TimeSeriesRecorder
+from test_Simulator import test_Simulator
+from test_TopologyCache import test_TopologyCache
 from test_Main import test_Main
+from test_Sweep import test_Sweep
+from test_Simulation import test_Simulation
+from test_DataHandler import test_DataHandler
+from test_ResultWriter import test_ResultWriter
+from test_Instrumentation import test_Instrumentation
 from test_core.test_DijkstraRouting import test_DijkstraRouting
 
 
@@ -31,6 +46,21 @@ def test_attacks():
     test_field = unittest.TestLoader().loadTestsFromTestCase(test_Field)
     test_micazmotes = unittest.TestLoader().loadTestsFromTestCase(test_MicazMotes)
     test_dijkstra = unittest.TestLoader().loadTestsFromTestCase(test_DijkstraRouting)
+    test_spatial_grid = unittest.TestLoader().loadTestsFromTestCase(test_SpatialGrid)
+    test_node_store = unittest.TestLoader().loadTestsFromTestCase(test_NodeStore)
+    test_hardware_profile = unittest.TestLoader().loadTestsFromTestCase(test_HardwareProfile)
+    test_routing_tree = unittest.TestLoader().loadTestsFromTestCase(test_RoutingTree)
+    test_node_categories = unittest.TestLoader().loadTestsFromTestCase(test_NodeCategories)
+    test_malicious_path_tree = unittest.TestLoader().loadTestsFromTestCase(test_MaliciousPathTree)
+    test_network_statistics = unittest.TestLoader().loadTestsFromTestCase(test_NetworkStatistics)
+    test_time_series_recorder = unittest.TestLoader().loadTestsFromTestCase(test_TimeSeriesRecorder)
+    test_simulator = unittest.TestLoader().loadTestsFromTestCase(test_Simulator)
+    test_topology_cache = unittest.TestLoader().loadTestsFromTestCase(test_TopologyCache)
+    test_sweep = unittest.TestLoader().loadTestsFromTestCase(test_Sweep)
+    test_simulation = unittest.TestLoader().loadTestsFromTestCase(test_Simulation)
+    test_data_handler = unittest.TestLoader().loadTestsFromTestCase(test_DataHandler)
+    test_result_writer = unittest.TestLoader().loadTestsFromTestCase(test_ResultWriter)
+    test_instrumentation = unittest.TestLoader().loadTestsFromTestCase(test_Instrumentation)
 
     allTests = unittest.TestSuite()
     
@@ -39,6 +69,21 @@ def test_attacks():
     allTests.addTest(test_field)
     allTests.addTest(test_micazmotes)
     allTests.addTest(test_dijkstra)
+    allTests.addTest(test_spatial_grid)
+    allTests.addTest(test_node_store)
+    allTests.addTest(test_hardware_profile)
+    allTests.addTest(test_routing_tree)
+    allTests.addTest(test_node_categories)
+    allTests.addTest(test_malicious_path_tree)
+    allTests.addTest(test_network_statistics)
+    allTests.addTest(test_time_series_recorder)
+    allTests.addTest(test_simulator)
+    allTests.addTest(test_topology_cache)
+    allTests.addTest(test_sweep)
+    allTests.addTest(test_simulation)
+    allTests.addTest(test_data_handler)
+    allTests.addTest(test_result_writer)
+    allTests.addTest(test_instrumentation)
 
     unittest.TextTestRunner(verbosity=2, failfast=True).run(allTests)
 
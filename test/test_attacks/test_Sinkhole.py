@@ -11,6 +11,9 @@ sys.path.insert(0, project_root)
 
 from core.Field import Field
 from attacks.Sinkhole import Sinkhole
+from attacks.network_attack_base import NetworkAttackBase
+from core.routing.DijkstraRouting import DijkstraRouting
+from core.Simulator import Simulator
 
 class test_Sinkhole(unittest.TestCase):
     """Sinkhole 클래스에 대한 유닛 테스트"""
@@ -63,6 +66,37 @@ class test_Sinkhole(unittest.TestCase):
             self.assertTrue(0 <= y <= self.field_size)
             self.assertGreaterEqual(node_count, 0)
     
+    def test_density_grid_regions(self):
+        """임의의 구역 수와 격자 크기의 밀도 격자가 노드별 직접 계산과 같은지 테스트"""
+        sinkhole = Sinkhole(self.field, attack_range=self.attack_range, grid_size=70, regions=(3, 2))
+        counts, cell_of_node, node_ids, _ = sinkhole.density_grid()
+        self.assertEqual(counts.shape, (6, 5, 8))  # 구역 333x500 -> 70m 칸 5 x 8
+        self.assertEqual(counts.sum(), self.num_nodes)
+
+        region_w, region_h = self.field_size / 3, self.field_size / 2
+        for node_id, cell in zip(node_ids, cell_of_node):
+            node = self.field.nodes[int(node_id)]
+            region_x, region_y = int(node.pos_x // region_w), int(node.pos_y // region_h)
+            region = (1 - region_y) * 3 + region_x
+            grid_x = int((node.pos_x - region_x * region_w) / 70)
+            grid_y = int((node.pos_y - region_y * region_h) / 70)
+            self.assertEqual(np.unravel_index(cell, counts.shape), (region, grid_x, grid_y))
+
+        best_locations = sinkhole.calculate_node_density()
+        self.assertTrue(set(best_locations) <= {f"Q{r}" for r in range(1, 7)})
+        for quadrant, (x, y, node_count) in best_locations.items():
+            self.assertGreater(node_count, 0)
+            self.assertLessEqual(node_count, counts[int(quadrant[1:]) - 1].max())
+
+    def test_top_k(self):
+        """argpartition 기반 상위 k개 선택이 안정 정렬 결과와 같은지 테스트"""
+        values = np.array([3, 7, 1, 7, 0, 5, 3, 7])
+        self.assertEqual(Sinkhole.top_k(values, 3).tolist(), [1, 3, 7])
+        self.assertEqual(Sinkhole.top_k(values, 5).tolist(), [1, 3, 7, 5, 0])
+        self.assertEqual(Sinkhole.top_k(values, 20).tolist(),
+                         np.argsort(-values, kind='stable').tolist())
+        self.assertEqual(len(Sinkhole.top_k(values, 0)), 0)
+
     def test_outside_attack(self):
         """외부 공격 테스트"""
         # 외부 공격 실행
@@ -108,6 +142,19 @@ class test_Sinkhole(unittest.TestCase):
             self.assertEqual(node.next_hop, attacker_id)
             self.assertEqual(node.hop_count, 1)
     
+    def test_get_nodes_in_range(self):
+        """공간 인덱스 기반 공격 범위 질의 테스트"""
+        self.sinkhole.launch_outside_attack(1)
+        attacker_id = self.sinkhole.malicious_nodes[0]
+        
+        in_range = set(self.sinkhole.get_nodes_in_range(attacker_id))
+        expected = {node_id for node_id in self.field.nodes
+                    if node_id != attacker_id and self.sinkhole.is_node_in_range(node_id, attacker_id)}
+        self.assertEqual(in_range, expected)
+        
+        # 새로 삽입된 공격자 노드도 인덱스에 포함되어야 함
+        self.assertIn(attacker_id, self.field.get_spatial_index())
+    
     def test_execute_attack_outside(self):
         """외부 공격 실행 테스트"""
         # 외부 공격 실행
@@ -118,6 +165,19 @@ class test_Sinkhole(unittest.TestCase):
         self.assertEqual(result, self.sinkhole.malicious_nodes)
         self.assertEqual(len(result), num_attackers)
     
+    def test_schedule_attack(self):
+        """공격이 예약된 시각에 사건으로 실행되는지 테스트"""
+        simulator = Simulator()
+        executed = []
+        self.sinkhole.schedule_attack(simulator, 5.0, lambda nodes: executed.append((simulator.now, nodes)),
+                                      num_attackers=1)
+        simulator.run(until=4.0)
+        self.assertEqual(self.sinkhole.malicious_nodes, [])
+
+        simulator.run()
+        self.assertEqual(executed, [(5.0, self.sinkhole.malicious_nodes)])
+        self.assertEqual(len(self.sinkhole.malicious_nodes), 1)
+    
     def test_attack_range_effect(self):
         """공격 범위 효과 테스트"""
         # 서로 다른 공격 범위로 테스트
@@ -203,6 +263,21 @@ class test_Sinkhole(unittest.TestCase):
         # 변환된 노드 수 확인
         self.assertEqual(converted_nodes, num_attackers)
 
+    def test_inside_attack_dense_candidates(self):
+        """내부 공격자 후보가 가장 밀도 높은 칸의 normal 노드인지 테스트"""
+        inside_sinkhole = Sinkhole(self.field, attack_type="inside", attack_range=self.attack_range)
+        counts, cell_of_node, node_ids, _ = inside_sinkhole.density_grid()
+        candidates = inside_sinkhole.dense_candidates(3)
+        self.assertGreaterEqual(len(candidates), 3)
+
+        # 후보는 밀도 순위 순서로 나열되며 첫 후보는 가장 밀도 높은 칸에 있음
+        cells = [cell_of_node[node_ids.tolist().index(node_id)] for node_id in candidates]
+        self.assertEqual(counts.ravel()[cells[0]], counts.max())
+        self.assertEqual(cells, sorted(cells, key=lambda cell: -counts.ravel()[cell]))
+
+        inside_sinkhole.launch_inside_attack(1)
+        self.assertIn(inside_sinkhole.malicious_nodes[0], candidates.tolist())
+
     def test_inside_attack_affected_nodes(self):
         """내부 공격의 영향을 받은 노드 테스트"""
         # 내부 공격용 Sinkhole 객체 생성
@@ -233,5 +308,68 @@ class test_Sinkhole(unittest.TestCase):
             self.assertEqual(node.next_hop, attacker_id)
             self.assertEqual(node.hop_count, 1)
 
+    def test_nearest_attacker_arrays(self):
+        """가장 가까운 공격자 배열의 전체 계산/증분 갱신과 탐욕 경로 테스트"""
+        self.sinkhole.execute_attack(num_attackers=1)
+        distance = self.sinkhole._nearest_attackers()
+        attacker_id = self.sinkhole.malicious_nodes[0]
+        attacker = self.field.nodes[attacker_id]
+        for node_id, node in self.field.nodes.items():
+            self.assertAlmostEqual(distance[node_id], np.hypot(node.pos_x - attacker.pos_x,
+                                                               node.pos_y - attacker.pos_y))
+            self.assertEqual(self.sinkhole.nearest_attacker_id[node_id], attacker_id)
+        self.assertEqual(distance[0], np.inf)  # 없는 ID
+
+        # 내부 공격자 추가는 증분 갱신 (다시 계산한 결과와 같음)
+        new_attacker = next(node_id for node_id, node in self.field.nodes.items()
+                            if node.node_type == "normal" and distance[node_id] > 500)
+        self.field.nodes[new_attacker].node_type = "malicious_inside"
+        self.sinkhole.add_malicious_node(new_attacker)
+        updated = self.sinkhole.nearest_attacker_distance.copy()
+        updated_ids = self.sinkhole.nearest_attacker_id.copy()
+        self.assertEqual(updated[new_attacker], 0.0)
+        self.sinkhole.nearest_attacker_distance = None
+        np.testing.assert_allclose(self.sinkhole._nearest_attackers(), updated)
+        np.testing.assert_array_equal(self.sinkhole.nearest_attacker_id, updated_ids)
+
+        # 탐욕 경로: 매 홉 방문하지 않은 이웃 중 공격자에 가장 가까운 이웃으로 이동
+        paths = [NetworkAttackBase.get_malicious_node_path(self.sinkhole, source_id)
+                 for source_id, node in self.field.nodes.items() if node.node_type == "normal"]
+        paths = [path for path in paths if path is not None]
+        self.assertTrue(len(paths) > 0)
+        for path in paths:
+            self.assertEqual(len(set(path)), len(path))
+            self.assertIn(self.field.nodes[path[-1]].node_type, ("malicious_inside", "malicious_outside"))
+            for current_id, next_id in zip(path[:-2], path[1:-1]):
+                candidates = [n_id for n_id in self.field.nodes[current_id].neighbor_nodes
+                              if n_id not in path[:path.index(current_id) + 1]]
+                self.assertEqual(updated[next_id], min(updated[n_id] for n_id in candidates))
+
+    def test_repair_after_hijack(self):
+        """공격으로 탈취된 노드 아래의 라우팅이 증분 복구되는지 테스트"""
+        routing = DijkstraRouting(self.field, incremental_repair=True)
+        routing.setup_routing()
+        sinkhole = Sinkhole(self.field, attack_type="outside",
+                            attack_range=self.attack_range, routing=routing)
+        attacker_id = sinkhole.execute_attack(num_attackers=1)[0]
+
+        # 탈취된 노드는 공격자를 다음 홉으로 사용
+        hijacked = [node_id for node_id, node in self.field.nodes.items()
+                    if node.node_type == "affected"]
+        self.assertTrue(len(hijacked) > 0)
+        for node_id in hijacked:
+            self.assertEqual(routing.routing_table[node_id], attacker_id)
+            self.assertIn(node_id, routing.children[attacker_id])
+
+        # 나머지 노드의 홉 수는 다음 홉의 홉 수 + 1로 일관됨
+        for node_id, node in self.field.nodes.items():
+            self.assertEqual(routing.routing_table[node_id], node.next_hop)
+            if node_id in hijacked or node_id == attacker_id or node.next_hop is None:
+                continue
+            if node.next_hop == "BS":
+                self.assertEqual(node.hop_count, 1)
+            else:
+                self.assertEqual(node.hop_count, self.field.nodes[node.next_hop].hop_count + 1)
+
 # if __name__ == '__main__':
 #     unittest.main()
\ No newline at end of file
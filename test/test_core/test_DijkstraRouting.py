@@ -103,6 +103,210 @@ class test_DijkstraRouting(unittest.TestCase):
             if node.energy_level == 0:
                 self.assertNotEqual(self.routing.routing_table[node_id], "BS")
     
+    def test_hop_counts_are_shortest(self):
+        """BFS 라우팅 트리의 홉 수가 기준 최단 경로 계산과 같은지 테스트"""
+        np.random.seed(7)
+        field = Field(self.field_size, self.field_size)
+        field.deploy_nodes(400)
+        # 노드마다 다른 통신 범위와 일부 에너지 고갈 노드
+        for node in field.nodes.values():
+            node.comm_range = np.random.uniform(60, 120)
+            if np.random.rand() < 0.1:
+                node.energy_level = 0
+        field.set_base_station(*self.bs_position)
+        field.find_neighbors()
+        routing = DijkstraRouting(field)
+        routing.setup_routing()
+
+        # 기준: BS 인접 노드에서 시작하는 단순 BFS (에너지가 있는 이웃만 중계)
+        expected = {}
+        queue = []
+        for node_id, node in field.nodes.items():
+            if (node.energy_level > 0 and
+                    np.sqrt((node.pos_x - 500)**2 + (node.pos_y - 500)**2) <= node.comm_range):
+                expected[node_id] = 1
+                queue.append(node_id)
+        while queue:
+            next_queue = []
+            for node_id, node in field.nodes.items():
+                if node_id in expected:
+                    continue
+                hops = [expected[n] for n in node.neighbor_nodes
+                        if n in expected and field.nodes[n].energy_level > 0]
+                if hops:
+                    next_queue.append((node_id, min(hops) + 1))
+            expected.update(next_queue)
+            queue = next_queue
+
+        for node_id, node in field.nodes.items():
+            self.assertEqual(node.hop_count, expected.get(node_id, float('inf')))
+            if node.hop_count > 1 and node.hop_count != float('inf'):
+                parent = field.nodes[node.next_hop]
+                self.assertIn(node.next_hop, node.neighbor_nodes)
+                self.assertEqual(parent.hop_count, node.hop_count - 1)
+                self.assertGreater(parent.energy_level, 0)
+            self.assertEqual(routing.routing_table[node_id], node.next_hop)
+
+        # 라우팅 재설정 시 route_changes 기록 유지
+        changes = {node_id: node.route_changes for node_id, node in field.nodes.items()}
+        routing.setup_routing()
+        for node_id, node in field.nodes.items():
+            increment = 2 if node.next_hop is not None else 0
+            self.assertEqual(node.route_changes, changes[node_id] + increment)
+    
+    def test_weighted_link_costs(self):
+        """링크 비용별 힙 기반 Dijkstra가 기준 계산과 같은지 테스트"""
+        self.assertEqual(self.field.base_station['energy_threshold'], 0.0)
+        self.assertIsNone(self.field.base_station['comm_range'])
+        for node in self.field.nodes.values():
+            node.energy_level = np.random.uniform(0.1, 1.0)
+
+        # hop 비용 Dijkstra는 BFS와 같은 홉 수
+        self.routing.setup_routing()
+        bfs_hops = {node_id: node.hop_count for node_id, node in self.field.nodes.items()}
+        DijkstraRouting(self.field, "hop").apply_dijkstra()
+        for node_id, node in self.field.nodes.items():
+            self.assertEqual(node.hop_count, bfs_hops[node_id])
+
+        # distance_squared: 기준 O(n²) Dijkstra와 누적 비용 비교
+        routing = DijkstraRouting(self.field, "distance_squared")
+        routing.setup_routing()
+        expected = {}
+        for node_id, node in self.field.nodes.items():
+            distance = np.sqrt((node.pos_x - 500)**2 + (node.pos_y - 500)**2)
+            if distance <= node.comm_range:
+                expected[node_id] = distance**2
+        done = set()
+        while len(done) < len(expected):
+            cost, current_id = min((c, i) for i, c in expected.items() if i not in done)
+            done.add(current_id)
+            current = self.field.nodes[current_id]
+            for node_id, node in self.field.nodes.items():
+                if current_id in node.neighbor_nodes and node_id not in done:
+                    distance = np.sqrt((node.pos_x - current.pos_x)**2 + (node.pos_y - current.pos_y)**2)
+                    if cost + distance**2 < expected.get(node_id, float('inf')):
+                        expected[node_id] = cost + distance**2
+        self.assertEqual(set(routing.path_costs), set(expected))
+        for node_id, cost in expected.items():
+            self.assertAlmostEqual(routing.path_costs[node_id], cost)
+            node = self.field.nodes[node_id]
+            self.assertEqual(routing.routing_table[node_id], node.next_hop)
+            if node.next_hop != "BS":
+                self.assertIn(node.next_hop, node.neighbor_nodes)
+
+        # residual_energy: 에너지 임계값 이하 노드는 중계하지 않음
+        self.field.set_base_station(*self.bs_position, energy_threshold=0.5)
+        routing = DijkstraRouting(self.field, "residual_energy")
+        routing.setup_routing()
+        for node in self.field.nodes.values():
+            if node.next_hop not in (None, "BS"):
+                self.assertGreater(self.field.nodes[node.next_hop].energy_level, 0.5)
+
+        with self.assertRaises(ValueError):
+            DijkstraRouting(self.field, "unknown").setup_routing()
+    
+    def test_incremental_repair(self):
+        """노드가 죽었을 때 서브트리만 다시 연결되는지 테스트"""
+        self.field.deploy_nodes(400)
+        self.field.find_neighbors()
+        routing = DijkstraRouting(self.field, incremental_repair=True)
+        routing.setup_routing()
+        changes = {node_id: node.route_changes for node_id, node in self.field.nodes.items()}
+
+        # 자식이 가장 많은 중계 노드를 고장 처리
+        failed_id = max((node_id for node_id in routing.children if node_id != "BS"),
+                        key=lambda node_id: len(routing.children[node_id]))
+        old_children = list(routing.children[failed_id])
+        failed = self.field.nodes[failed_id]
+        failed.energy_level = 0
+        failed.status = "inactive"
+        changed = routing.repair_routing([failed_id])
+
+        # 고장 노드를 다음 홉으로 쓰는 노드가 없어야 함
+        self.assertNotIn(failed_id, routing.children)
+        for node_id in old_children:
+            self.assertNotEqual(self.field.nodes[node_id].next_hop, failed_id)
+        # 다음 홉이 실제로 바뀐 노드만 route_changes 증가
+        for node_id, node in self.field.nodes.items():
+            expected = changes[node_id] + (1 if node_id in changed else 0)
+            self.assertEqual(node.route_changes, expected)
+            self.assertEqual(routing.routing_table[node_id], node.next_hop)
+
+        # 처음부터 다시 계산한 라우팅과 홉 수가 같아야 함
+        repaired = {node_id: node.hop_count for node_id, node in self.field.nodes.items()}
+        DijkstraRouting(self.field).setup_routing()
+        for node_id, node in self.field.nodes.items():
+            if node_id != failed_id:
+                self.assertEqual(repaired[node_id], node.hop_count)
+
+    def test_repair_during_reports(self):
+        """보고서 전송 중 에너지가 고갈된 노드가 자동으로 복구되는지 테스트"""
+        self.field.deploy_nodes(400)
+        self.field.find_neighbors()
+        routing = DijkstraRouting(self.field, incremental_repair=True)
+        routing.setup_routing()
+        relay_id = next(node_id for node_id in routing.children
+                        if node_id != "BS" and self.field.nodes[node_id].next_hop != "BS")
+        child_id = routing.children[relay_id][0]
+        self.field.nodes[relay_id].energy_level = 1e-6  # 다음 수신에서 고갈
+
+        routing.process_single_report(0, source_node=child_id)
+        self.assertEqual(self.field.nodes[relay_id].status, "inactive")
+        self.assertNotEqual(self.field.nodes[child_id].next_hop, relay_id)
+        self.assertNotIn(relay_id, routing.children)
+    
+    def _run_reports(self, batch, incremental_repair=False, low_energy_nodes=0):
+        """같은 시드로 필드를 만들어 보고서를 순차/배치로 처리하고 (필드, 보고서) 반환"""
+        np.random.seed(3)
+        field = Field(self.field_size, self.field_size)
+        field.deploy_nodes(400)
+        field.set_base_station(*self.bs_position)
+        field.find_neighbors()
+        routing = DijkstraRouting(field, incremental_repair=incremental_repair)
+        routing.setup_routing()
+        # BS에 직접 연결된 중계 노드 몇 개는 배치 도중 에너지가 고갈되도록 설정
+        for node_id in routing.children["BS"][:low_energy_nodes]:
+            field.nodes[node_id].energy_level = 0.004
+
+        np.random.seed(11)
+        reports = routing.simulate_reports(2000, batch=batch)
+        return field, reports
+
+    def _assert_same_reports(self, incremental_repair, low_energy_nodes):
+        sequential_field, sequential = self._run_reports(False, incremental_repair, low_energy_nodes)
+        batch_field, batch = self._run_reports(True, incremental_repair, low_energy_nodes)
+
+        self.assertEqual(len(sequential), len(batch))
+        for expected, actual in zip(sequential, batch):
+            self.assertEqual(expected['report_id'], actual['report_id'])
+            self.assertEqual(expected['source_node'], actual['source_node'])
+            self.assertEqual(expected['path'], actual['path'])
+            self.assertAlmostEqual(expected['source_energy'], actual['source_energy'], places=10)
+        for node_id, node in sequential_field.nodes.items():
+            batch_node = batch_field.nodes[node_id]
+            self.assertEqual(node.status, batch_node.status)
+            self.assertEqual(node.next_hop, batch_node.next_hop)
+            self.assertEqual(node.tx_count, batch_node.tx_count)
+            self.assertEqual(node.rx_count, batch_node.rx_count)
+            self.assertAlmostEqual(node.energy_level, batch_node.energy_level, places=10)
+            self.assertAlmostEqual(node.total_consumed_energy, batch_node.total_consumed_energy, places=10)
+        return batch_field
+
+    def test_batch_reports(self):
+        """배치 보고서 처리가 순차 처리와 같은 결과를 내는지 테스트"""
+        field = self._assert_same_reports(incremental_repair=False, low_energy_nodes=0)
+        self.assertTrue(all(node.status == "active" for node in field.nodes.values()))
+
+    def test_batch_reports_with_deaths(self):
+        """배치 도중 노드가 죽을 때 고갈 이후의 송수신이 제외되는지 테스트"""
+        field = self._assert_same_reports(incremental_repair=False, low_energy_nodes=3)
+        self.assertEqual(sum(node.status == "inactive" for node in field.nodes.values()), 3)
+
+        field = self._assert_same_reports(incremental_repair=True, low_energy_nodes=3)
+        for node in field.nodes.values():
+            if node.next_hop not in (None, "BS"):
+                self.assertEqual(field.nodes[node.next_hop].status, "active")
+
     # def test_connect_nodes_iteratively(self):
     #     """반복적 노드 연결 테스트"""
     #     # 일부 노드의 통신 범위를 줄임
@@ -44,8 +44,8 @@ class test_Field(unittest.TestCase):
         
         :작성일: 2025.03.12
         """
-        # numpy.random.uniform 모의 설정
-        mock_uniform.side_effect = [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
+        # numpy.random.uniform 모의 설정 (모든 노드의 (x, y)를 한 번에 생성)
+        mock_uniform.return_value = np.array([[10.0, 20.0], [30.0, 40.0], [50.0, 60.0]])
         
         # 노드 배치
         self.field.deploy_nodes(3)
@@ -69,6 +69,52 @@ class test_Field(unittest.TestCase):
         # MicazMotes 타입 확인
         for node in self.field.nodes.values():
             self.assertIsInstance(node, MicazMotes)
+        mock_uniform.assert_called_once()
+
+    def test_deploy_distributions(self):
+        """
+        배치 분포별 노드 배치 기능을 테스트합니다.
+        
+        이 테스트는 모든 분포가 필드 안에 노드를 배치하고, 같은 시드에서 같은
+        배치를 만들며, 분포별 특성(최소 간격, 띠 폭)을 지키는지 확인합니다.
+        """
+        for distribution in ["uniform", "grid", "poisson_disk", "cluster", "corridor"]:
+            np.random.seed(42)
+            field = Field(100.0, 100.0)
+            field.deploy_nodes(200, distribution)
+            np.random.seed(42)
+            again = Field(100.0, 100.0)
+            again.deploy_nodes(200, distribution)
+
+            self.assertEqual(len(field.nodes), 200)
+            self.assertTrue(np.all((field.nodes.pos_x >= 0) & (field.nodes.pos_x <= 100.0)))
+            self.assertTrue(np.all((field.nodes.pos_y >= 0) & (field.nodes.pos_y <= 100.0)))
+            np.testing.assert_array_equal(field.nodes.pos_x, again.nodes.pos_x)
+            np.testing.assert_array_equal(field.nodes.pos_y, again.nodes.pos_y)
+
+            # 일괄 생성된 노드도 개별 생성한 노드와 같은 초기 상태
+            node = field.nodes[200]
+            self.assertEqual(node.energy_level, 1)
+            self.assertEqual(node.comm_range, 100)
+            self.assertEqual(node.status, "active")
+            self.assertIsNone(node.next_hop)
+            self.assertEqual(node.neighbor_nodes, [])
+
+        # Poisson-disk: 모든 노드 쌍이 최소 간격 이상
+        np.random.seed(1)
+        self.field.deploy_nodes(100, "poisson_disk", min_distance=5.0)
+        xs, ys = self.field.nodes.pos_x, self.field.nodes.pos_y
+        distance = np.sqrt((xs[:, None] - xs[None, :])**2 + (ys[:, None] - ys[None, :])**2)
+        np.fill_diagonal(distance, np.inf)
+        self.assertGreaterEqual(distance.min(), 5.0)
+
+        # corridor: 지정한 띠 안에만 배치
+        field = Field(100.0, 100.0)
+        field.deploy_nodes(100, "corridor", corridor_width=10.0, center=30.0)
+        self.assertTrue(np.all((field.nodes.pos_y >= 25.0) & (field.nodes.pos_y <= 35.0)))
+
+        with self.assertRaises(ValueError):
+            field.deploy_nodes(10, "unknown")
 
     def test_set_base_station(self):
         """
@@ -89,7 +135,8 @@ class test_Field(unittest.TestCase):
         self.field.set_base_station(50.0, 50.0)
         
         # 베이스 스테이션 위치 확인
-        self.assertEqual(self.field.base_station, {"x": 50.0, "y": 50.0})
+        self.assertEqual(self.field.base_station, {"x": 50.0, "y": 50.0,
+                                                   "comm_range": None, "energy_threshold": 0.0})
         
         # 각 노드에서 베이스 스테이션까지 거리 계산 호출 확인
         node1.calculate_distance_to_bs.assert_called_once_with(50.0, 50.0)
@@ -135,6 +182,49 @@ class test_Field(unittest.TestCase):
         else:
             self.assertNotIn(1, node2.neighbor_nodes)
 
+    def test_spatial_queries(self):
+        """
+        공간 질의(query_radius, nearest) 기능을 테스트합니다.
+        
+        이 테스트는 add_node 또는 nodes 딕셔너리에 직접 추가된 노드도
+        공간 인덱스 질의 결과에 반영되는지 확인합니다.
+        """
+        self.field.nodes = {1: MicazMotes(1, 10.0, 10.0), 2: MicazMotes(2, 40.0, 10.0)}
+        self.field.find_neighbors()
+        self.assertEqual(sorted(self.field.query_radius(10.0, 10.0, 35.0)), [1, 2])
+
+        # add_node로 추가된 노드
+        self.field.add_node(MicazMotes(3, 12.0, 10.0))
+        self.assertEqual([node_id for node_id, _ in self.field.nearest(10.5, 10.0, k=2)], [1, 3])
+        self.assertEqual(self.field.nearest(13.0, 10.0, k=1)[0][0], 3)
+
+        # 딕셔너리에 직접 추가된 노드
+        self.field.nodes[4] = MicazMotes(4, 90.0, 90.0)
+        self.assertEqual(self.field.query_radius(90.0, 90.0, 1.0), [4])
+
+        # predicate는 노드 객체를 받음
+        self.field.nodes[2].node_type = "malicious_outside"
+        nearest = self.field.nearest(10.0, 10.0, k=1,
+                                     predicate=lambda node: node.node_type == "malicious_outside")
+        self.assertEqual(nearest[0][0], 2)
+        self.assertAlmostEqual(nearest[0][1], 30.0)
+
+    def test_spatial_index_after_redeploy(self):
+        """
+        같은 수의 노드를 다시 배치하면 공간 인덱스가 새 위치로 다시 구성되는지 테스트합니다.
+        """
+        np.random.seed(7)
+        self.field.deploy_nodes(50)
+        self.field.find_neighbors()
+        self.field.deploy_nodes(50)
+        self.assertIsNone(self.field.spatial_grid)
+
+        expected = sorted(node_id for node_id, node in self.field.nodes.items()
+                          if np.hypot(node.pos_x - 50.0, node.pos_y - 50.0) <= 10.0)
+        self.assertEqual(sorted(self.field.query_radius(50.0, 50.0, 10.0)), expected)
+        for node_id, node in self.field.nodes.items():
+            self.assertEqual(self.field.nearest(node.pos_x, node.pos_y, k=1)[0][0], node_id)
+
     def test_find_unconnected_nodes(self):
         """
         연결되지 않은 노드 찾기 기능을 테스트합니다.
@@ -205,6 +295,75 @@ class test_Field(unittest.TestCase):
         self.assertEqual(stats["active_nodes"], 2)
         self.assertEqual(stats["average_neighbors"], (2 + 1 + 1) / 3)
 
+    def test_find_path(self):
+        """
+        경로 탐색(find_path) 기능을 테스트합니다.
+        
+        이 테스트는 단방향/양방향 BFS가 같은 최단 홉 수를 찾고, BS 가상 정점으로의 경로와
+        LRU 캐시, 토폴로지 변경 시 캐시 무효화가 올바르게 동작하는지 확인합니다.
+        """
+        np.random.seed(7)
+        field = Field(1000.0, 1000.0)
+        field.deploy_nodes(300)
+        field.set_base_station(500.0, 500.0)
+        field.find_neighbors()
+
+        def hop_counts(source_id):
+            """이웃 리스트를 따라 직접 구한 홉 수 (BS는 BS 통신 범위 안의 노드 다음)"""
+            depth = {source_id: 0}
+            frontier = [source_id]
+            while frontier:
+                next_frontier = []
+                for node_id in frontier:
+                    node = field.nodes[node_id]
+                    links = list(node.neighbor_nodes)
+                    if node.distance_to_bs <= node.comm_range:
+                        links.append("BS")
+                    for other_id in links:
+                        if other_id not in depth:
+                            depth[other_id] = depth[node_id] + 1
+                            if other_id != "BS":
+                                next_frontier.append(other_id)
+                frontier = next_frontier
+            return depth
+
+        for source_id in [1, 50, 123]:
+            depth = hop_counts(source_id)
+            for target_id in [2, 77, 299, "BS"]:
+                if target_id not in depth:
+                    self.assertIsNone(field.find_path(source_id, target_id))
+                    self.assertIsNone(field.find_path(source_id, target_id, bidirectional=True))
+                    continue
+                for bidirectional in (False, True):
+                    path = field.find_path(source_id, target_id, bidirectional=bidirectional)
+                    self.assertEqual((path[0], path[-1]), (source_id, target_id))
+                    self.assertEqual(len(path) - 1, depth[target_id])
+                    for sender, receiver in zip(path, path[1:]):
+                        if receiver == "BS":
+                            self.assertLessEqual(field.nodes[sender].distance_to_bs,
+                                                 field.nodes[sender].comm_range)
+                        else:
+                            self.assertIn(receiver, field.nodes[sender].neighbor_nodes)
+        self.assertEqual(field.find_path(5, 5), [5])
+        self.assertIsNone(field.find_path(10 ** 6, "BS"))
+
+        # 캐시된 결과는 복사본으로 반환되고, 토폴로지가 바뀌면 캐시를 비움
+        path = field.find_path(1, "BS")
+        path.append("changed")
+        self.assertEqual(field.find_path(1, "BS")[-1], "BS")
+        self.assertIn((1, "BS", False), field._path_cache)
+        field.set_base_station(field.nodes[1].pos_x, field.nodes[1].pos_y)
+        self.assertEqual(len(field._path_cache), 0)
+        self.assertEqual(field.find_path(1, "BS"), [1, "BS"])
+
+        # LRU: 가장 오래 쓰지 않은 항목부터 삭제
+        field.PATH_CACHE_SIZE = 2
+        field.find_path(1, 2)
+        field.find_path(1, 3)
+        field.find_path(1, 2)
+        field.find_path(1, 4)
+        self.assertEqual(list(field._path_cache), [(1, 2, False), (1, 4, False)])
+
     def test_create_node(self):
         """
         노드 생성 기능을 테스트합니다.
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from core.nodes.MicazMotes import MicazMotes
+from core.nodes.HardwareProfile import HardwareProfile, MICAZ_PROFILE
+
+class test_HardwareProfile(unittest.TestCase):
+    """HardwareProfile 클래스에 대한 유닛 테스트"""
+
+    def test_micaz_profile(self):
+        """MicaZ 프로필 상수 테스트"""
+        self.assertEqual(MICAZ_PROFILE.index, 0)
+        self.assertIs(HardwareProfile.registry[0], MICAZ_PROFILE)
+        self.assertEqual(MICAZ_PROFILE.comm_range, 100)
+        self.assertEqual(MICAZ_PROFILE.data_rate, 250000)
+        self.assertEqual(MICAZ_PROFILE.initial_energy, 1)
+
+    def test_shared_by_nodes(self):
+        """모든 노드가 하나의 프로필 객체를 공유하는지 테스트"""
+        node1 = MicazMotes(1, 0.0, 0.0)
+        node2 = MicazMotes(2, 10.0, 10.0)
+        self.assertIs(node1.profile, node2.profile)
+        self.assertEqual(node1.tx_energy_per_byte, MICAZ_PROFILE.tx_energy_per_byte)
+
+        # 프로필 상수는 노드 단위로 바꿀 수 없음
+        with self.assertRaises(AttributeError):
+            node1.voltage = 5.0
+
+    def test_custom_profile(self):
+        """별도 프로필을 가진 노드 테스트"""
+        long_range = HardwareProfile("long_range", comm_range=250, data_rate=125000,
+                                     voltage=3.3, tx_current=30e-3, rx_current=20e-3,
+                                     tx_energy_per_byte=40e-6, rx_energy_per_byte=20e-6,
+                                     initial_energy=2)
+        node = MicazMotes(1, 0.0, 0.0, profile=long_range)
+        self.assertIs(node.profile, long_range)
+        self.assertEqual(node.comm_range, 250)
+        self.assertEqual(node.energy_level, 2)
+        self.assertEqual(node.transmit_packet(10), 40e-6 * 10)
+
+        # 프로필 번호로 상수 배열 조회
+        initial_energy = HardwareProfile.column('initial_energy')
+        self.assertEqual(initial_energy[long_range.index], 2)
+        self.assertEqual(initial_energy[MICAZ_PROFILE.index], 1)
+
+    def test_memory_target(self):
+        """노드당 메모리 사용량이 목표 이하인지 테스트"""
+        np.random.seed(42)
+        field = Field(1000, 1000)
+        field.deploy_nodes(2000)
+        usage = field.memory_usage()
+        self.assertEqual(usage['num_nodes'], 2000)
+        self.assertLessEqual(usage['bytes_per_node'], MicazMotes.TARGET_BYTES_PER_NODE)
+
+        # 노드 객체는 __dict__ 없이 __slots__만 사용
+        node = field.nodes[1]
+        self.assertFalse(hasattr(node, '__dict__'))
+
+# if __name__ == '__main__':
+#     unittest.main()
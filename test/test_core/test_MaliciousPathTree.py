@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+from collections import deque
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from core.routing.DijkstraRouting import DijkstraRouting
+from attacks.Sinkhole import Sinkhole
+
+class test_MaliciousPathTree(unittest.TestCase):
+    """MaliciousPathTree 클래스에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        np.random.seed(42)
+        self.field = Field(1000, 1000)
+        self.field.deploy_nodes(300)
+        self.field.set_base_station(500, 500)
+        self.field.find_neighbors()
+        DijkstraRouting(self.field).setup_routing()
+        self.sinkhole = Sinkhole(self.field, attack_type="outside", attack_range=150)
+        self.sinkhole.execute_attack(num_attackers=2)
+        self.tree = self.field.get_malicious_paths()
+
+    def expected_hops(self):
+        """노드마다 전달 링크(이웃 + next_hop)를 따라 malicious 노드까지 직접 BFS한 홉 수"""
+        nodes = self.field.nodes
+        targets = {node_id for node_id, node in nodes.items()
+                   if node.node_type in ("malicious_inside", "malicious_outside")}
+        hops = {}
+        for source in nodes:
+            queue = deque([(source, 0)])
+            visited = {source}
+            while queue:
+                node_id, depth = queue.popleft()
+                if node_id in targets:
+                    hops[source] = depth
+                    break
+                links = list(nodes[node_id].neighbor_nodes) + [nodes[node_id].next_hop]
+                for other_id in links:
+                    if other_id in nodes and other_id not in visited:
+                        visited.add(other_id)
+                        queue.append((other_id, depth + 1))
+        return hops
+
+    def test_paths_match_bfs(self):
+        """경로 길이가 직접 BFS의 최단 홉 수와 같고 모든 구간이 전달 링크인지 테스트"""
+        expected = self.expected_hops()
+        nodes = self.field.nodes
+        for node_id in nodes:
+            path = self.tree.path(node_id)
+            if node_id not in expected:
+                self.assertIsNone(path)
+                continue
+            self.assertEqual(len(path) - 1, expected[node_id])
+            self.assertEqual(self.tree.hops(node_id), expected[node_id])
+            self.assertIn(nodes[path[-1]].node_type, ("malicious_inside", "malicious_outside"))
+            for sender, receiver in zip(path, path[1:]):
+                self.assertTrue(receiver in nodes[sender].neighbor_nodes or receiver == nodes[sender].next_hop)
+        self.assertIsNone(self.tree.path(10 ** 6))
+        self.assertEqual(self.tree.builds, 1)
+
+    def test_recompute_on_change(self):
+        """공격자 집합이나 링크가 바뀔 때만 다시 계산하는지 테스트"""
+        self.tree.path(1)
+        normal = [node_id for node_id, node in self.field.nodes.items() if node.node_type == "normal"]
+
+        # 공격자 집합과 무관한 상태 변경은 재계산하지 않음
+        self.field.nodes[normal[0]].node_type = "affected"
+        self.field.nodes[normal[0]].energy_level = 0.5
+        self.tree.path(1)
+        self.assertEqual(self.tree.builds, 1)
+
+        # 새 공격자는 홉 수 0
+        self.field.nodes[normal[1]].node_type = "malicious_inside"
+        self.assertEqual(self.tree.path(normal[1]), [normal[1]])
+        self.assertEqual(self.tree.builds, 2)
+
+        # next_hop 변경과 이웃 재탐색도 반영
+        self.field.nodes[normal[2]].next_hop = normal[1]
+        self.assertEqual(self.tree.path(normal[2]), [normal[2], normal[1]])
+        self.field.find_neighbors()
+        self.tree.path(1)
+        self.assertEqual(self.tree.builds, 4)
+        self.assertEqual({node_id: self.tree.hops(node_id) for node_id in self.expected_hops()},
+                         self.expected_hops())
+
+    def test_malicious_node_path(self):
+        """Sinkhole 공격 경로가 BFS 트리 경로에 BS를 붙인 것인지 테스트"""
+        for node_id in self.sinkhole.get_affected_and_neighbor_nodes()[0]:
+            path = self.sinkhole.get_malicious_node_path(node_id)
+            self.assertEqual(path, self.tree.path(node_id) + ["BS"])
+            self.assertEqual(len(path), 3)  # 탈취된 노드 -> 공격자 -> BS
+        self.assertIsNone(self.sinkhole.get_malicious_node_path(10 ** 6))
+
+if __name__ == '__main__':
+    unittest.main()
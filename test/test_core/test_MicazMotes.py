@@ -172,6 +172,15 @@ class test_MicazMotes(unittest.TestCase):
         self.node.remove_neighbor(99)
         self.assertEqual(self.node.neighbor_nodes, original_neighbors)
     
+    def test_single_neighbor_container(self):
+        """neighbors와 neighbor_nodes가 같은 리스트인지 테스트"""
+        self.node.add_neighbor(2)
+        self.assertIs(self.node.neighbors, self.node.neighbor_nodes)
+        self.assertEqual(self.node.neighbors, [2])
+        
+        self.node.neighbors = [5, 6]
+        self.assertEqual(self.node.neighbor_nodes, [5, 6])
+    
     def test_get_energy_info(self):
         """에너지 정보 확인 테스트"""
         # 기본 에너지 정보 확인
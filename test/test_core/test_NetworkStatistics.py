@@ -0,0 +1,105 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from core.nodes.MicazMotes import MicazMotes
+from core.routing.DijkstraRouting import DijkstraRouting
+
+class test_NetworkStatistics(unittest.TestCase):
+    """NetworkStatistics 클래스에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        np.random.seed(42)
+        self.field = Field(1000, 1000)
+        self.field.deploy_nodes(200)
+        self.field.set_base_station(500, 500)
+        self.field.find_neighbors()
+        self.routing = DijkstraRouting(self.field)
+        self.routing.setup_routing()
+        self.statistics = self.field.get_statistics()
+
+    def expected(self):
+        """전체 노드를 직접 훑어 구한 기준 통계"""
+        nodes = list(self.field.nodes.values())
+        energies = [node.energy_level for node in nodes]
+        return {
+            'active_nodes': sum(1 for node in nodes if node.status == "active"),
+            'total_nodes': len(nodes),
+            'total_energy': sum(node.total_consumed_energy for node in nodes),
+            'total_tx': sum(node.tx_count for node in nodes),
+            'total_rx': sum(node.rx_count for node in nodes),
+            'nodes_with_energy': sum(1 for node in nodes if node.total_consumed_energy > 0),
+            'nodes_with_tx': sum(1 for node in nodes if node.tx_count > 0),
+            'nodes_with_rx': sum(1 for node in nodes if node.rx_count > 0),
+            'min_energy': min(energies),
+            'max_energy': max(energies),
+        }
+
+    def assert_matches(self):
+        snapshot = self.statistics.snapshot()
+        for name, value in self.expected().items():
+            self.assertAlmostEqual(snapshot[name], value, places=12, msg=name)
+
+    def test_packets_and_status(self):
+        """송수신, 에너지 고갈, 상태 변경이 누적 통계에 반영되는지 테스트"""
+        self.assert_matches()
+        self.assertEqual(self.statistics.snapshot()['max_energy'], 1)
+
+        nodes = self.field.nodes
+        nodes[1].transmit_packet(32)
+        nodes[2].receive_packet(32)
+        nodes[1].transmit_packet(32)
+        self.assert_matches()
+
+        # 에너지가 고갈되면 비활성 (이후 송수신 없음)
+        nodes[3].energy_level = 1e-6
+        nodes[3].transmit_packet(32)
+        self.assertEqual(nodes[3].status, "inactive")
+        nodes[3].receive_packet(32)
+        nodes[4].status = "inactive"
+        self.assert_matches()
+        self.assertEqual(self.statistics.snapshot()['active_nodes'], 198)
+
+        # 공격자 에너지 복구처럼 값이 올라가는 변경
+        nodes[3].energy_level = nodes[3].initial_energy
+        nodes[3].status = "active"
+        self.assert_matches()
+
+        # 많은 갱신 뒤에도 힙 크기가 노드 수에 비례하도록 유지
+        for _ in range(3000):
+            nodes[5].transmit_packet(1)
+        self.assertLessEqual(len(self.statistics._min_heap), 2 * len(nodes) + 1024)
+        self.assert_matches()
+
+    def test_reports_and_batches(self):
+        """순차 보고서 처리와 벡터화 배치 처리가 누적 통계에 반영되는지 테스트"""
+        self.routing.simulate_reports(20)
+        self.assert_matches()
+        self.routing.simulate_report_batch(200)
+        self.assert_matches()
+
+        # 노드 추가와 열 배열 직접 수정 (resync 필요)
+        self.field.add_node(MicazMotes(1000, 10.0, 10.0))
+        self.assert_matches()
+        self.field.nodes.tx_count[:] += 1
+        self.statistics.resync()
+        self.assert_matches()
+
+    def test_dict_nodes(self):
+        """NodeStore가 아닌 노드 딕셔너리는 전체 순회로 계산하는지 테스트"""
+        self.field.nodes = {1: MicazMotes(1, 10.0, 10.0), 2: MicazMotes(2, 20.0, 10.0)}
+        self.field.nodes[1].transmit_packet(32)
+        self.assert_matches()
+        self.assertEqual(self.statistics.snapshot()['nodes_with_tx'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
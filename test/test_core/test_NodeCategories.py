@@ -0,0 +1,111 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from core.nodes.MicazMotes import MicazMotes
+from core.routing.DijkstraRouting import DijkstraRouting
+
+class test_NodeCategories(unittest.TestCase):
+    """NodeCategories 클래스에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        np.random.seed(42)
+        self.field = Field(1000, 1000)
+        self.field.deploy_nodes(300)
+        self.field.set_base_station(500, 500)
+        self.field.find_neighbors()
+        DijkstraRouting(self.field).setup_routing()
+        self.categories = self.field.get_categories()
+
+    def expected(self):
+        """전체 노드를 직접 훑어 구한 기준 분류"""
+        nodes = self.field.nodes
+        expected = {
+            "normal": {i for i, n in nodes.items() if n.node_type == "normal"},
+            "affected": {i for i, n in nodes.items() if n.node_type == "affected"},
+            "malicious": {i for i, n in nodes.items()
+                          if n.node_type in ("malicious_inside", "malicious_outside")},
+            "inactive": {i for i, n in nodes.items() if n.status == "inactive"},
+            "routable": {i for i, n in nodes.items() if n.next_hop},
+        }
+        expected["affected_neighbor"] = {
+            neighbor_id for node_id in expected["affected"]
+            for neighbor_id in nodes[node_id].neighbors if neighbor_id in expected["normal"]}
+        return expected
+
+    def assert_matches(self):
+        for name, members in self.expected().items():
+            self.assertEqual(set(self.categories.members(name)), members, name)
+            self.assertEqual(self.categories.count(name), len(members))
+
+    def test_initial_categories(self):
+        """처음 구성한 분류가 전체 탐색 결과와 같은지 테스트"""
+        self.assert_matches()
+        self.assertEqual(self.categories.count("normal"), 300)
+        # 변경이 없으면 삽입 순서를 유지하므로 np.random.choice와 같은 노드를 뽑음
+        np.random.seed(1)
+        expected = np.random.choice(list(self.field.nodes))
+        np.random.seed(1)
+        self.assertEqual(self.categories.sample("normal"), expected)
+
+    def test_state_transitions(self):
+        """node_type/status/next_hop 변경과 노드 추가/삭제가 반영되는지 테스트"""
+        rng = np.random.RandomState(0)
+        node_ids = list(self.field.nodes)
+        node_types = ["normal", "affected", "malicious_inside", "malicious_outside"]
+        for step in range(300):
+            node = self.field.nodes[node_ids[rng.randint(len(node_ids))]]
+            action = rng.randint(3)
+            if action == 0:
+                node.node_type = node_types[rng.randint(len(node_types))]
+            elif action == 1:
+                node.status = "inactive" if node.status == "active" else "active"
+            else:
+                node.next_hop = None if rng.rand() < 0.5 else "BS"
+            if step % 25 == 0:
+                self.assert_matches()
+        self.assert_matches()
+
+        # 노드 추가/삭제
+        removed_id = next(node_id for node_id in self.categories.members("affected"))
+        del self.field.nodes[removed_id]
+        attacker = MicazMotes(1000, 500, 500)
+        attacker.node_type = "malicious_outside"
+        self.field.add_node(attacker)
+        self.assert_matches()
+        self.assertTrue(self.categories.contains("malicious", 1000))
+
+        # 이웃 리스트를 다시 만들면 affected_neighbor도 다시 계산
+        self.field.find_neighbors()
+        self.assert_matches()
+
+    def test_sample(self):
+        """분류(합집합)에서 균등하게 뽑는지 테스트"""
+        affected = list(self.field.nodes)[:5]
+        for node_id in affected:
+            self.field.nodes[node_id].node_type = "affected"
+        candidates = set(affected) | set(self.categories.members("affected_neighbor"))
+
+        np.random.seed(0)
+        counts = {}
+        for _ in range(3000):
+            node_id = self.categories.sample("affected", "affected_neighbor")
+            counts[node_id] = counts.get(node_id, 0) + 1
+        self.assertEqual(set(counts), candidates)
+        self.assertLess(max(counts.values()) / min(counts.values()), 3)
+
+        self.assertIsNone(self.categories.sample("inactive"))
+        with self.assertRaises(ValueError):
+            self.categories.sample("unknown")
+
+if __name__ == '__main__':
+    unittest.main()
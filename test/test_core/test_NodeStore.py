@@ -0,0 +1,185 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from core.nodes.MicazMotes import MicazMotes
+from core.NodeStore import (NodeStore, ACTIVE, INACTIVE, AFFECTED,
+                            NEXT_HOP_BS, NEXT_HOP_NONE)
+
+class test_NodeStore(unittest.TestCase):
+    """NodeStore 클래스에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        np.random.seed(42)
+        self.field = Field(1000, 1000)
+        self.field.deploy_nodes(50)
+        self.store = self.field.nodes
+
+    def test_columns_follow_node_views(self):
+        """노드 뷰 속성과 열 배열이 같은 상태를 가리키는지 테스트"""
+        node = self.store[10]
+        row = node._row
+
+        node.energy_level = 0.5
+        node.status = "inactive"
+        node.node_type = "affected"
+        node.next_hop = "BS"
+        node.hop_count = 3
+        node.tx_count += 2
+
+        self.assertEqual(self.store.energy_level[row], 0.5)
+        self.assertEqual(self.store.status[row], INACTIVE)
+        self.assertEqual(self.store.node_type[row], AFFECTED)
+        self.assertEqual(self.store.next_hop[row], NEXT_HOP_BS)
+        self.assertEqual(self.store.hop_count[row], 3)
+        self.assertEqual(self.store.tx_count[row], 2)
+
+        # 열 배열을 직접 수정하면 노드 뷰에도 반영
+        self.store.energy_level[row] = 0.25
+        self.store.next_hop[row] = 7
+        self.assertEqual(node.energy_level, 0.25)
+        self.assertEqual(node.next_hop, 7)
+        self.store.next_hop[row] = NEXT_HOP_NONE
+        self.assertIsNone(node.next_hop)
+
+    def test_python_value_types(self):
+        """노드 뷰가 기존과 같은 파이썬 타입을 반환하는지 테스트"""
+        node = self.store[1]
+        self.assertEqual(node.hop_count, float('inf'))
+        node.hop_count = 2
+        self.assertIsInstance(node.hop_count, int)
+        self.assertIsInstance(node.tx_count, int)
+        self.assertIsInstance(node.energy_level, float)
+        self.assertEqual(node.status, "active")
+        self.assertEqual(node.node_type, "normal")
+
+        with self.assertRaises(ValueError):
+            node.node_type = "unknown"
+
+    def test_vectorized_operations(self):
+        """네트워크 전체 연산을 벡터 연산으로 수행할 수 있는지 테스트"""
+        self.store[3].transmit_packet(32)
+        self.store[4].receive_packet(32)
+        self.store[5].status = "inactive"
+
+        self.assertEqual(len(self.store.energy_level), 50)
+        self.assertEqual(int(self.store.tx_count.sum()), 1)
+        self.assertEqual(int(self.store.rx_count.sum()), 1)
+        self.assertEqual(int(np.count_nonzero(self.store.status == ACTIVE)), 49)
+        self.assertAlmostEqual(float(self.store.total_consumed_energy.sum()),
+                               self.store[3].total_consumed_energy + self.store[4].total_consumed_energy)
+
+    def test_insert_standalone_node(self):
+        """독립 노드를 저장소에 추가하면 상태가 복사되고 뷰가 재연결되는지 테스트"""
+        attacker = MicazMotes(51, 500.0, 500.0)
+        attacker.node_type = "malicious_outside"
+        attacker.next_hop = "BS"
+        self.assertIsNot(attacker._store, self.store)
+
+        self.store[51] = attacker
+        self.assertIs(attacker._store, self.store)
+        self.assertEqual(len(self.store), 51)
+        self.assertEqual(self.store.row_of(51), attacker._row)
+        self.assertEqual(attacker.node_type, "malicious_outside")
+        self.assertEqual(self.store.next_hop[attacker._row], NEXT_HOP_BS)
+        self.assertEqual(self.store.pos_x[attacker._row], 500.0)
+
+    def test_delete_keeps_rows_dense(self):
+        """삭제 후에도 행이 조밀하게 유지되고 노드 상태가 보존되는지 테스트"""
+        last = self.store[50]
+        last.tx_count = 9
+        removed = self.store.pop(2)
+
+        self.assertEqual(self.store.size, 49)
+        self.assertNotIn(2, self.store)
+        self.assertEqual(self.store.row_of(2), -1)
+        self.assertEqual(removed.node_id, 2)
+        self.assertEqual(removed.status, "active")
+
+        # 마지막 행이 빈 자리로 이동
+        self.assertEqual(last.tx_count, 9)
+        self.assertEqual(self.store.row_of(50), last._row)
+        self.assertIs(self.store.view_at(last._row), last)
+
+    def test_delete_many(self):
+        """여러 노드를 한 번에 삭제하면 남은 행이 순서대로 당겨지고 삭제된 뷰는 상태를 유지하는지 테스트"""
+        changed = []
+        self.store.observe('status', changed.append)
+        self.store[7].tx_count = 4
+        kept = self.store[40]
+        kept.energy_level = 0.25
+        removed = [self.store[7], self.store[8]]
+
+        self.store.delete_many([7, 8, 20])
+        self.assertEqual(self.store.size, 47)
+        self.assertEqual(changed, [7, 8, 20])
+        self.assertEqual(removed[0].tx_count, 4)
+        self.assertIsNot(removed[0]._store, self.store)
+        self.assertEqual([self.store.view_at(row).node_id for row in range(self.store.size)],
+                         list(self.store.keys()))
+        self.assertEqual(self.store.row_of(40), kept._row)
+        self.assertEqual(self.store.energy_level[kept._row], 0.25)
+        self.assertEqual(self.store.row_of(8), -1)
+        with self.assertRaises(KeyError):
+            self.store.delete_many([8])
+
+    def test_row_table_follows_id_range(self):
+        """ID→행 조회 배열이 최대 ID가 아니라 ID 범위에 비례하는지 테스트"""
+        node = MicazMotes(10 ** 6, 1.0, 1.0)
+        self.assertLessEqual(node._store._row_of_id.nbytes, 64)
+        self.assertEqual(node._store.row_of(10 ** 6), node._row)
+        self.assertEqual(node._store.row_of(0), -1)
+
+        # 시작 ID보다 작은 ID도 조회 가능
+        store = NodeStore()
+        MicazMotes.create_many(np.array([500, 501]), np.zeros(2), np.zeros(2), store)
+        MicazMotes.create_many(np.array([3]), np.zeros(1), np.zeros(1), store)
+        self.assertEqual(store.rows_of([3, 500, 501, 502]).tolist(), [2, 0, 1, -1])
+
+    def test_redeploy_large_field(self):
+        """큰 필드를 다시 배치해도 노드 수에 비례하는 시간과 메모리로 교체되는지 테스트"""
+        field = Field(5000, 5000)
+        field.deploy_nodes(60000)
+        old = field.nodes[60000]
+        old.tx_count = 3
+        field.deploy_nodes(60000)
+
+        store = field.nodes
+        self.assertEqual(store.size, 60000)
+        self.assertIsNot(store[60000], old)
+        self.assertEqual(old.tx_count, 3)  # 교체된 노드 뷰는 독립 저장소로 분리
+        self.assertEqual(store.tx_count.sum(), 0)
+        self.assertEqual(store.rows_of(np.arange(1, 60001)).tolist(), list(range(60000)))
+        self.assertLessEqual(len(store._row_of_id), 2 * 60000 + 16)
+
+    def test_observers(self):
+        """노드 뷰로 열 값을 바꾸거나 노드를 추가/삭제할 때 알림이 가는지 테스트"""
+        changed = []
+        self.store.observe('next_hop', changed.append)
+
+        self.store[3].next_hop = "BS"
+        self.store[3].energy_level = 0.5  # 관찰하지 않는 열
+        self.store[51] = MicazMotes(51, 1.0, 1.0)
+        del self.store[4]
+        self.assertEqual(changed, [3, 51, 4])
+
+        self.store.unobserve('next_hop', changed.append)
+        self.store[5].next_hop = "BS"
+        self.assertEqual(changed, [3, 51, 4])
+
+    def test_rejects_non_sensor_nodes(self):
+        """Sensors 기반이 아닌 객체는 저장할 수 없는지 테스트"""
+        with self.assertRaises(TypeError):
+            NodeStore()[1] = object()
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from core.routing.DijkstraRouting import DijkstraRouting
+
+class test_RoutingTree(unittest.TestCase):
+    """RoutingTree 클래스에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        np.random.seed(42)
+        self.field = Field(1000, 1000)
+        self.field.deploy_nodes(400)
+        self.field.set_base_station(500, 500)
+        self.field.find_neighbors()
+        self.routing = DijkstraRouting(self.field)
+        self.routing.setup_routing()
+        self.tree = self.routing.tree
+
+    def walk_path(self, node_id):
+        """next_hop 포인터를 직접 따라가는 기준 경로"""
+        path = [node_id]
+        next_hop = self.field.nodes[node_id].next_hop
+        while next_hop is not None:
+            path.append(next_hop)
+            if next_hop == "BS":
+                break
+            next_hop = self.field.nodes[next_hop].next_hop
+        return path
+
+    def test_paths_match_next_hops(self):
+        """경로가 next_hop 포인터를 따라간 정수 경로와 같은지 테스트"""
+        for node_id, node in self.field.nodes.items():
+            path = self.routing.get_path_to_bs(node_id)
+            self.assertEqual(path, self.walk_path(node_id))
+            self.assertEqual(self.tree.path_length(node_id), len(path))
+            self.assertEqual(self.tree.get_depth(node_id), node.hop_count)
+            self.assertTrue(all(isinstance(hop, int) for hop in path if hop != "BS"))
+
+        # numpy 정수 ID도 같은 경로
+        self.assertEqual(self.tree.get_path(np.int64(1)), self.walk_path(1))
+
+    def test_subtree_invalidation(self):
+        """next_hop이 바뀐 노드의 서브트리만 다시 계산되는지 테스트"""
+        for node_id in self.field.nodes:
+            self.tree.get_path(node_id)
+
+        relay_id = max((node_id for node_id in self.routing.children if node_id != "BS"),
+                       key=lambda node_id: len(self.tree.get_subtree(node_id)))
+        subtree = set(self.tree.get_subtree(relay_id))
+        self.assertTrue(len(subtree) > 1)
+
+        # relay 노드를 BS와 직접 연결 (공격자가 경로를 바꾼 것처럼)
+        self.field.nodes[relay_id].next_hop = "BS"
+        self.tree.sync()
+        for node_id in self.field.nodes:
+            # 서브트리 밖의 메모 경로는 유지
+            self.assertEqual(node_id in self.tree._paths, node_id not in subtree)
+        for node_id in self.field.nodes:
+            self.assertEqual(self.tree.get_path(node_id), self.walk_path(node_id))
+        self.assertEqual(self.tree.get_depth(relay_id), 1)
+
+    def test_subtree_order(self):
+        """전위 순서 기반 서브트리 조회가 기준 계산과 같은지 테스트"""
+        for ancestor_id in list(self.field.nodes)[:50]:
+            expected = {node_id for node_id in self.field.nodes
+                        if ancestor_id in self.walk_path(node_id)}
+            self.assertEqual(set(self.tree.get_subtree(ancestor_id)), expected)
+            for node_id in expected:
+                self.assertTrue(self.tree.is_in_subtree(node_id, ancestor_id))
+
+        # 배열 버전도 같은 서브트리를 가리켜야 함
+        order_ids, tout = self.tree.subtree_arrays()
+        order, tin, _ = self.tree.subtree_order()
+        self.assertEqual(order_ids.tolist(), order)
+        for ancestor_id in list(self.field.nodes)[:50]:
+            position = tin[ancestor_id]
+            self.assertEqual(order_ids[position:tout[position]].tolist(),
+                             self.tree.get_subtree(ancestor_id))
+
+    def test_broken_routes(self):
+        """삭제된 다음 홉과 순환 경로 처리 테스트"""
+        relay_id = next(node_id for node_id in self.routing.children
+                        if node_id != "BS" and self.field.nodes[node_id].next_hop != "BS")
+        child_id = self.tree.get_children(relay_id)[0]
+
+        # 다음 홉 노드가 삭제되면 경로는 없는 노드 ID에서 멈춤
+        del self.field.nodes[relay_id]
+        self.assertEqual(self.tree.get_path(child_id), [child_id, relay_id])
+        self.assertEqual(self.tree.get_depth(child_id), float('inf'))
+
+        # 순환 경로에서도 멈춤
+        other_id = next(node_id for node_id in self.field.nodes if node_id != child_id)
+        self.field.nodes[child_id].next_hop = other_id
+        self.field.nodes[other_id].next_hop = child_id
+        self.assertEqual(self.tree.get_path(child_id), [child_id, other_id])
+        self.assertEqual(self.tree.get_depth(other_id), float('inf'))
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Simulator import Simulator
+from core.Field import Field
+from core.routing.DijkstraRouting import DijkstraRouting
+
+class test_Simulator(unittest.TestCase):
+    """Simulator 이산 사건 커널에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        self.simulator = Simulator()
+        self.log = []
+
+    def record(self, name):
+        self.log.append((self.simulator.now, name))
+
+    def test_event_order(self):
+        """시각 순서, 같은 시각의 예약 순서, 콜백 안에서의 예약 테스트"""
+        sim = self.simulator
+        sim.schedule(2.0, self.record, "c")
+        sim.schedule(1.0, self.record, "a")
+        sim.schedule(1.0, self.record, "b")
+        sim.schedule_at(0.5, lambda: sim.schedule(0, self.record, "now"))
+
+        self.assertEqual(sim.peek(), 0.5)
+        self.assertEqual(sim.run(), 5)
+        self.assertEqual(self.log, [(0.5, "now"), (1.0, "a"), (1.0, "b"), (2.0, "c")])
+        self.assertEqual(sim.now, 2.0)
+        self.assertEqual(len(sim), 0)
+
+        with self.assertRaises(ValueError):
+            sim.schedule(-1, self.record, "past")
+        with self.assertRaises(ValueError):
+            sim.schedule_at(1.0, self.record, "past")
+
+    def test_cancel_until_and_step(self):
+        """사건 취소, until/max_events 제한, step 테스트"""
+        sim = self.simulator
+        cancelled = sim.schedule(1.0, self.record, "cancelled")
+        for name in ("a", "b", "c"):
+            sim.schedule(1.0, self.record, name)
+        sim.schedule(3.0, self.record, "late")
+        sim.cancel(cancelled)
+
+        self.assertEqual(sim.run(max_events=2), 2)
+        self.assertEqual([name for _, name in self.log], ["a", "b"])
+        self.assertTrue(sim.step())
+        self.assertEqual(self.log[-1], (1.0, "c"))
+
+        self.assertEqual(sim.run(until=2.0), 0)
+        self.assertEqual(sim.now, 2.0)
+        self.assertEqual(sim.run(), 1)
+        self.assertFalse(sim.step())
+        self.assertEqual(sim.events_processed, 4)
+
+    def test_exception_keeps_pending_events(self):
+        """콜백에서 예외가 나도 같은 시각의 남은 사건이 유지되는지 테스트"""
+        sim = self.simulator
+
+        def fail():
+            raise RuntimeError("fail")
+        sim.schedule(1.0, fail)
+        sim.schedule(1.0, self.record, "after")
+        with self.assertRaises(RuntimeError):
+            sim.run()
+        sim.run()
+        self.assertEqual(self.log, [(1.0, "after")])
+
+    def test_report_events(self):
+        """보고서 사건 전송의 에너지, 지연 시간, 동시 전송 테스트"""
+        np.random.seed(42)
+        field = Field(1000, 1000)
+        field.deploy_nodes(200)
+        field.set_base_station(500, 500)
+        field.find_neighbors()
+        routing = DijkstraRouting(field)
+        routing.setup_routing()
+        source_id = max(field.nodes, key=lambda node_id: routing.tree.get_depth(node_id)
+                        if routing.tree.get_depth(node_id) != float('inf') else -1)
+        path = routing.get_path_to_bs(source_id)
+        hop_time = field.nodes[source_id].calculate_packet_time(32)
+
+        # 같은 시각에 보낸 두 보고서는 같은 지연 시간으로 도착
+        delivered = []
+        sim = self.simulator
+        first = routing.send_report(sim, 0, source_id, on_delivered=delivered.append)
+        second = routing.send_report(sim, 1, source_id, on_delivered=delivered.append)
+        sim.run()
+        self.assertEqual(delivered, [first, second])
+        self.assertAlmostEqual(first['latency'], (len(path) - 1) * hop_time)
+        self.assertEqual(first['path'], path)
+        self.assertEqual(sim.events_processed, 4 * (len(path) - 1))
+
+        # 에너지 소모는 순차 처리와 같음
+        for node_id in path[:-1]:
+            node = field.nodes[node_id]
+            self.assertEqual(node.tx_count, 2)
+            self.assertEqual(node.rx_count, 0 if node_id == source_id else 2)
+        self.assertEqual(first['source_energy'] + 32 * field.nodes[source_id].tx_energy_per_byte,
+                         field.nodes[source_id].initial_energy)
+
+        # 타이머 사건으로 주기적 보고서 발생
+        start = sim.now
+        reports = routing.schedule_reports(sim, 5, interval=2.0)
+        sim.run()
+        self.assertEqual([report['report_id'] for report in reports], [1, 2, 3, 4, 5])
+        for k, report in enumerate(reports):
+            self.assertAlmostEqual(report['send_time'] - start, 2.0 * k)
+        for report in reports:
+            if report['path'][-1] == "BS":
+                self.assertAlmostEqual(report['latency'], (len(report['path']) - 1) * hop_time)
+
+if __name__ == '__main__':
+    unittest.main()
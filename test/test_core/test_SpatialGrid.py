@@ -0,0 +1,139 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from core.SpatialGrid import SpatialGrid
+
+class test_SpatialGrid(unittest.TestCase):
+    """SpatialGrid 클래스에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        self.grid = SpatialGrid(100)
+
+    def test_invalid_cell_size(self):
+        """셀 크기 검증 테스트"""
+        with self.assertRaises(ValueError):
+            SpatialGrid(0)
+
+    def test_insert_and_remove(self):
+        """노드 추가/제거 테스트"""
+        self.grid.insert(1, 10.0, 10.0)
+        self.grid.insert(2, 150.0, 10.0)
+        self.assertEqual(len(self.grid), 2)
+        self.assertIn(1, self.grid.cells[(0, 0)])
+        self.assertIn(2, self.grid.cells[(1, 0)])
+
+        # 위치 갱신 시 셀 이동
+        self.grid.insert(1, 250.0, 10.0)
+        self.assertNotIn((0, 0), self.grid.cells)
+        self.assertIn(1, self.grid.cells[(2, 0)])
+
+        self.grid.remove(2)
+        self.assertNotIn(2, self.grid)
+        self.assertNotIn((1, 0), self.grid.cells)
+
+    def test_build(self):
+        """일괄 구성 테스트"""
+        self.grid.build([1, 2, 3], np.array([10.0, 20.0, 310.0]), np.array([10.0, 30.0, 10.0]))
+        self.assertEqual(self.grid.cells[(0, 0)], [1, 2])
+        self.assertEqual(self.grid.cells[(3, 0)], [3])
+        self.assertEqual(self.grid.positions[3], (310.0, 10.0))
+
+    def test_neighbor_pairs_match_brute_force(self):
+        """격자 기반 이웃 쌍이 전수 비교 결과와 같은지 테스트"""
+        np.random.seed(42)
+        xs = np.random.uniform(0, 1000, 300)
+        ys = np.random.uniform(0, 1000, 300)
+        ranges = np.full(300, 100.0)
+
+        src, dst = SpatialGrid.neighbor_pairs(xs, ys, ranges, 100.0)
+
+        expected = set()
+        for i in range(300):
+            for j in range(300):
+                if i != j and np.sqrt((xs[i] - xs[j])**2 + (ys[i] - ys[j])**2) <= ranges[i]:
+                    expected.add((i, j))
+        self.assertEqual(set(zip(src.tolist(), dst.tolist())), expected)
+
+        # (src, dst) 오름차순 정렬 확인
+        self.assertTrue(np.all(np.diff(src) >= 0))
+
+    def test_query_radius(self):
+        """반경 질의가 전수 비교 결과와 같은지 테스트"""
+        np.random.seed(3)
+        xs = np.random.uniform(0, 1000, 500)
+        ys = np.random.uniform(0, 1000, 500)
+        self.grid.build(list(range(500)), xs, ys)
+
+        for x, y, radius in [(500, 500, 150), (0, 0, 80), (900, 120, 450), (500, 500, 5000)]:
+            expected = {i for i in range(500)
+                        if np.sqrt((xs[i] - x)**2 + (ys[i] - y)**2) <= radius}
+            self.assertEqual(set(self.grid.query_radius(x, y, radius)), expected)
+
+        with_distance = self.grid.query_radius(500, 500, 150, return_distance=True)
+        for node_id, distance in with_distance:
+            self.assertAlmostEqual(distance, np.sqrt((xs[node_id] - 500)**2 + (ys[node_id] - 500)**2))
+
+    def test_nearest(self):
+        """최근접 질의가 전수 비교 결과와 같은지 테스트"""
+        np.random.seed(5)
+        xs = np.random.uniform(0, 1000, 400)
+        ys = np.random.uniform(0, 1000, 400)
+        self.grid.build(list(range(400)), xs, ys)
+        distances = np.sqrt((xs - 250)**2 + (ys - 730)**2)
+
+        result = self.grid.nearest(250, 730, k=5)
+        self.assertEqual([node_id for node_id, _ in result], np.argsort(distances)[:5].tolist())
+
+        # predicate로 후보를 제한 (짝수 ID만)
+        result = self.grid.nearest(250, 730, k=1, predicate=lambda node_id: node_id % 2 == 0)
+        even = [i for i in range(400) if i % 2 == 0]
+        self.assertEqual(result[0][0], min(even, key=lambda i: distances[i]))
+
+        # 필드 밖의 먼 지점에서도 탐색 가능
+        self.assertEqual(len(self.grid.nearest(-5000, -5000, k=3)), 3)
+        self.assertEqual(self.grid.nearest(0, 0, k=1, predicate=lambda node_id: False), [])
+
+    def test_field_neighbors_match_brute_force(self):
+        """Field.find_neighbors가 기존 O(n²) 방식과 같은 이웃 리스트를 만드는지 테스트"""
+        np.random.seed(7)
+        field = Field(1000, 1000)
+        field.deploy_nodes(200)
+        field.find_neighbors()
+
+        for node_id, node in field.nodes.items():
+            expected = [other_id for other_id, other in field.nodes.items()
+                        if other_id != node_id and
+                        np.sqrt((node.pos_x - other.pos_x)**2 +
+                                (node.pos_y - other.pos_y)**2) <= node.comm_range]
+            self.assertEqual(node.neighbor_nodes, expected)
+
+        self.assertIsNotNone(field.spatial_grid)
+        self.assertEqual(len(field.spatial_grid), 200)
+
+        # 삭제로 저장소 행 순서가 삽입 순서와 달라져도 열 배열을 노드 ID 순서로 읽는지 확인
+        for node_id in (3, 50, 120):
+            del field.nodes[node_id]
+        for node in field.nodes.values():
+            node.neighbor_nodes.clear()
+        field.spatial_grid = None
+        field.find_neighbors()
+        for node_id, node in field.nodes.items():
+            expected = [other_id for other_id, other in field.nodes.items()
+                        if other_id != node_id and
+                        np.sqrt((node.pos_x - other.pos_x)**2 +
+                                (node.pos_y - other.pos_y)**2) <= node.comm_range]
+            self.assertEqual(node.neighbor_nodes, expected)
+            self.assertEqual(field.spatial_grid.positions[node_id], (node.pos_x, node.pos_y))
+
+# if __name__ == '__main__':
+#     unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from core.TimeSeriesRecorder import TimeSeriesRecorder
+from core.routing.DijkstraRouting import DijkstraRouting
+
+class test_TimeSeriesRecorder(unittest.TestCase):
+    """TimeSeriesRecorder 클래스에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        np.random.seed(42)
+        self.field = Field(1000, 1000)
+        self.field.deploy_nodes(200)
+        self.field.set_base_station(500, 500)
+        self.field.find_neighbors()
+        self.routing = DijkstraRouting(self.field)
+        self.routing.setup_routing()
+
+    def test_ring_buffer(self):
+        """stride마다 표본을 기록하고 capacity를 넘으면 오래된 표본을 덮어쓰는지 테스트"""
+        recorder = TimeSeriesRecorder(self.field, capacity=8, stride=3, quantile_sample=1000)
+        self.routing.recorder = recorder
+        self.routing.simulate_reports(30)
+
+        self.assertEqual(recorder.samples, 10)
+        self.assertEqual(len(recorder), 8)
+        series = recorder.series()
+        self.assertEqual(series['reports'].tolist(), list(range(9, 31, 3)))
+        self.assertEqual(series['time'].tolist(), list(range(9, 31, 3)))
+        self.assertEqual(series['sent'].tolist(), [3] * 8)
+        self.assertEqual(series['delivered'].tolist(), [3] * 8)
+        self.assertEqual(series['delivery_ratio'].tolist(), [1.0] * 8)
+        self.assertEqual(series['alive_nodes'][-1], 200)
+
+        # 마지막 표본의 분위수는 np.quantile과 같음 (노드 수 <= quantile_sample)
+        expected = np.quantile(self.field.nodes.energy_level, (0.1, 0.5, 0.9))
+        actual = [series[name][-1] for name in ('energy_q10', 'energy_q50', 'energy_q90')]
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-12)
+
+        # 배치 처리는 묶음 하나를 보고서 수만큼 기록
+        self.routing.simulate_report_batch(7)
+        self.assertEqual(recorder.sent, 37)
+        self.assertEqual(recorder.series()['sent'][-1], 7)
+
+    def test_batch_delivery(self):
+        """배치 처리에서 경로가 BS로 끝나지 않는 보고서는 도착으로 세지 않는지 테스트"""
+        recorder = TimeSeriesRecorder(self.field)
+        self.routing.recorder = recorder
+        nodes = self.field.nodes
+        source = next(node for node in nodes.values()
+                      if node.next_hop not in (None, "BS") and nodes[node.next_hop].next_hop != "BS")
+        nodes[source.next_hop].next_hop = None  # 중간에서 끊긴 경로
+
+        reports = self.routing.simulate_report_batch(4, source_node=source.node_id)
+        self.assertTrue(all(report['path'][-1] != "BS" for report in reports))
+        reports = self.routing.simulate_report_batch(30)
+        delivered = sum(1 for report in reports if report['path'][-1] == "BS")
+        self.assertLess(delivered, 30)  # 끊긴 경로 아래의 소스도 뽑힘
+        self.assertEqual(recorder.sent, 34)
+        self.assertEqual(recorder.delivered, delivered)
+        series = recorder.series()
+        self.assertEqual(series['delivered'].tolist(), [0, delivered])
+        self.assertAlmostEqual(series['delivery_ratio'][-1], delivered / 34)
+
+        # 묶음 기록에 도착 수를 주지 않으면 경로로 셈
+        recorder.record_reports([{'path': [1, "BS"]}, {'path': [2, 3]}])
+        self.assertEqual(recorder.delivered, delivered + 1)
+
+    def test_quantile_sample(self):
+        """노드가 quantile_sample개보다 많으면 일정 간격으로 고른 노드의 분위수인지 테스트"""
+        self.routing.recorder = TimeSeriesRecorder(self.field, quantiles=(0.25, 0.5), quantile_sample=50)
+        self.routing.simulate_reports(20)
+        series = self.routing.recorder.series()
+        expected = np.quantile(self.field.nodes.energy_level[::4], (0.25, 0.5))
+        np.testing.assert_allclose([series['energy_q25'][-1], series['energy_q50'][-1]], expected,
+                                   rtol=0, atol=1e-12)
+
+    def test_milestones(self):
+        """수명 지표가 표본 간격과 무관하게 처음 도달한 보고서에서 기록되는지 테스트"""
+        recorder = TimeSeriesRecorder(self.field, stride=1000)
+        nodes = self.field.nodes
+        report = {'path': [1, "BS"]}
+        recorder.record_report(report, now=1.0)
+        self.assertEqual(recorder.lifetime(), {'first_node_death_time': None, 'dead_10pct_time': None,
+                                               'dead_50pct_time': None, 'bs_partition_time': None})
+
+        nodes[1].status = "inactive"
+        recorder.record_report(report, now=2.0)
+        for node_id in range(2, 21):
+            nodes[node_id].status = "inactive"
+        recorder.record_delivery(report, now=2.5)
+        recorder.record_report(report, now=3.0)
+        for node_id in self.field._get_bs_links():
+            nodes[node_id].status = "inactive"
+        recorder.record_report(report, now=4.0)
+
+        self.assertEqual(recorder.lifetime(), {'first_node_death_time': 2.0, 'dead_10pct_time': 2.5,
+                                               'dead_50pct_time': None, 'bs_partition_time': 4.0})
+        self.assertEqual(recorder.milestones['first_node_death']['reports'], 2)
+        self.assertEqual(recorder.milestones['dead_10pct']['dead_nodes'], 20)
+        self.assertEqual(recorder.samples, 0)
+        recorder.finish()
+        self.assertEqual(recorder.samples, 1)
+
+    def test_captured(self):
+        """malicious 노드를 지난 보고서를 싱크홀 트래픽으로 세는지 테스트"""
+        recorder = TimeSeriesRecorder(self.field)
+        recorder.record_report({'path': [1, 2, "BS"]})
+        self.field.nodes[2].node_type = "malicious_inside"
+        recorder.record_report({'path': [1, 2, "BS"]})
+        recorder.record_report({'path': [3, "BS"]})
+        self.assertEqual(recorder.series()['captured'].tolist(), [0, 1, 0])
+        self.assertEqual(recorder.series()['delivery_ratio'].tolist(), [0.0, 0.0, 0.0])
+
+    def test_dict_nodes(self):
+        """NodeStore가 아닌 노드 딕셔너리도 매번 전체를 훑어 기록하는지 테스트"""
+        self.field.nodes = dict(self.field.nodes)
+        recorder = TimeSeriesRecorder(self.field)
+        self.field.nodes[5].status = "inactive"
+        recorder.record_report({'path': [1, "BS"]}, delivered=True)
+        series = recorder.series()
+        self.assertEqual(series['dead_nodes'].tolist(), [1])
+        self.assertEqual(recorder.lifetime()['first_node_death_time'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from core.TopologyCache import TopologyCache
+from core.routing.DijkstraRouting import DijkstraRouting
+
+class test_TopologyCache(unittest.TestCase):
+    """TopologyCache 클래스에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = TopologyCache(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build(self, seed=42, num_nodes=300, link_cost="hop"):
+        """캐시 없이 토폴로지 구성"""
+        np.random.seed(seed)
+        field = Field(1000, 1000)
+        field.deploy_nodes(num_nodes)
+        field.set_base_station(500, 500)
+        field.find_neighbors()
+        routing = DijkstraRouting(field, link_cost)
+        routing.setup_routing()
+        return field, routing
+
+    def test_key(self):
+        """입력이 같으면 같은 키, 다르면 다른 키인지 테스트"""
+        key = TopologyCache.key(seed=42, num_nodes=300, params={'a': 1, 'b': 2})
+        self.assertEqual(key, TopologyCache.key(num_nodes=300, params={'b': 2, 'a': 1}, seed=42))
+        self.assertNotEqual(key, TopologyCache.key(seed=43, num_nodes=300, params={'a': 1, 'b': 2}))
+
+    def test_store_and_load(self):
+        """복원한 토폴로지와 난수 상태가 새로 만든 것과 같은지 테스트"""
+        for link_cost in ("hop", "distance_squared"):
+            key = TopologyCache.key(seed=42, link_cost=link_cost)
+            self.assertIsNone(self.cache.load(key, DijkstraRouting))
+            field, routing = self.build(link_cost=link_cost)
+            self.assertTrue(self.cache.store(key, field, routing))
+            expected_draw = np.random.rand()
+
+            np.random.seed(0)
+            restored_field, restored_routing = self.cache.load(
+                key, lambda wsn_field: DijkstraRouting(wsn_field, link_cost))
+            self.assertEqual(np.random.rand(), expected_draw)
+
+            self.assertEqual(list(restored_field.nodes), list(field.nodes))
+            for name in ("pos_x", "pos_y", "next_hop", "hop_count", "distance_to_bs", "energy_level", "comm_range"):
+                np.testing.assert_array_equal(restored_field.nodes.column(name), field.nodes.column(name))
+            for node_id, node in field.nodes.items():
+                self.assertEqual(restored_field.nodes[node_id].neighbor_nodes, node.neighbor_nodes)
+            self.assertEqual(restored_field.base_station, field.base_station)
+            self.assertEqual(restored_routing.routing_table, routing.routing_table)
+            self.assertEqual(restored_routing.path_costs, routing.path_costs)
+
+            # 복원한 토폴로지에서의 경로와 공간 질의도 같음
+            source_id = next(iter(routing.path_costs))
+            self.assertEqual(restored_routing.get_path_to_bs(source_id), routing.get_path_to_bs(source_id))
+            self.assertEqual(sorted(restored_field.query_radius(500, 500, 150)),
+                             sorted(field.query_radius(500, 500, 150)))
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_eviction(self):
+        """크기 제한을 넘으면 가장 오래 쓰지 않은 항목부터 삭제되는지 테스트"""
+        keys = [TopologyCache.key(seed=seed) for seed in range(3)]
+        for seed, key in enumerate(keys):
+            self.cache.store(key, *self.build(seed=seed, num_nodes=100))
+            os.utime(self.cache.path(key), (seed, seed))
+        sizes = [os.path.getsize(self.cache.path(key)) for key in keys]
+
+        # 가장 오래된 항목을 읽으면 최근 사용 항목이 됨
+        self.cache.load(keys[0], DijkstraRouting)
+        self.cache.max_bytes = sizes[0] + sizes[2]
+        self.cache.evict()
+        self.assertIn(keys[0], self.cache)
+        self.assertNotIn(keys[1], self.cache)
+        self.assertIn(keys[2], self.cache)
+        self.assertLessEqual(self.cache.size(), self.cache.max_bytes)
+
+        self.cache.clear()
+        self.assertEqual(self.cache.size(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from utils.simulation import run_simulation
+from utils.data_handler import (save_nodes_state, save_simulation_results, save_nodes_state_columnar,
+                                save_simulation_results_columnar, load_columnar, report_paths,
+                                columnar_to_csv, load_nodes_state_arrays, load_field, PATH_BS)
+from core.routing.DijkstraRouting import DijkstraRouting
+
+class test_DataHandler(unittest.TestCase):
+    """열 단위 결과 형식과 CSV 변환에 대한 유닛 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.result = run_simulation({'NUM_NODES': 200, 'NUM_REPORTS': 20, 'DEBUG_MODE': False})
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def path(self, filename):
+        return os.path.join(self.temp_dir.name, filename)
+
+    def read(self, filename):
+        with open(self.path(filename), 'rb') as file:
+            return file.read()
+
+    def test_report_columns(self):
+        """보고서 경로가 int32 평탄 배열 + 오프셋 + BS 센티널로 저장되는지 테스트"""
+        reports = self.result.reports
+        save_simulation_results_columnar(reports, self.path('results.npz'))
+        columns = load_columnar(self.path('results.npz'))
+
+        self.assertEqual(columns['path_nodes'].dtype, np.int32)
+        self.assertEqual(len(columns['path_offsets']), len(reports) + 1)
+        self.assertEqual(columns['report_id'].tolist(), [report['report_id'] for report in reports])
+        self.assertEqual(list(report_paths(columns)), [report['path'] for report in reports])
+        delivered = [report for report in reports if report['path'][-1] == "BS"]
+        self.assertEqual(int(np.count_nonzero(columns['path_nodes'] == PATH_BS)), len(delivered))
+
+    def test_csv_converter(self):
+        """열 단위 파일을 변환한 CSV가 기존 CSV 저장 결과와 같은지 테스트"""
+        save_nodes_state(self.result.field, self.path('nodes.csv'))
+        save_simulation_results(self.result.reports, self.path('results.csv'))
+        save_nodes_state_columnar(self.result.field, self.path('nodes.npz'))
+        save_simulation_results_columnar(self.result.reports, self.path('results.npz'))
+
+        columnar_to_csv(self.path('nodes.npz'), self.path('nodes_converted.csv'))
+        columnar_to_csv(self.path('results.npz'), self.path('results_converted.csv'))
+        self.assertEqual(self.read('nodes_converted.csv'), self.read('nodes.csv'))
+        self.assertEqual(self.read('results_converted.csv'), self.read('results.csv'))
+
+        # 노드 상태는 타입 있는 열로 저장
+        columns = load_columnar(self.path('nodes.npz'))
+        self.assertEqual(columns['status'].dtype, np.int8)
+        self.assertEqual(columns['node_id'].tolist(), list(self.result.field.nodes))
+
+    def test_load_field(self):
+        """저장된 노드 상태(CSV/.npz)로 같은 상태의 Field를 복원하는지 테스트"""
+        field = self.result.field
+        save_nodes_state(field, self.path('nodes.csv'))
+        save_nodes_state_columnar(field, self.path('nodes.npz'))
+
+        arrays = load_nodes_state_arrays(self.path('nodes.csv'))
+        self.assertEqual(arrays['status'].dtype, np.int8)
+        self.assertEqual(arrays['next_hop'].dtype, np.int64)
+        self.assertEqual(arrays['neighbor_count'].tolist(),
+                         [len(node.neighbor_nodes) for node in field.nodes.values()])
+
+        config = self.result.config
+        for filename in ('nodes.csv', 'nodes.npz'):
+            restored = load_field(self.path(filename), config['FIELD_SIZE'], config['FIELD_SIZE'],
+                                  config['BS_POSITION'])
+            self.assertEqual(list(restored.nodes), list(field.nodes))
+            for node_id, node in field.nodes.items():
+                # 이웃 리스트는 위치로 다시 계산하므로 (공격자 추가 후 갱신되지 않은 이웃 포함) 제외
+                expected = node.get_node_state_dict()
+                actual = restored.nodes[node_id].get_node_state_dict()
+                expected.pop('neighbor_nodes')
+                actual.pop('neighbor_nodes')
+                self.assertEqual(actual, expected)
+                self.assertEqual(restored.nodes[node_id].comm_range, node.comm_range)
+
+            # 저장된 라우팅 포인터로 같은 경로
+            routing = DijkstraRouting(restored)
+            for node_id in list(field.nodes)[:20]:
+                self.assertEqual(routing.get_path_to_bs(node_id), self.result.routing.get_path_to_bs(node_id))
+
+        with open(self.path('bad.csv'), 'w') as file:
+            file.write('node_id,pos_x\n1,2.0\n')
+        with self.assertRaises(ValueError):
+            load_nodes_state_arrays(self.path('bad.csv'))
+
+if __name__ == '__main__':
+    unittest.main()
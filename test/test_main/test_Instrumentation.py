@@ -0,0 +1,118 @@
+import unittest
+import sys
+import os
+import json
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from core.Field import Field
+from utils.Instrumentation import Instrumentation, phase
+from utils.simulation import run_simulation
+
+class test_Instrumentation(unittest.TestCase):
+    """Instrumentation 클래스(단계별 시간 측정과 프로파일러)에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        self.config = {'NUM_NODES': 100, 'NUM_REPORTS': 5, 'DEBUG_MODE': False}
+        self.report_file = 'test_performance_report.json'
+
+    def tearDown(self):
+        """테스트 후 실행 중인 계측기와 성능 보고서 파일 정리"""
+        if Instrumentation.current() is not None:
+            Instrumentation.current().stop()
+        file_path = os.path.join(project_root, 'results', self.report_file)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def test_nested_phases(self):
+        """중첩 구간이 경로별로 호출 수와 자체 시간까지 집계되는지 테스트"""
+        with Instrumentation() as instrumentation:
+            with phase("outer"):
+                for _ in range(3):
+                    with phase("inner"):
+                        pass
+            with instrumentation.phase("outer"):
+                pass
+        phases = {entry['path']: entry for entry in instrumentation.report()['phases']}
+        self.assertEqual(list(phases), ["outer", "outer/inner"])
+        self.assertEqual(phases["outer"]['calls'], 2)
+        self.assertEqual(phases["outer/inner"]['calls'], 3)
+        self.assertEqual(phases["outer/inner"]['depth'], 1)
+        self.assertEqual(phases["outer"]['self_ns'],
+                         phases["outer"]['total_ns'] - phases["outer/inner"]['total_ns'])
+        self.assertGreaterEqual(instrumentation.report()['wall_ns'], phases["outer"]['total_ns'])
+
+    def test_hooks_restored(self):
+        """실행 중에만 진입점이 래퍼로 바뀌고 끝나면 원래 함수로 되돌아가는지 테스트"""
+        original = Field.__dict__['find_neighbors']
+        self.assertIsNone(Instrumentation.current())
+        self.assertIs(phase("idle"), phase("other"))  # 꺼져 있으면 공유하는 빈 컨텍스트
+
+        instrumentation = Instrumentation()
+        instrumentation.start()
+        self.assertIs(Instrumentation.current(), instrumentation)
+        self.assertIsNot(Field.__dict__['find_neighbors'], original)
+        with self.assertRaises(RuntimeError):
+            Instrumentation().start()
+        field = Field(200, 200)
+        field.deploy_nodes(10)
+        field.find_neighbors()
+        field.find_neighbors()
+        instrumentation.stop()
+
+        self.assertIs(Field.__dict__['find_neighbors'], original)
+        self.assertIsNone(Instrumentation.current())
+        functions = instrumentation.report()['functions']
+        self.assertEqual(functions['Field.find_neighbors']['calls'], 2)
+        self.assertEqual(functions['Field.deploy_nodes']['calls'], 1)
+        with self.assertRaises(ValueError):
+            Instrumentation(profile_mode="unknown")
+
+    def test_profile_modes(self):
+        """cProfile과 표본 프로파일러 결과가 보고서에 포함되는지 테스트"""
+        with Instrumentation("cprofile", top=5) as instrumentation:
+            run_simulation(self.config)
+        profile = instrumentation.report()['profile']
+        self.assertEqual(len(profile), 5)
+        self.assertTrue(all(entry['calls'] >= 1 for entry in profile))
+
+        # 표본 프로파일러: 표본이 3개 모일 때까지 바쁜 루프를 도는 함수 (실행 시간에 의존하지 않음)
+        def busy_loop(instrumentation):
+            deadline = time.monotonic() + 10.0
+            while instrumentation._num_samples < 3 and time.monotonic() < deadline:
+                pass
+
+        with Instrumentation("sampling", sample_interval=0.001) as instrumentation:
+            busy_loop(instrumentation)
+        profile = instrumentation.report()['profile']
+        self.assertGreaterEqual(profile['samples'], 3)
+        busy = [entry for entry in profile['functions'] if entry['function'].endswith('(busy_loop)')]
+        self.assertEqual(len(busy), 1)
+        self.assertGreaterEqual(busy[0]['samples'], 3)
+        self.assertIsNone(Instrumentation().report()['profile'])
+
+    def test_run_simulation_profile(self):
+        """PROFILE 설정으로 실행 단계별 성능 보고서가 결과와 JSON 파일에 남는지 테스트"""
+        result = run_simulation(dict(self.config, PROFILE=True, PROFILE_REPORT_FILE=self.report_file))
+        self.assertIsNone(Instrumentation.current())
+        paths = [entry['path'] for entry in result.performance['phases']]
+        self.assertIn("run_simulation/build_topology/Field.deploy_nodes", paths)
+        self.assertIn("run_simulation/build_topology/Field.find_neighbors", paths)
+        self.assertIn("run_simulation/report_loop", paths)
+        self.assertEqual(result.performance['functions']['BaseRoutingProtocol.send_report']['calls'], 5)
+
+        with open(os.path.join(project_root, 'results', self.report_file)) as jsonfile:
+            exported = json.load(jsonfile)
+        self.assertEqual([entry['path'] for entry in exported['phases']], paths)
+
+        # 계측하지 않으면 성능 보고서 없음
+        self.assertIsNone(run_simulation(self.config).performance)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+from utils.ResultWriter import ResultWriter
+from utils.simulation import run_simulation
+from utils.data_handler import save_simulation_results, load_columnar, report_paths
+
+class test_ResultWriter(unittest.TestCase):
+    """ResultWriter 스트리밍 기록기에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.reports = [{'report_id': i + 1, 'source_node': 10 + i, 'source_energy': 0.5,
+                         'path': [10 + i] + list(range(i % 5)) + (["BS"] if i % 3 else [])}
+                        for i in range(250)]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def path(self, filename):
+        return os.path.join(self.temp_dir.name, filename)
+
+    def read(self, filename):
+        with open(self.path(filename), 'rb') as file:
+            return file.read()
+
+    def test_csv_stream(self):
+        """묶음 단위로 흘려 쓴 CSV가 한 번에 저장한 CSV와 같은지 테스트"""
+        with ResultWriter(self.path('stream.csv'), chunk_size=16, max_pending_chunks=2) as writer:
+            for report in self.reports:
+                writer.write(report)
+        self.assertEqual(writer.count, 250)
+        self.assertEqual(writer.chunks_written, 16)
+        save_simulation_results(self.reports, self.path('saved.csv'))
+        self.assertEqual(self.read('stream.csv'), self.read('saved.csv'))
+
+    def test_columnar_stream(self):
+        """묶음 단위로 흘려 쓴 .npz를 load_columnar로 읽을 수 있는지 테스트"""
+        writer = ResultWriter(self.path('stream.npz'), "columnar", chunk_size=32)
+        for report in self.reports:
+            writer.write(report)
+        self.assertEqual(writer.close(), 250)
+        columns = load_columnar(self.path('stream.npz'))
+        self.assertEqual(columns['report_id'].tolist(), list(range(1, 251)))
+        self.assertEqual(list(report_paths(columns)), [report['path'] for report in self.reports])
+        self.assertEqual(os.listdir(self.temp_dir.name), ['stream.npz'])  # 임시 파일 삭제
+
+        # 보고서가 없어도 빈 파일 생성
+        ResultWriter(self.path('empty.npz'), "columnar").close()
+        self.assertEqual(len(load_columnar(self.path('empty.npz'))['path_offsets']), 1)
+
+    def test_writer_error(self):
+        """기록 스레드의 예외가 close에서 다시 발생하는지 테스트"""
+        writer = ResultWriter(self.path('bad.csv'), chunk_size=1)
+        writer.write({'report_id': 1, 'source_node': 1, 'path': [1, "X"]})
+        with self.assertRaises(ValueError):
+            writer.close()
+
+        with self.assertRaises(ValueError):
+            ResultWriter(self.path('bad.txt'), "parquet")
+
+    def test_streamed_simulation(self):
+        """스트리밍 실행이 보고서를 메모리에 남기지 않고 같은 결과 파일을 만드는지 테스트"""
+        config = {'NUM_NODES': 200, 'NUM_REPORTS': 30, 'DEBUG_MODE': False, 'STREAM_CHUNK_SIZE': 4}
+        expected = run_simulation(config)
+        save_simulation_results(expected.reports, self.path('expected.csv'))
+
+        streamed = run_simulation(config, stream_to=self.path('streamed.csv'))
+        self.assertEqual(streamed.reports, [])
+        self.assertEqual(streamed.streamed_to, self.path('streamed.csv'))
+        self.assertEqual(self.read('streamed.csv'), self.read('expected.csv'))
+        self.assertEqual(streamed.summary()['valid_reports'], expected.summary()['valid_reports'])
+        self.assertEqual(streamed.summary()['average_latency_ms'], expected.summary()['average_latency_ms'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import sys
+import os
+import subprocess
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+
+import config
+from utils.simulation import run_simulation, load_config, SimulationResult
+from core.routing.DijkstraRouting import DijkstraRouting
+
+class test_Simulation(unittest.TestCase):
+    """헤드리스 시뮬레이션 실행(run_simulation)에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        self.config = {'NUM_NODES': 200, 'NUM_REPORTS': 10, 'DEBUG_MODE': False}
+
+    def test_load_config(self):
+        """기본 설정과 덮어쓰기, 잘못된 설정 이름 테스트"""
+        settings = load_config(self.config)
+        self.assertEqual(settings['NUM_NODES'], 200)
+        self.assertEqual(settings['FIELD_SIZE'], config.FIELD_SIZE)
+        self.assertEqual(load_config(config), load_config())
+        with self.assertRaises(ValueError):
+            load_config({'UNKNOWN_SETTING': 1})
+
+    def test_run_simulation(self):
+        """결과가 메모리에 반환되고 같은 설정이면 같은 결과인지 테스트"""
+        result = run_simulation(self.config)
+        self.assertIsInstance(result, SimulationResult)
+        self.assertEqual(len(result.field.nodes), 200 + 1)  # 외부 공격자 포함
+        self.assertLessEqual(len(result.delivered), len(result.reports))
+        self.assertGreaterEqual(result.simulated_seconds, result.config['REPORT_INTERVAL'] * 9)
+
+        summary = result.summary()
+        self.assertEqual(summary['num_reports'], 10)
+        self.assertEqual(summary['total_tx'], result.statistics['total_tx'])
+        self.assertEqual(run_simulation(self.config).summary()['total_tx'], summary['total_tx'])
+
+    def test_recorder(self):
+        """시뮬레이션 동안 시계열과 수명 지표를 기록하는지 테스트 (RECORD_STRIDE가 0이면 기록 안 함)"""
+        result = run_simulation(self.config)
+        recorder = result.recorder
+        series = recorder.series()
+        self.assertEqual(series['reports'][-1], recorder.sent)
+        self.assertEqual(series['sent'].sum(), recorder.sent)
+        self.assertEqual(series['delivered'].sum(), result.delivered_reports)
+        malicious = set(result.field.get_categories().members("malicious"))
+        self.assertEqual(series['captured'].sum(),
+                         sum(1 for report in result.reports if malicious & set(report['path'])))
+        self.assertIsNone(result.routing.recorder)
+        self.assertEqual(result.summary()['first_node_death_time'], '')
+
+        result = run_simulation(dict(self.config, RECORD_STRIDE=0))
+        self.assertIsNone(result.recorder)
+        self.assertNotIn('first_node_death_time', result.summary())
+
+    def test_incremental_repair(self):
+        """ROUTING_INCREMENTAL_REPAIR이면 공격으로 탈취된 노드의 라우팅을 증분 복구하는지 테스트"""
+        repair_routing = DijkstraRouting.repair_routing
+        with patch.object(DijkstraRouting, 'repair_routing', autospec=True,
+                          side_effect=repair_routing) as repair:
+            result = run_simulation(dict(self.config, ROUTING_INCREMENTAL_REPAIR=True))
+        self.assertTrue(result.routing.incremental_repair)
+        self.assertGreaterEqual(repair.call_count, 1)
+        malicious = set(result.field.get_categories().members("malicious"))
+        self.assertTrue(any(malicious & set(call.args[1]) for call in repair.call_args_list))
+
+        with patch.object(DijkstraRouting, 'repair_routing', autospec=True) as repair:
+            result = run_simulation(self.config)
+        self.assertFalse(result.routing.incremental_repair)
+        repair.assert_not_called()
+
+    def test_no_matplotlib_import(self):
+        """시각화를 요청하지 않으면 matplotlib을 불러오지 않는지 테스트"""
+        code = ("import sys\n"
+                "from utils.simulation import run_simulation\n"
+                "run_simulation({'NUM_NODES': 50, 'NUM_REPORTS': 2, 'DEBUG_MODE': False})\n"
+                "print('matplotlib' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip().splitlines()[-1], 'False')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import csv
+import tempfile
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+test_dir = os.path.dirname(current_dir)  # 상위 디렉토리 (test)
+project_root = os.path.dirname(test_dir)  # 프로젝트 루트
+sys.path.insert(0, project_root)
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+from utils.sweep import expand_grid, run_key, run_single, run_sweep
+
+class test_Sweep(unittest.TestCase):
+    """파라미터 스윕 실행기에 대한 유닛 테스트"""
+
+    def setUp(self):
+        """테스트 전 필요한 객체 생성"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.results_path = os.path.join(self.temp_dir.name, 'sweep_results.csv')
+        self.base_params = {'NUM_NODES': 200, 'NUM_REPORTS': 10}
+        self.calls = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def counting_runner(self, params):
+        """실행된 조합을 기록하고 ATTACK_RANGE가 음수이면 실패하는 가짜 실행기"""
+        self.calls.append(params)
+        if params['ATTACK_RANGE'] < 0:
+            return {'status': 'failed', 'error': 'negative range'}
+        return {'status': 'ok', 'error': '', 'total_tx': params['ATTACK_RANGE']}
+
+    def read_rows(self):
+        with open(self.results_path, newline='') as csvfile:
+            return list(csv.DictReader(csvfile))
+
+    def test_expand_grid(self):
+        """격자 조합 펼치기 테스트"""
+        combinations = expand_grid({'ATTACK_RANGE': [100, 150], 'RANDOM_SEED': [1, 2, 3], 'NUM_ATTACKERS': 1})
+        self.assertEqual(len(combinations), 6)
+        self.assertEqual(combinations[0], {'ATTACK_RANGE': 100, 'RANDOM_SEED': 1, 'NUM_ATTACKERS': 1})
+        self.assertEqual(run_key({'b': 1, 'a': 2}), run_key({'a': 2, 'b': 1}))
+
+    def test_run_single(self):
+        """조합 하나의 실행 요약과 잘못된 설정 처리 테스트"""
+        summary = run_single(dict(self.base_params, RANDOM_SEED=1))
+        self.assertEqual(summary['status'], 'ok', summary['error'])
+        self.assertEqual(summary['total_nodes'], 200 + 1)  # 외부 공격자 포함
+        self.assertEqual(summary['num_reports'], 10)
+        self.assertLessEqual(summary['delivered_reports'], summary['valid_reports'])
+        self.assertGreater(summary['total_tx'], 0)
+
+        # 같은 조합은 같은 결과 (다른 조합의 설정이 남지 않음)
+        run_single(dict(self.base_params, RANDOM_SEED=2, ATTACK_RANGE=300))
+        self.assertEqual(run_single(dict(self.base_params, RANDOM_SEED=1))['total_tx'], summary['total_tx'])
+
+        failed = run_single({'UNKNOWN_SETTING': 1})
+        self.assertEqual(failed['status'], 'failed')
+        self.assertIn('UNKNOWN_SETTING', failed['error'])
+
+    def test_resume_and_failures(self):
+        """실패 기록과 중단된 스윕 재개 테스트"""
+        grid = {'ATTACK_RANGE': [-1, 100, 150]}
+        rows = run_sweep(grid, self.results_path, workers=1, runner=self.counting_runner)
+        self.assertEqual([row['status'] for row in rows], ['failed', 'ok', 'ok'])
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual(len(self.read_rows()), 3)
+
+        # 다시 실행하면 실패한 조합과 새 조합만 실행
+        self.calls = []
+        grid = {'ATTACK_RANGE': [-1, 100, 150, 200]}
+        rows = run_sweep(grid, self.results_path, workers=1, runner=self.counting_runner)
+        self.assertEqual([params['ATTACK_RANGE'] for params in self.calls], [-1, 200])
+        self.assertEqual(len(rows), 4)
+        saved = self.read_rows()
+        self.assertEqual(len(saved), 4)
+        self.assertEqual(sorted(row['ATTACK_RANGE'] for row in saved), ['-1', '100', '150', '200'])
+
+    def test_process_pool(self):
+        """프로세스 풀 실행 결과가 순차 실행과 같은지 테스트"""
+        grid = {'RANDOM_SEED': [1, 2]}
+        rows = run_sweep(grid, self.results_path, workers=2, base_params=self.base_params)
+        self.assertEqual([row['status'] for row in rows], ['ok', 'ok'])
+        for row in rows:
+            params = dict(self.base_params, RANDOM_SEED=row['RANDOM_SEED'])
+            self.assertEqual(row['total_tx'], run_single(params)['total_tx'])
+
+if __name__ == '__main__':
+    unittest.main()
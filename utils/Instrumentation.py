@@ -0,0 +1,309 @@
+import cProfile
+import functools
+import importlib
+import json
+import logging
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from utils.data_handler import _results_path
+
+logger = logging.getLogger('wsn_simulation')
+
+
+class _NullPhase:
+    """계측기가 꺼져 있을 때의 단계 타이머 (아무것도 하지 않음)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """Instrumentation.phase가 반환하는 단계 타이머 컨텍스트"""
+
+    __slots__ = ('instrumentation', 'name', 'start')
+
+    def __init__(self, instrumentation, name):
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.instrumentation._enter(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.instrumentation._exit(self.start)
+        return False
+
+
+def phase(name):
+    """실행 중인 계측기가 있으면 name 단계 타이머, 없으면 아무것도 하지 않는 컨텍스트
+
+    with phase("report_loop"): ... 처럼 실행 단위의 구간을 감쌀 때 사용한다.
+    """
+    instrumentation = Instrumentation._active
+    return _NULL_PHASE if instrumentation is None else _Phase(instrumentation, name)
+
+
+class Instrumentation:
+    """단계별 시간과 진입점 호출 수를 재는 계측기 (JSON 성능 보고서)
+
+    start()부터 stop()까지 (또는 with 블록 동안):
+        - phase(name) 구간과 HOOKS의 진입점 호출을 perf_counter_ns로 재며, 안쪽 구간은
+          바깥 구간 아래의 경로("run_simulation/build_topology/Field.find_neighbors")로 집계한다
+        - 진입점 함수는 실행하는 동안에만 시간을 재는 래퍼로 바꾸고 stop()에서 원래 함수로
+          되돌리므로, 계측기가 꺼져 있을 때 드는 비용이 없다
+        - profile_mode="cprofile"이면 cProfile로 모든 함수를, "sampling"이면 백그라운드
+          스레드가 sample_interval초마다 시작한 스레드의 호출 스택을 표본으로 모은다
+    한 번에 하나의 계측기만 실행할 수 있으며, 시작한 스레드의 호출만 구간으로 집계한다.
+    """
+
+    PROFILE_MODES = (None, "cprofile", "sampling")
+
+    # 계측할 진입점 (모듈, 속성 경로) - 시작할 때 불러오므로 matplotlib 등은 포함하지 않음
+    HOOKS = (
+        ("core.Field", "Field.deploy_nodes"),
+        ("core.Field", "Field.find_neighbors"),
+        ("core.Field", "Field.find_path"),
+        ("core.routing.DijkstraRouting", "DijkstraRouting.setup_routing"),
+        ("core.routing.BaseRoutingProtocol", "BaseRoutingProtocol.get_path_to_bs"),
+        ("core.routing.BaseRoutingProtocol", "BaseRoutingProtocol.send_report"),
+        ("core.routing.BaseRoutingProtocol", "BaseRoutingProtocol.process_single_report"),
+        ("attacks.Sinkhole", "Sinkhole.execute_attack"),
+        ("attacks.Sinkhole", "Sinkhole.get_malicious_node_path"),
+        ("utils.data_handler", "save_nodes_state"),
+        ("utils.data_handler", "save_simulation_results"),
+        ("utils.data_handler", "save_nodes_state_columnar"),
+        ("utils.data_handler", "save_simulation_results_columnar"),
+        ("utils.simulation", "SimulationResult.save"),
+        ("utils.simulation", "SimulationResult.plot"),
+    )
+
+    _active = None  # 실행 중인 계측기
+
+    def __init__(self, profile_mode: str = None, sample_interval: float = 0.005, top: int = 30):
+        if profile_mode not in self.PROFILE_MODES:
+            raise ValueError(f"알 수 없는 프로파일 모드: {profile_mode} (사용 가능: None, cprofile, sampling)")
+        self.profile_mode = profile_mode
+        self.sample_interval = sample_interval
+        self.top = top  # 프로파일 결과에 남길 함수 수
+        self.phases = {}  # 구간 경로 튜플 -> [호출 수, 총 ns, 최대 ns]
+        self.hooked = set()  # 래퍼로 바꾼 진입점 이름
+        self.wall_ns = 0  # 실행한 동안의 총 시간
+        self._stack = []  # 현재 열려 있는 구간 이름
+        self._patched = []  # (소유 객체, 속성 이름, 원래 함수, 소유 객체에 직접 정의되어 있었는지)
+        self._started_ns = None
+        self._thread_id = None
+        self._profiler = None
+        self._sampler = None
+        self._stop_sampling = None
+        self._inclusive_samples = Counter()  # 함수 -> 호출 스택에 있던 표본 수
+        self._self_samples = Counter()  # 함수 -> 스택 맨 위에 있던 표본 수
+        self._num_samples = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    @classmethod
+    def current(cls):
+        """실행 중인 계측기 (없으면 None)"""
+        return cls._active
+
+    # ------------------------------------------------------------------
+    # 시작/종료
+    # ------------------------------------------------------------------
+    def start(self):
+        """진입점을 래퍼로 바꾸고 시간 측정과 (설정 시) 프로파일러 시작"""
+        if Instrumentation._active is not None:
+            raise RuntimeError("이미 실행 중인 계측기가 있습니다")
+        Instrumentation._active = self
+        self._thread_id = threading.get_ident()
+        for module_name, attribute in self.HOOKS:
+            owner = importlib.import_module(module_name)
+            *owner_path, name = attribute.split('.')
+            for part in owner_path:
+                owner = getattr(owner, part)
+            self.instrument(owner, name, attribute)
+
+        if self.profile_mode == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self.profile_mode == "sampling":
+            self._stop_sampling = threading.Event()
+            self._sampler = threading.Thread(target=self._sample_stacks, name='Instrumentation', daemon=True)
+            self._sampler.start()
+        self._started_ns = time.perf_counter_ns()
+
+    def stop(self):
+        """프로파일러를 멈추고 진입점을 원래 함수로 되돌림"""
+        if Instrumentation._active is not self:
+            return
+        self.wall_ns += time.perf_counter_ns() - self._started_ns
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+            self._sampler = None
+        for owner, name, original, had_own in reversed(self._patched):
+            if had_own:
+                setattr(owner, name, original)
+            else:
+                delattr(owner, name)
+        self._patched = []
+        Instrumentation._active = None
+
+    def instrument(self, owner, name, label=None):
+        """owner(클래스나 모듈)의 함수 name을 호출 수와 시간을 재는 래퍼로 바꿈 (stop에서 복원)"""
+        label = label or name
+        original = getattr(owner, name)
+        had_own = name in vars(owner)
+        own = vars(owner)[name] if had_own else None  # staticmethod 등 정의 그대로 복원
+        enter = self._enter
+        exit_ = self._exit
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            start = enter(label)
+            try:
+                return original(*args, **kwargs)
+            finally:
+                exit_(start)
+
+        setattr(owner, name, wrapper)
+        self._patched.append((owner, name, own, had_own))
+        self.hooked.add(label)
+
+    # ------------------------------------------------------------------
+    # 구간 측정
+    # ------------------------------------------------------------------
+    def phase(self, name):
+        """name 구간 타이머 컨텍스트 (열려 있는 구간 아래에 중첩됨)"""
+        return _Phase(self, name)
+
+    def _enter(self, name):
+        if threading.get_ident() != self._thread_id:
+            return None
+        self._stack.append(name)
+        self.phases.setdefault(tuple(self._stack), [0, 0, 0])
+        return time.perf_counter_ns()
+
+    def _exit(self, start):
+        if start is None:
+            return
+        elapsed = time.perf_counter_ns() - start
+        stats = self.phases[tuple(self._stack)]
+        self._stack.pop()
+        stats[0] += 1
+        stats[1] += elapsed
+        if elapsed > stats[2]:
+            stats[2] = elapsed
+
+    # ------------------------------------------------------------------
+    # 표본 프로파일러
+    # ------------------------------------------------------------------
+    def _sample_stacks(self):
+        """sample_interval초마다 시작한 스레드의 호출 스택을 기록 (백그라운드 스레드)"""
+        while not self._stop_sampling.wait(self.sample_interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            self._num_samples += 1
+            self._self_samples[self._frame_name(frame)] += 1
+            seen = set()
+            while frame is not None:
+                seen.add(self._frame_name(frame))
+                frame = frame.f_back
+            self._inclusive_samples.update(seen)
+
+    @staticmethod
+    def _frame_name(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_filename}:{code.co_firstlineno}({code.co_name})"
+
+    # ------------------------------------------------------------------
+    # 보고서
+    # ------------------------------------------------------------------
+    def report(self) -> dict:
+        """실행별 성능 보고서 (JSON으로 저장 가능한 딕셔너리)
+
+        phases: 구간 경로별 호출 수, 총/자체(안쪽 구간 제외)/최대 시간 (ns, 처음 열린 순서)
+        functions: 진입점 이름별 호출 수와 총 시간 (경로와 무관하게 합산)
+        profile: cProfile(누적 시간 순) 또는 표본 프로파일러(표본 수 순) 상위 top개 함수
+        """
+        wall_ns = self.wall_ns
+        if Instrumentation._active is self:
+            wall_ns += time.perf_counter_ns() - self._started_ns
+
+        children_ns = Counter()
+        for path, (_, total_ns, _) in self.phases.items():
+            if len(path) > 1:
+                children_ns[path[:-1]] += total_ns
+        phases = []
+        functions = {}
+        for path, (calls, total_ns, max_ns) in self.phases.items():
+            phases.append({
+                'path': '/'.join(path),
+                'depth': len(path) - 1,
+                'calls': calls,
+                'total_ns': total_ns,
+                'self_ns': total_ns - children_ns[path],
+                'max_ns': max_ns,
+            })
+            name = path[-1]
+            if name in self.hooked:
+                entry = functions.setdefault(name, {'calls': 0, 'total_ns': 0})
+                entry['calls'] += calls
+                entry['total_ns'] += total_ns
+
+        return {
+            'profile_mode': self.profile_mode,
+            'wall_ns': wall_ns,
+            'phases': phases,
+            'functions': functions,
+            'profile': self._profile_report(),
+        }
+
+    def _profile_report(self):
+        if self.profile_mode == "cprofile" and self._profiler is not None:
+            stats = pstats.Stats(self._profiler).stats
+            rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:self.top]
+            return [{
+                'function': f"{filename}:{line}({name})",
+                'calls': calls,
+                'primitive_calls': primitive_calls,
+                'total_seconds': total_time,
+                'cumulative_seconds': cumulative_time,
+            } for (filename, line, name), (primitive_calls, calls, total_time, cumulative_time, _) in rows]
+        if self.profile_mode == "sampling":
+            return {
+                'interval_seconds': self.sample_interval,
+                'samples': self._num_samples,
+                'functions': [{
+                    'function': name,
+                    'samples': count,
+                    'self_samples': self._self_samples[name],
+                } for name, count in self._inclusive_samples.most_common(self.top)],
+            }
+        return None
+
+    def export_json(self, filename='performance_report.json') -> str:
+        """성능 보고서를 results 폴더의 JSON 파일로 저장하고 파일 경로 반환"""
+        file_path = _results_path(filename)
+        with open(file_path, 'w') as jsonfile:
+            json.dump(self.report(), jsonfile, indent=2)
+        logger.info(f"Performance report saved to '{file_path}'")
+        return file_path
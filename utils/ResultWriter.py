@@ -0,0 +1,159 @@
+import csv
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import zipfile
+import numpy as np
+from numpy.lib import format as npy_format
+from utils.data_handler import (report_csv_row, report_columns, _results_path, PATH_BS)
+
+logger = logging.getLogger('wsn_simulation')
+
+
+class ResultWriter:
+    """보고서 결과를 백그라운드 스레드에서 파일로 흘려 쓰는 스트리밍 기록기
+
+    write(report)는 보고서를 chunk_size개씩 묶어 크기가 max_pending_chunks인 큐에 넣고,
+    기록 스레드가 큐를 비우며 묶음 단위로 파일에 쓴다. 큐가 가득 차면 write가 기다리므로
+    메모리에 남는 보고서는 최대 (max_pending_chunks + 2) * chunk_size개로 보고서 수와 무관하며,
+    파일 쓰기는 시뮬레이션 계산과 겹쳐 진행된다.
+
+    result_format이 "csv"이면 save_simulation_results와 같은 CSV를, "columnar"이면
+    save_simulation_results_columnar와 같은 .npz를 만든다. .npz는 열마다 임시 파일에 이어
+    쓴 뒤 close()에서 하나의 .npz로 묶는다.
+    """
+
+    _STOP = object()  # 기록 스레드 종료 신호
+
+    def __init__(self, filename: str, result_format: str = "csv", chunk_size: int = 1000,
+                 max_pending_chunks: int = 4):
+        if result_format not in ("csv", "columnar"):
+            raise ValueError(f"알 수 없는 결과 형식: {result_format}")
+        self.file_path = _results_path(filename)
+        self.result_format = result_format
+        self.chunk_size = chunk_size
+        self.count = 0  # write로 받은 보고서 수
+        self.chunks_written = 0
+        self._chunk = []
+        self._queue = queue.Queue(maxsize=max_pending_chunks)
+        self._error = None
+        self._closed = False
+
+        if result_format == "csv":
+            self._csvfile = open(self.file_path, 'w', newline='')
+            self._writer = csv.DictWriter(self._csvfile, fieldnames=['report_id', 'source_node', 'path'])
+            self._writer.writeheader()
+        else:
+            # 열별 임시 파일 (close에서 .npz로 묶음)
+            self._columns = {
+                'report_id': np.int64,
+                'source_node': np.int32,
+                'path_offsets': np.int64,
+                'path_nodes': np.int32,
+            }
+            self._parts = {name: open(f"{self.file_path}.{name}.part", 'w+b') for name in self._columns}
+            self._num_path_nodes = 0
+            self._parts['path_offsets'].write(np.zeros(1, dtype=np.int64).tobytes())
+
+        self._thread = threading.Thread(target=self._drain, name='ResultWriter', daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, report):
+        """보고서 하나 추가 (묶음이 차면 기록 큐에 넣음, 큐가 가득 차면 대기)"""
+        self._chunk.append(report)
+        self.count += 1
+        if len(self._chunk) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """모아 둔 보고서를 기록 큐에 넣음 (기록 스레드에서 난 예외는 여기서 다시 발생)"""
+        if self._error is not None:
+            raise self._error
+        if self._chunk:
+            self._queue.put(self._chunk)
+            self._chunk = []
+
+    def close(self) -> int:
+        """남은 보고서를 모두 기록하고 파일을 닫은 뒤 기록한 보고서 수 반환"""
+        if self._closed:
+            return self.count
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            if self.result_format == "csv":
+                self._csvfile.close()
+            else:
+                self._pack()
+        if self._error is not None:
+            raise self._error
+        logger.info(f"시뮬레이션 결과가 저장되었습니다: {self.file_path} ({self.count} reports)")
+        return self.count
+
+    # ------------------------------------------------------------------
+    # 기록 스레드
+    # ------------------------------------------------------------------
+    def _drain(self):
+        """큐에서 묶음을 꺼내 파일에 쓰는 기록 스레드 본체"""
+        while True:
+            chunk = self._queue.get()
+            if chunk is self._STOP:
+                return
+            if self._error is not None:
+                continue  # 오류 후에는 생산자가 막히지 않도록 큐만 비움
+            try:
+                if self.result_format == "csv":
+                    writer = self._writer
+                    for report in chunk:
+                        writer.writerow(report_csv_row(report))
+                    self._csvfile.flush()
+                else:
+                    self._write_columns(chunk)
+                self.chunks_written += 1
+            except Exception as e:
+                self._error = e
+
+    def _write_columns(self, chunk):
+        """묶음을 열 배열로 바꿔 열별 임시 파일 끝에 추가"""
+        report_ids, source_nodes, path_lengths, path_nodes = report_columns(chunk)
+        path_offsets = np.cumsum(path_lengths) + self._num_path_nodes
+        self._num_path_nodes += int(path_lengths.sum())
+        for name, array in (('report_id', report_ids), ('source_node', source_nodes),
+                            ('path_offsets', path_offsets), ('path_nodes', path_nodes)):
+            self._parts[name].write(array.tobytes())
+
+    def _pack(self):
+        """열별 임시 파일을 np.load로 읽을 수 있는 .npz 하나로 묶고 임시 파일 삭제"""
+        try:
+            if self._error is None:
+                counts = {'report_id': self.count, 'source_node': self.count,
+                          'path_offsets': self.count + 1, 'path_nodes': self._num_path_nodes}
+                with zipfile.ZipFile(self.file_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as npzfile:
+                    for name, dtype in self._columns.items():
+                        part = self._parts[name]
+                        part.seek(0)
+                        with npzfile.open(f"{name}.npy", 'w', force_zip64=True) as member:
+                            npy_format.write_array_header_2_0(member, {
+                                'descr': npy_format.dtype_to_descr(np.dtype(dtype)),
+                                'fortran_order': False,
+                                'shape': (counts[name],),
+                            })
+                            shutil.copyfileobj(part, member, 1024 * 1024)
+                    meta = np.array(json.dumps({'kind': 'simulation_results', 'path_bs': PATH_BS}))
+                    with npzfile.open("meta.npy", 'w') as member:
+                        npy_format.write_array(member, meta)
+        finally:
+            for part in self._parts.values():
+                part.close()
+                os.remove(part.name)
@@ -1,6 +1,14 @@
 import os
 import csv
+import itertools
+import json
 import logging
+import numpy as np
+from core.NodeStore import (NodeStore, NODE_TYPES, NODE_TYPE_CODES, STATUSES, STATUS_CODES,
+                            NEXT_HOP_NONE, NEXT_HOP_BS)
+from core.nodes.HardwareProfile import HardwareProfile
+from core.nodes.MicazMotes import MicazMotes
+from core.Field import Field
 
 logger = logging.getLogger('wsn_simulation')
 
@@ -83,6 +91,24 @@ def load_nodes_state(filename='nodes_state.csv'):
         logger.error(f"시도한 경로: {file_path}")
         return []
 
+def report_csv_row(result, fieldnames=('report_id', 'source_node', 'path')):
+    """보고서 결과를 CSV 행 딕셔너리로 변환 (source_energy 등은 제외, 경로는 문자열 리스트)"""
+    # source_energy를 제외한 데이터만 저장
+    filtered_result = {k: v for k, v in result.items() if k in fieldnames}
+    
+    # path 리스트의 각 요소를 정수로 변환
+    if 'path' in filtered_result:
+        path = filtered_result['path']
+        converted_path = []
+        for node in path:
+            if node == 'BS':
+                converted_path.append('BS')
+            else:
+                # numpy.int64나 다른 숫자 타입을 일반 정수로 변환
+                converted_path.append(str(int(node)))
+        filtered_result['path'] = converted_path
+    return filtered_result
+
 def save_simulation_results(results, filename='simulation_results.csv'):
     """시뮬레이션 결과를 CSV 파일로 저장
     
@@ -113,26 +139,304 @@ def save_simulation_results(results, filename='simulation_results.csv'):
                 
                 # numpy.int64를 일반 정수로 변환하여 저장
                 for result in results:
-                    # source_energy를 제외한 데이터만 저장
-                    filtered_result = {k: v for k, v in result.items() if k in fieldnames}
-                    
-                    # path 리스트의 각 요소를 정수로 변환
-                    if 'path' in filtered_result:
-                        path = filtered_result['path']
-                        converted_path = []
-                        for node in path:
-                            if node == 'BS':
-                                converted_path.append('BS')
-                            else:
-                                # numpy.int64나 다른 숫자 타입을 일반 정수로 변환
-                                converted_path.append(str(int(node)))
-                        filtered_result['path'] = converted_path
-                    
-                    writer.writerow(filtered_result)
+                    writer.writerow(report_csv_row(result, fieldnames))
             
             logger.info(f"시뮬레이션 결과가 저장되었습니다: {file_path}")
         else:
             logger.warning("저장할 시뮬레이션 결과가 없습니다.")
     except Exception as e:
         logger.error(f"결과 저장 중 오류 발생: {e}")
-        logger.error(f"시도한 경로: {file_path}") 
\ No newline at end of file
+        logger.error(f"시도한 경로: {file_path}") 
+
+# ----------------------------------------------------------------------
+# 열 단위(columnar) 바이너리 결과 형식 (.npz)
+# ----------------------------------------------------------------------
+# 노드 상태는 NodeStore 열을 그대로 타입 있는 배열로, 보고서 경로는 모든 경로를 이어 붙인
+# int32 배열(path_nodes)과 보고서별 시작 위치(path_offsets, 길이 = 보고서 수 + 1)로 저장한다.
+# 경로의 "BS"는 PATH_BS 센티널로 저장한다. CSV가 필요하면 columnar_to_csv로 변환한다.
+PATH_BS = NEXT_HOP_BS
+
+# 노드 상태 파일에 저장하는 NodeStore 열 (CSV의 나머지 값은 이 열과 하드웨어 프로필로 계산)
+NODE_STATE_COLUMNS = ('node_id', 'pos_x', 'pos_y', 'status', 'node_type', 'hop_count', 'next_hop',
+                      'route_changes', 'distance_to_bs', 'tx_count', 'rx_count', 'energy_level',
+                      'consumed_energy_tx', 'consumed_energy_rx', 'total_consumed_energy', 'profile')
+
+# 노드 상태 CSV 스키마 (MicazMotes.get_node_state_dict의 열 순서와 각 열의 해석 방식)
+# int/float: 숫자, status/node_type: 이름 -> 정수 코드, hop: 홉 수(inf 허용),
+# next_hop: ''/BS/노드 ID -> 센티널 포함 정수, profile: 하드웨어 프로필 상수, None: 다른 열로 계산되는 값
+NODE_STATE_SCHEMA = {
+    'node_id': 'int', 'pos_x': 'float', 'pos_y': 'float', 'status': 'status', 'node_type': 'node_type',
+    'hop_count': 'hop', 'next_hop': 'next_hop', 'neighbor_nodes': 'int', 'route_changes': 'int',
+    'distance_to_bs': 'float', 'tx_count': 'int', 'rx_count': 'int', 'energy_level': 'float',
+    'initial_energy': 'profile', 'energy_percentage': None, 'consumed_energy_tx': 'float',
+    'consumed_energy_rx': 'float', 'total_consumed_energy': 'float', 'tx_energy_per_byte': 'profile',
+    'rx_energy_per_byte': 'profile', 'tx_power': None, 'rx_power': None,
+}
+
+# CSV 변환 시 노드 상태 열 순서
+NODE_STATE_FIELDS = list(NODE_STATE_SCHEMA)
+PROFILE_FIELDS = ('initial_energy', 'tx_energy_per_byte', 'rx_energy_per_byte', 'voltage',
+                  'tx_current', 'rx_current')
+
+
+def _results_path(filename):
+    """results 폴더 안의 파일 경로 (폴더가 없으면 생성)"""
+    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    folder_path = os.path.join(script_dir, 'results')
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+    return os.path.join(folder_path, filename)
+
+
+def save_nodes_state_columnar(wsn_field, filename='nodes_state.npz'):
+    """전체 네트워크의 노드 상태를 타입 있는 열 배열(.npz)로 저장
+
+    노드 순서는 save_nodes_state(CSV)와 같은 wsn_field.nodes 순서이며,
+    status/node_type은 정수 코드, next_hop은 센티널(-1: 없음, -2: BS)로 저장한다.
+    """
+    file_path = _results_path(filename)
+    nodes = wsn_field.nodes
+    try:
+        node_ids = np.fromiter(nodes.keys(), dtype=np.int64, count=len(nodes))
+        if isinstance(nodes, NodeStore):
+            rows = nodes.rows_of(node_ids)
+            arrays = {name: nodes._data[name][rows] for name in NODE_STATE_COLUMNS}
+        else:
+            # 노드마다 다른 저장소의 행을 가리키는 경우
+            arrays = {name: np.array([node._store._data[name][node._row] for node in nodes.values()],
+                                     dtype=NodeStore.COLUMNS[name])
+                      for name in NODE_STATE_COLUMNS}
+        arrays['neighbor_count'] = np.fromiter((len(node.neighbor_nodes) for node in nodes.values()),
+                                               dtype=np.int32, count=len(nodes))
+        profiles = {str(profile.index): {name: getattr(profile, name) for name in PROFILE_FIELDS}
+                    for profile in HardwareProfile.registry}
+        arrays['meta'] = np.array(json.dumps({'kind': 'nodes_state', 'node_types': NODE_TYPES,
+                                              'statuses': STATUSES, 'profiles': profiles}))
+        with open(file_path, 'wb') as npzfile:
+            np.savez(npzfile, **arrays)
+        logger.info(f"파일이 성공적으로 저장되었습니다: {file_path}")
+    except Exception as e:
+        logger.error(f"파일 저장 중 오류 발생: {e}")
+        logger.error(f"시도한 경로: {file_path}")
+
+
+def report_columns(results):
+    """보고서 결과 리스트를 (report_id int64, source_node int32, 경로 길이 int64, 경로 노드 int32) 배열로 변환
+
+    경로 노드는 모든 경로를 이어 붙인 배열이며 "BS"는 PATH_BS 센티널이다.
+    """
+    num_reports = len(results)
+    paths = [result['path'] for result in results]
+    path_lengths = np.fromiter(map(len, paths), dtype=np.int64, count=num_reports)
+    num_nodes = int(path_lengths.sum())
+    try:
+        # "BS"만 센티널로 바꾸는 C 수준 map (정수 노드 ID 경로)
+        bs_code = {'BS': PATH_BS}
+        path_nodes = np.fromiter(map(bs_code.get, itertools.chain.from_iterable(paths),
+                                     itertools.chain.from_iterable(paths)),
+                                 dtype=np.int32, count=num_nodes)
+    except (TypeError, ValueError):
+        # 문자열 노드 ID 등이 섞인 경로
+        path_nodes = np.fromiter((PATH_BS if node == 'BS' else int(node)
+                                  for path in paths for node in path),
+                                 dtype=np.int32, count=num_nodes)
+    report_ids = np.fromiter((result['report_id'] for result in results), dtype=np.int64,
+                             count=num_reports)
+    source_nodes = np.fromiter((result['source_node'] for result in results), dtype=np.int32,
+                               count=num_reports)
+    return report_ids, source_nodes, path_lengths, path_nodes
+
+
+def save_simulation_results_columnar(results, filename='simulation_results.npz'):
+    """시뮬레이션 결과를 열 배열(.npz)로 저장
+
+    report_id(int64), source_node(int32)와 경로(path_nodes int32 + path_offsets int64)를
+    저장한다. 보고서 i의 경로는 path_nodes[path_offsets[i]:path_offsets[i + 1]]이다.
+    """
+    file_path = _results_path(filename)
+    try:
+        if not results:
+            logger.warning("저장할 시뮬레이션 결과가 없습니다.")
+            return
+        report_ids, source_nodes, path_lengths, path_nodes = report_columns(results)
+        path_offsets = np.zeros(len(results) + 1, dtype=np.int64)
+        np.cumsum(path_lengths, out=path_offsets[1:])
+        arrays = {
+            'report_id': report_ids,
+            'source_node': source_nodes,
+            'path_offsets': path_offsets,
+            'path_nodes': path_nodes,
+            'meta': np.array(json.dumps({'kind': 'simulation_results', 'path_bs': PATH_BS})),
+        }
+        with open(file_path, 'wb') as npzfile:
+            np.savez(npzfile, **arrays)
+        logger.info(f"시뮬레이션 결과가 저장되었습니다: {file_path}")
+    except Exception as e:
+        logger.error(f"결과 저장 중 오류 발생: {e}")
+        logger.error(f"시도한 경로: {file_path}")
+
+
+def load_columnar(filename):
+    """열 단위 결과 파일(.npz)을 {열 이름: 배열} 딕셔너리로 로드 ('meta'는 딕셔너리로 변환)"""
+    file_path = _results_path(filename) if not os.path.isabs(filename) else filename
+    with np.load(file_path) as data:
+        columns = {name: data[name] for name in data.files}
+    columns['meta'] = json.loads(str(columns['meta']))
+    return columns
+
+
+def report_paths(columns):
+    """load_columnar로 읽은 보고서 열에서 경로 리스트([노드 ID, ..., "BS"])를 차례로 생성"""
+    offsets = columns['path_offsets'].tolist()
+    path_bs = columns['meta']['path_bs']
+    nodes = ['BS' if node == path_bs else node for node in columns['path_nodes'].tolist()]
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        yield nodes[start:end]
+
+
+def columnar_to_csv(filename, csv_filename=None):
+    """열 단위 결과 파일(.npz)을 save_nodes_state/save_simulation_results와 같은 형식의 CSV로 변환
+
+    csv_filename이 없으면 확장자만 .csv로 바꾼 이름을 사용하고, 저장한 CSV 경로를 반환한다.
+    """
+    columns = load_columnar(filename)
+    if csv_filename is None:
+        csv_filename = os.path.splitext(os.path.basename(filename))[0] + '.csv'
+    file_path = _results_path(csv_filename)
+    meta = columns['meta']
+
+    with open(file_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        if meta['kind'] == 'simulation_results':
+            writer.writerow(['report_id', 'source_node', 'path'])
+            for report_id, source_node, path in zip(columns['report_id'].tolist(),
+                                                    columns['source_node'].tolist(),
+                                                    report_paths(columns)):
+                writer.writerow([report_id, source_node, str([str(node) for node in path])])
+        else:
+            writer.writerow(NODE_STATE_FIELDS)
+            node_types = meta['node_types']
+            statuses = meta['statuses']
+            profiles = meta['profiles']
+            values = {name: columns[name].tolist() for name in NODE_STATE_COLUMNS}
+            for i, neighbor_count in enumerate(columns['neighbor_count'].tolist()):
+                profile = profiles[str(values['profile'][i])]
+                hop_count = values['hop_count'][i]
+                next_hop = values['next_hop'][i]
+                energy_level = values['energy_level'][i]
+                writer.writerow([
+                    values['node_id'][i], values['pos_x'][i], values['pos_y'][i],
+                    statuses[values['status'][i]], node_types[values['node_type'][i]],
+                    hop_count if hop_count == float('inf') else int(hop_count),
+                    '' if next_hop == NEXT_HOP_NONE else ('BS' if next_hop == NEXT_HOP_BS else next_hop),
+                    neighbor_count, values['route_changes'][i], values['distance_to_bs'][i],
+                    values['tx_count'][i], values['rx_count'][i], energy_level,
+                    profile['initial_energy'], (energy_level / profile['initial_energy']) * 100,
+                    values['consumed_energy_tx'][i], values['consumed_energy_rx'][i],
+                    values['total_consumed_energy'][i], profile['tx_energy_per_byte'],
+                    profile['rx_energy_per_byte'], profile['voltage'] * profile['tx_current'],
+                    profile['voltage'] * profile['rx_current'],
+                ])
+    logger.info(f"CSV로 변환되었습니다: {file_path}")
+    return file_path
+
+
+def _decode_names(values, codes, column):
+    """이름 문자열 배열을 정수 코드 배열로 변환 (알 수 없는 이름이면 ValueError)"""
+    decoded = np.full(len(values), -1, dtype=np.int8)
+    for name, code in codes.items():
+        decoded[values == name] = code
+    if (decoded < 0).any():
+        unknown = values[decoded < 0][0]
+        raise ValueError(f"알 수 없는 {column}: {unknown}")
+    return decoded
+
+
+def load_nodes_state_arrays(filename='nodes_state.csv'):
+    """저장된 노드 상태를 NodeStore 열 이름의 타입 있는 배열 딕셔너리로 로드
+
+    CSV는 NODE_STATE_SCHEMA에 따라 숫자 열과 문자열 열을 각각 한 번의 np.loadtxt(C 파서)로
+    읽고 열 단위로 변환한다 (셀마다 형식을 추측하지 않음). .npz(save_nodes_state_columnar)도 읽는다.
+    반환값에는 NODE_STATE_COLUMNS 열과 이웃 수('neighbor_count')가 들어 있다.
+    """
+    file_path = _results_path(filename)
+    if file_path.endswith('.npz'):
+        columns = load_columnar(file_path)
+        columns.pop('meta')
+        return columns
+
+    with open(file_path, newline='') as csvfile:
+        header = csvfile.readline().rstrip('\r\n').split(',')
+    if header != NODE_STATE_FIELDS:
+        raise ValueError(f"노드 상태 CSV 열이 스키마와 다릅니다: {header}")
+
+    numeric = [name for name, kind in NODE_STATE_SCHEMA.items()
+               if kind in ('int', 'float', 'hop', 'profile')]
+    text = [name for name, kind in NODE_STATE_SCHEMA.items() if kind in ('status', 'node_type', 'next_hop')]
+    numbers = np.loadtxt(file_path, delimiter=',', skiprows=1, dtype=np.float64, ndmin=2,
+                         usecols=[header.index(name) for name in numeric])
+    names = np.loadtxt(file_path, delimiter=',', skiprows=1, dtype=str, ndmin=2,
+                       usecols=[header.index(name) for name in text])
+    numbers = {name: numbers[:, i] for i, name in enumerate(numeric)}
+    names = {name: names[:, i] for i, name in enumerate(text)}
+
+    arrays = {}
+    for name, kind in NODE_STATE_SCHEMA.items():
+        if kind in ('int', 'float', 'hop'):
+            dtype = NodeStore.COLUMNS.get(name, np.int32)
+            arrays[name] = numbers[name].astype(dtype)
+    arrays['neighbor_count'] = arrays.pop('neighbor_nodes')
+    arrays['status'] = _decode_names(names['status'], STATUS_CODES, 'status')
+    arrays['node_type'] = _decode_names(names['node_type'], NODE_TYPE_CODES, 'node_type')
+
+    next_hop = names['next_hop']
+    arrays['next_hop'] = np.full(len(next_hop), NEXT_HOP_NONE, dtype=np.int64)
+    arrays['next_hop'][next_hop == 'BS'] = NEXT_HOP_BS
+    has_node = (next_hop != '') & (next_hop != 'BS')
+    arrays['next_hop'][has_node] = next_hop[has_node].astype(np.int64)
+
+    # 하드웨어 프로필: 저장된 상수가 같은 등록 프로필의 번호
+    profile_fields = [name for name, kind in NODE_STATE_SCHEMA.items() if kind == 'profile']
+    arrays['profile'] = np.full(len(arrays['node_id']), -1, dtype=np.int16)
+    for profile in reversed(HardwareProfile.registry):  # 상수가 같으면 먼저 등록된 프로필
+        matches = np.ones(len(arrays['profile']), dtype=bool)
+        for name in profile_fields:
+            matches &= numbers[name] == getattr(profile, name)
+        arrays['profile'][matches] = profile.index
+    if (arrays['profile'] < 0).any():
+        row = int(np.flatnonzero(arrays['profile'] < 0)[0])
+        values = [float(numbers[name][row]) for name in profile_fields]
+        raise ValueError(f"저장된 하드웨어 상수와 같은 프로필이 없습니다: {values}")
+    return arrays
+
+
+def load_field(filename='nodes_state.csv', width=None, height=None, bs_position=None,
+               find_neighbors: bool = True):
+    """저장된 노드 상태(CSV 또는 .npz)로 시뮬레이션을 이어서 실행할 수 있는 Field 복원
+
+    노드 위치, 상태, 종류, 에너지, 패킷 카운터, 라우팅 포인터(next_hop/hop_count)를 그대로
+    복원하고, 이웃 리스트는 위치와 통신 범위로 다시 계산한다 (find_neighbors=False이면 비워 두며,
+    노드가 많을 때는 이 계산이 로드 시간의 대부분이다). 필드 크기와 BS 위치는 파일에
+    없으므로 인자로 주며, 주지 않으면 config.py의 FIELD_SIZE와 BS_POSITION을 사용한다.
+    복원한 Field로 라우팅 객체를 만들면 라우팅 트리는 저장된 next_hop으로 구성된다.
+    """
+    arrays = load_nodes_state_arrays(filename)
+    if width is None or height is None or bs_position is None:
+        import config
+        width = config.FIELD_SIZE if width is None else width
+        height = config.FIELD_SIZE if height is None else height
+        bs_position = config.BS_POSITION if bs_position is None else bs_position
+
+    field = Field(width, height)
+    store = field.nodes
+    node_ids = arrays['node_id']
+    MicazMotes.create_many(node_ids, arrays['pos_x'], arrays['pos_y'], store)
+    field.set_base_station(*bs_position)
+    rows = store.rows_of(node_ids)
+    for name in NODE_STATE_COLUMNS:
+        store._data[name][rows] = arrays[name]
+    store._data['comm_range'][rows] = HardwareProfile.column('comm_range')[arrays['profile']]
+    if find_neighbors:
+        field.find_neighbors()
+    logger.info(f"노드 상태로 필드를 복원했습니다: {len(store)} nodes")
+    return field
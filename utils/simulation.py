@@ -0,0 +1,430 @@
+"""헤드리스 시뮬레이션 실행
+
+run_simulation(config)은 config.py와 같은 이름의 설정 딕셔너리를 받아 필드 구성, 라우팅 설정,
+공격 시뮬레이션을 실행하고 결과를 메모리에 담은 SimulationResult를 반환한다.
+matplotlib은 SimulationResult.plot()을 호출할 때만 import하므로 배치 워커가 시각화
+라이브러리를 불러오는 비용 없이 바로 시작할 수 있다.
+"""
+import logging
+import os
+import time
+
+import numpy as np
+
+import config as default_config
+from core.Field import Field
+from core.TopologyCache import TopologyCache
+from core.Simulator import Simulator
+from core.TimeSeriesRecorder import TimeSeriesRecorder
+from core.routing.routing_factory import get_routing_protocol
+from utils.ResultWriter import ResultWriter
+from utils.Instrumentation import Instrumentation, phase
+from attacks.Sinkhole import Sinkhole
+
+logger = logging.getLogger('wsn_simulation')
+
+
+def load_config(config=None) -> dict:
+    """config.py의 설정(대문자 이름)에 config의 값을 덮어쓴 설정 딕셔너리 반환
+
+    config는 {설정 이름: 값} 딕셔너리 또는 대문자 속성을 가진 객체(모듈 등)이며,
+    config.py에 없는 이름이 있으면 ValueError를 발생시킨다.
+    """
+    settings = {name: getattr(default_config, name) for name in dir(default_config) if name.isupper()}
+    if config is None:
+        return settings
+    if not isinstance(config, dict):
+        config = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+    unknown = [name for name in config if name not in settings]
+    if unknown:
+        raise ValueError(f"알 수 없는 설정 이름: {', '.join(unknown)}")
+    settings.update(config)
+    return settings
+
+
+class SimulationResult:
+    """run_simulation의 실행 결과
+
+    - field, routing: 시뮬레이션이 끝난 필드와 라우팅 객체
+    - reports: 유효한 보고서 결과 리스트 (simulate_with_attack의 반환값)
+    - delivered: BS에 도착한 보고서 리스트 (latency 포함)
+    - statistics: 네트워크 통계 (analyze_network_statistics의 반환값)
+    - streamed_to: 보고서를 ResultWriter로 흘려 쓴 파일 경로 (이때 reports/delivered는 비어 있음)
+    - recorder: 보고서 진행에 따른 시계열과 수명 지표 (TimeSeriesRecorder, RECORD_STRIDE가 0이면 None)
+    - performance: 단계별 시간과 함수 호출 수 (Instrumentation.report(), run_simulation이 PROFILE로 계측한 경우)
+    """
+
+    def __init__(self, config, field, routing, reports, delivered, statistics,
+                 simulated_seconds=0.0, events_processed=0):
+        self.config = config
+        self.field = field
+        self.routing = routing
+        self.reports = reports
+        self.delivered = delivered
+        self.statistics = statistics
+        self.simulated_seconds = simulated_seconds
+        self.events_processed = events_processed
+        self.elapsed_seconds = 0.0  # run_simulation 전체 소요 시간 (wall-clock)
+        self.streamed_to = None
+        self.recorder = None
+        self.performance = None  # 성능 보고서 (PROFILE이면 Instrumentation.report()의 반환값)
+        # 보고서 개수와 지연 통계 (스트리밍 시에도 유지)
+        latencies = [report['latency'] for report in delivered]
+        self.valid_reports = len(reports)
+        self.delivered_reports = len(latencies)
+        self.average_latency = float(np.mean(latencies)) if latencies else None
+        self.max_latency = max(latencies) if latencies else None
+
+    def summary(self) -> dict:
+        """실행 결과 요약 (스윕 결과 표의 한 행에 해당하는 스칼라 값들)"""
+        total_nodes = len(self.field.nodes)
+        summary = {
+            'elapsed_seconds': self.elapsed_seconds,
+            'simulated_seconds': self.simulated_seconds,
+            'num_reports': self.config['NUM_REPORTS'],
+            'valid_reports': self.valid_reports,
+            'delivered_reports': self.delivered_reports,
+            'average_latency_ms': self.average_latency * 1000 if self.delivered_reports else '',
+            'active_nodes': self.statistics['active_nodes'],
+            'total_nodes': total_nodes,
+            'total_energy': self.statistics['total_energy'],
+            'total_tx': self.statistics['total_tx'],
+            'total_rx': self.statistics['total_rx'],
+            'nodes_with_energy': len(self.statistics['nodes_with_energy']),
+            'nodes_with_tx': len(self.statistics['nodes_with_tx']),
+            'nodes_with_rx': len(self.statistics['nodes_with_rx']),
+        }
+        if self.recorder is not None:
+            summary.update({name: '' if value is None else value
+                            for name, value in self.recorder.lifetime().items()})
+        return summary
+
+    def save(self, nodes_file=None, results_file='simulation_results.csv'):
+        """노드 상태와 보고서 결과를 results 폴더에 저장
+
+        RESULT_FORMAT이 "columnar"이면 확장자를 .npz로 바꾼 이름의 열 단위 바이너리 파일로 저장한다.
+        보고서를 이미 스트리밍으로 기록했으면(streamed_to) 노드 상태만 저장한다.
+        """
+        from utils import data_handler
+        nodes_file = nodes_file or self.config['SAVE_FILE_NAME']
+        if self.config['RESULT_FORMAT'] == "columnar":
+            data_handler.save_nodes_state_columnar(self.field, os.path.splitext(nodes_file)[0] + '.npz')
+            if self.streamed_to is None:
+                data_handler.save_simulation_results_columnar(self.reports,
+                                                              os.path.splitext(results_file)[0] + '.npz')
+        else:
+            data_handler.save_nodes_state(self.field, nodes_file)
+            if self.streamed_to is None:
+                data_handler.save_simulation_results(self.reports, results_file)
+
+    def plot(self):
+        """네트워크 배치 그림과 보고서 전송 애니메이션 (이때 matplotlib을 import)"""
+        import matplotlib.pyplot as plt
+        try:
+            import seaborn as sns
+            plt.style.use('seaborn')
+        except ImportError:
+            plt.style.use('default')  # matplotlib 기본 스타일 사용
+        from utils.visualize_network import plot_wsn_network, classify_wsn_nodes
+        from utils.animation import animate_report_transmission
+
+        config = self.config
+        classified_nodes = classify_wsn_nodes(self.field)
+        plot_wsn_network(self.field, classified_nodes, config['ATTACK_RANGE'])
+        animation_config = {name: config[name] for name in (
+            'ENABLE_ANIMATION', 'ANIMATION_INTERVAL', 'ANIMATION_FPS', 'SAVE_ANIMATION',
+            'LIVE_ANIMATION', 'STEPS_PER_PATH', 'PACKET_SIZE', 'ATTACK_RANGE')}
+        animate_report_transmission(self.field, self.reports, classified_nodes, animation_config)
+
+
+def run_simulation(config=None, plot: bool = False, stream_to: str = None) -> SimulationResult:
+    """설정으로 필드 구성부터 공격 시뮬레이션까지 실행하고 SimulationResult 반환
+
+    config가 None이면 config.py의 설정을 그대로 사용한다 (load_config 참고).
+    plot=True이면 실행 후 네트워크 그림과 애니메이션을 표시한다.
+    stream_to(results 폴더 기준 파일 이름)를 주면 보고서를 메모리에 모으지 않고 백그라운드
+    기록 스레드(ResultWriter)로 RESULT_FORMAT 형식의 파일에 묶음 단위로 흘려 쓴다.
+    """
+    start_time = time.time()
+    config = load_config(config)
+
+    # PROFILE이면 단계별 시간 측정 시작 (이미 실행 중인 계측기가 있으면 그 안의 구간으로 기록)
+    instrumentation = None
+    if config['PROFILE'] and Instrumentation.current() is None:
+        instrumentation = Instrumentation(config['PROFILE_MODE'], config['PROFILE_SAMPLE_INTERVAL'])
+        instrumentation.start()
+    try:
+        with phase("run_simulation"):
+            # 재현성을 위한 랜덤 시드 설정
+            np.random.seed(config['RANDOM_SEED'])
+            logger.debug(f"Random seed set to {config['RANDOM_SEED']}")
+
+            # 1~2. 필드 구성과 라우팅 설정 (토폴로지 캐시에 있으면 복원)
+            with phase("build_topology"):
+                wsn_field, routing = build_topology(config)
+            field_size = config['FIELD_SIZE']
+            logger.info(f"Field created with {config['NUM_NODES']} nodes, size {field_size}x{field_size}m")
+            logger.info(f"Base station set at position {config['BS_POSITION']}")
+            logger.info(f"Routing setup completed using {config['ROUTING_PROTOCOL']} protocol")
+
+            # 3. 시뮬레이션 실행 (공격 시점 고려)
+            if stream_to is None:
+                result = simulate_with_attack(wsn_field, routing, config)
+            else:
+                if config['RESULT_FORMAT'] == "columnar":
+                    stream_to = os.path.splitext(stream_to)[0] + '.npz'
+                with ResultWriter(stream_to, config['RESULT_FORMAT'], config['STREAM_CHUNK_SIZE'],
+                                  config['STREAM_MAX_PENDING_CHUNKS']) as writer:
+                    result = simulate_with_attack(wsn_field, routing, config, sink=writer.write)
+                result.streamed_to = writer.file_path
+            result.elapsed_seconds = time.time() - start_time
+
+            if plot:
+                result.plot()
+    finally:
+        if instrumentation is not None:
+            instrumentation.stop()
+    if instrumentation is not None:
+        result.performance = instrumentation.report()
+        instrumentation.export_json(config['PROFILE_REPORT_FILE'])
+    return result
+
+
+def topology_cache(config):
+    """config의 TOPOLOGY_CACHE_DIR(results 폴더 기준)에 대한 TopologyCache (None이면 캐시 미사용)"""
+    if not config['TOPOLOGY_CACHE_DIR']:
+        return None
+    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    directory = os.path.join(script_dir, 'results', config['TOPOLOGY_CACHE_DIR'])
+    return TopologyCache(directory, int(config['TOPOLOGY_CACHE_MAX_MB'] * 1024 * 1024))
+
+
+def build_topology(config, cache=None):
+    """노드 배치, BS 설정, 이웃 탐색, 라우팅 설정을 실행하고 (Field, 라우팅) 반환
+
+    cache(기본: topology_cache(config))가 있으면 같은 입력으로 만든 토폴로지를 복원하고,
+    없으면 새로 만든 뒤 저장한다. 복원 후의 난수 상태는 새로 만든 경우와 같다.
+    """
+    if cache is None:
+        cache = topology_cache(config)
+    field_size = config['FIELD_SIZE']
+
+    def create_routing(wsn_field):
+        return get_routing_protocol(config['ROUTING_PROTOCOL'], wsn_field, config['ROUTING_LINK_COST'],
+                                    config['ROUTING_INCREMENTAL_REPAIR'])
+
+    key = None
+    if cache is not None:
+        key = TopologyCache.key(seed=config['RANDOM_SEED'], field_size=field_size,
+                                num_nodes=config['NUM_NODES'], deployment_type=config['DEPLOYMENT_TYPE'],
+                                deployment_params=config['DEPLOYMENT_PARAMS'],
+                                bs_position=list(config['BS_POSITION']),
+                                routing_protocol=config['ROUTING_PROTOCOL'].lower(),
+                                link_cost=config['ROUTING_LINK_COST'])
+        restored = cache.load(key, create_routing)
+        if restored is not None:
+            logger.debug(f"Topology restored from cache ({key[:12]})")
+            return restored
+
+    wsn_field = Field(field_size, field_size)
+    wsn_field.deploy_nodes(config['NUM_NODES'], config['DEPLOYMENT_TYPE'], **config['DEPLOYMENT_PARAMS'])
+    wsn_field.set_base_station(*config['BS_POSITION'])
+    wsn_field.find_neighbors()
+    routing = create_routing(wsn_field)
+    routing.setup_routing()
+    if cache is not None:
+        cache.store(key, wsn_field, routing)
+    return wsn_field, routing
+
+
+def simulate_with_attack(wsn_field, routing, config, num_reports=None, sink=None) -> SimulationResult:
+    """공격 시점을 고려한 시뮬레이션 실행 (num_reports가 None이면 config의 NUM_REPORTS)
+
+    sink(report)를 주면 유효한 보고서를 만들어지는 대로 sink에 넘기고 메모리에 남기지 않는다
+    (예: ResultWriter.write). 이때 결과의 reports/delivered는 비어 있고 개수와 지연 통계만 남는다.
+    RECORD_STRIDE가 0보다 크면 실행 동안 routing.recorder에 TimeSeriesRecorder를 연결해
+    보고서 진행에 따른 시계열과 수명 지표를 기록한다 (결과의 recorder).
+    """
+    if num_reports is None:
+        num_reports = config['NUM_REPORTS']
+    attack_probability = config['ATTACK_PROBABILITY']
+    report_interval = config['REPORT_INTERVAL']
+    debug_mode = config['DEBUG_MODE']
+    results = []
+    counts = {'valid': 0, 'delivered': 0, 'latency_total': 0.0, 'latency_max': 0.0}
+    latest = [None]  # 마지막으로 기록한 보고서 (DEBUG_MODE 경로 출력용)
+
+    # 공격 객체 준비
+    attack = Sinkhole(wsn_field, attack_type=config['ATTACK_TYPE'], attack_range=config['ATTACK_RANGE'],
+                      routing=routing, grid_size=config['ATTACK_GRID_SIZE'], regions=config['ATTACK_REGIONS'])
+
+    logger.info(f"\nSimulating {config['NUM_REPORTS']} Report Transmissions:")
+    logger.info("-" * 50)
+    logger.info(f"Attack probability: {attack_probability}% per report")
+
+    start_time = time.time()
+
+    def validate_path(path):
+        """경로의 유효성을 검증하는 함수"""
+        if not path:
+            return False
+
+        for node_id in path:
+            if node_id == "BS":
+                continue
+            if not isinstance(node_id, (int, str)):
+                return False
+            if isinstance(node_id, str) and not node_id.isdigit():
+                return False
+            node_id = int(node_id)
+            if node_id not in wsn_field.nodes:
+                return False
+        return True
+
+    # 공격과 보고서 발생을 사건으로 예약 (보고서는 REPORT_INTERVAL초 간격, 홉 지연은 패킷 전송 시간)
+    simulator = Simulator()
+    recorder = None
+    if config['RECORD_STRIDE']:
+        recorder = TimeSeriesRecorder(wsn_field, config['RECORD_CAPACITY'], config['RECORD_STRIDE'],
+                                      config['RECORD_QUANTILES'], config['LIFETIME_DEAD_FRACTIONS'],
+                                      config['RECORD_QUANTILE_SAMPLE'])
+    previous_recorder, routing.recorder = routing.recorder, recorder
+    delivered = []
+
+    def record(result):
+        """유효한 보고서 기록 (sink가 있으면 바로 넘김)"""
+        counts['valid'] += 1
+        latest[0] = result
+        if sink is not None:
+            sink(result)
+        else:
+            results.append(result)
+
+    def on_delivered(report):
+        """BS 도착 사건 - 지연 시간 통계 갱신"""
+        counts['delivered'] += 1
+        counts['latency_total'] += report['latency']
+        counts['latency_max'] = max(counts['latency_max'], report['latency'])
+        if sink is None:
+            delivered.append(report)
+
+    def on_attack_executed(malicious_nodes):
+        """초기 공격 실행 사건"""
+        logger.info(f"\nInitial Sinkhole Attack Executed:")
+        logger.info(f"Number of malicious nodes: {len(malicious_nodes)}")
+        logger.info(f"Malicious node IDs: {malicious_nodes}")
+
+    def generate_report(report_id):
+        """보고서 발생 타이머 사건"""
+        # 공격 확률에 따라 소스 노드 선택
+        if np.random.randint(1, 101) <= attack_probability:
+            # affected 노드나 그 이웃 노드에서 보고서 생성
+            source_node = attack.sample_report_source()
+
+            if source_node is not None:
+                # malicious 노드로 향하는 경로 생성
+                path = attack.get_malicious_node_path(source_node)
+
+                if path:
+                    # 경로를 따라 패킷 전송 (사건 단위)
+                    result = routing.send_report(simulator, report_id - 1, packet_size=32,
+                                                 on_delivered=on_delivered, path=path)
+                    record(result)
+                else:
+                    # malicious 노드로 가는 경로를 찾지 못한 경우 일반 전송
+                    result = routing.send_report(simulator, report_id - 1, packet_size=32,
+                                                 on_delivered=on_delivered)
+                    if validate_path(result['path']):
+                        record(result)
+            else:
+                # affected 노드나 이웃이 없는 경우 일반 전송
+                result = routing.send_report(simulator, report_id - 1, packet_size=32,
+                                             on_delivered=on_delivered)
+                if validate_path(result['path']):
+                    record(result)
+        else:
+            # 일반 전송 (랜덤한 노드에서 BS로)
+            source_node = wsn_field.get_categories().sample("normal")
+            if source_node is not None:
+                result = routing.send_report(simulator, report_id - 1, source_node, packet_size=32,
+                                             on_delivered=on_delivered)
+                if validate_path(result['path']):
+                    record(result)
+
+        # 보고서 경로 정보 출력
+        if debug_mode and latest[0] is not None:
+            latest_result = latest[0]
+            path_str = ""
+            for i, node_id in enumerate(latest_result['path']):
+                if i > 0:
+                    path_str += " -> "
+                # 노드 ID가 'BS'인 경우
+                if node_id == "BS":
+                    path_str += "BS"
+                    continue
+
+                # 노드가 존재하는지 확인
+                try:
+                    node = wsn_field.nodes[int(node_id)]
+
+                    if node.node_type == "affected":
+                        path_str += f"{node_id}(+)"
+                    elif node.node_type in ["malicious_inside", "malicious_outside"]:
+                        path_str += f"{node_id}(*)"
+                    else:
+                        path_str += str(node_id)
+
+                except:
+                    path_str += f"{node_id}(?)"  # 에러 발생 시 (?)로 표시
+                    continue
+
+            logger.debug(f"Report #{latest_result['report_id']}: Source Node {latest_result['source_node']}, Path: {path_str}")
+
+        # 진행상황 출력 (10% 단위)
+        if report_id % max(num_reports // 10, 1) == 0:
+            progress = (report_id / num_reports) * 100
+            logger.info(f"Simulation Progress: {progress:.1f}%")
+
+        # 다음 보고서 예약
+        if report_id < num_reports:
+            simulator.schedule(report_interval, generate_report, report_id + 1)
+
+    attack.schedule_attack(simulator, 0.0, on_attack_executed, num_attackers=config['NUM_ATTACKERS'])
+    if num_reports > 0:
+        simulator.schedule(0.0, generate_report, 1)
+    try:
+        with phase("report_loop"):
+            simulator.run()
+    finally:
+        routing.recorder = previous_recorder
+    if recorder is not None:
+        recorder.finish(simulator.now)
+
+    end_time = time.time()
+    elapsed_time = end_time - start_time
+
+    logger.info(f"\nSimulation Time Information:")
+    logger.info(f"Total time elapsed: {elapsed_time:.4f} seconds")
+    logger.info(f"Average time per report: {elapsed_time/max(num_reports, 1):.4f} seconds")
+    logger.info(f"Total valid reports generated: {counts['valid']}")
+    logger.info(f"Simulated time: {simulator.now:.4f} seconds ({simulator.events_processed} events)")
+    if counts['delivered']:
+        logger.info(f"Delivered reports: {counts['delivered']}, "
+                    f"average end-to-end latency: {counts['latency_total'] / counts['delivered'] * 1000:.3f} ms "
+                    f"(max {counts['latency_max'] * 1000:.3f} ms)")
+    if recorder is not None:
+        reached = {name: f"{value:.1f}s" for name, value in recorder.lifetime().items() if value is not None}
+        logger.info(f"Network lifetime milestones: {reached if reached else 'none reached'}")
+
+    # 추가: 에너지 소비 및 패킷 전송/수신 통계
+    with phase("network_statistics"):
+        statistics = attack.analyze_network_statistics()
+
+    result = SimulationResult(config, wsn_field, routing, results, delivered, statistics,
+                              simulator.now, simulator.events_processed)
+    result.valid_reports = counts['valid']
+    result.delivered_reports = counts['delivered']
+    result.average_latency = counts['latency_total'] / counts['delivered'] if counts['delivered'] else None
+    result.max_latency = counts['latency_max'] if counts['delivered'] else None
+    result.recorder = recorder
+    return result
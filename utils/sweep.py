@@ -0,0 +1,143 @@
+"""파라미터 스윕 실행기
+
+config.py의 파라미터 격자(예: ATTACK_RANGE, NUM_ATTACKERS, ATTACK_PROBABILITY,
+NUM_NODES, RANDOM_SEED)의 모든 조합을 프로세스 풀(코어당 워커 하나)에서 실행하고,
+실행마다 네트워크 통계, 소요 시간, 보고서 전달 수를 하나의 CSV 표에 모은다.
+완료된 행은 바로 파일에 추가되므로 중단된 스윕을 다시 실행하면 성공한 조합은
+건너뛰고 실패했거나 실행되지 않은 조합만 다시 실행한다.
+"""
+import contextlib
+import csv
+import io
+import itertools
+import json
+import logging
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+logger = logging.getLogger('wsn_simulation')
+
+# 결과 표의 요약 열 (파라미터 열은 격자의 키 순서대로 앞에 붙음)
+SUMMARY_FIELDS = [
+    'status', 'error', 'elapsed_seconds', 'simulated_seconds', 'num_reports',
+    'valid_reports', 'delivered_reports', 'average_latency_ms', 'active_nodes',
+    'total_nodes', 'total_energy', 'total_tx', 'total_rx', 'nodes_with_energy',
+    'nodes_with_tx', 'nodes_with_rx', 'first_node_death_time', 'dead_10pct_time', 'dead_50pct_time',
+    'bs_partition_time',
+]
+
+
+def expand_grid(grid: dict) -> list:
+    """{파라미터: 값 리스트} 격자를 조합별 파라미터 딕셔너리 리스트로 펼침"""
+    names = list(grid)
+    values = [grid[name] if isinstance(grid[name], (list, tuple)) else [grid[name]]
+              for name in names]
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def run_key(params: dict) -> str:
+    """파라미터 조합을 식별하는 문자열 (재개 시 완료 여부 판단에 사용)"""
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def run_single(params: dict) -> dict:
+    """파라미터 조합 하나로 시뮬레이션을 실행하고 요약 딕셔너리 반환 (워커 프로세스에서 호출)
+
+    시각화와 결과 파일 저장 없이 run_simulation을 실행한다 (matplotlib을 불러오지 않음).
+    예외가 나도 던지지 않고 status='failed'와 오류 내용을 반환한다.
+    """
+    summary = {'status': 'failed', 'error': ''}
+    start_time = time.time()
+    try:
+        from utils.simulation import run_simulation
+
+        settings = {'DEBUG_MODE': False}
+        settings.update(params)
+        quiet = logging.getLogger('wsn_simulation')
+        saved_level = quiet.level
+        try:
+            quiet.setLevel(logging.WARNING)
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = run_simulation(settings)
+        finally:
+            quiet.setLevel(saved_level)
+        summary.update(result.summary())
+        summary['status'] = 'ok'
+    except Exception as e:
+        summary['error'] = f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=5)}"
+    summary['elapsed_seconds'] = time.time() - start_time
+    return summary
+
+
+def load_results(results_path: str) -> dict:
+    """기존 결과 표를 {run_key: 행} 딕셔너리로 읽음 (파일이 없으면 빈 딕셔너리)"""
+    if not os.path.exists(results_path):
+        return {}
+    with open(results_path, newline='') as csvfile:
+        return {row['run_key']: row for row in csv.DictReader(csvfile)}
+
+
+def run_sweep(grid: dict, results_path: str = None, workers: int = None,
+              base_params: dict = None, runner=run_single) -> list:
+    """격자의 모든 조합을 프로세스 풀에서 실행하고 결과 표(CSV)를 갱신한 뒤 모든 행 반환
+
+    - workers: 워커 프로세스 수 (기본: CPU 코어 수), 1이면 현재 프로세스에서 순차 실행
+    - base_params: 모든 조합에 공통으로 적용할 설정 (예: {"NUM_REPORTS": 200})
+    - 이미 status='ok'인 조합은 건너뛰며, 실패한 조합은 다시 실행한다.
+    """
+    if results_path is None:
+        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        results_path = os.path.join(script_dir, 'results', 'sweep_results.csv')
+    folder_path = os.path.dirname(results_path)
+    if folder_path and not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+
+    combinations = []
+    for params in expand_grid(grid):
+        merged = dict(base_params or {})
+        merged.update(params)
+        combinations.append(merged)
+    param_names = list(dict.fromkeys(name for params in combinations for name in params))
+    fieldnames = ['run_key'] + param_names + SUMMARY_FIELDS
+
+    existing = load_results(results_path)
+    pending = [params for params in combinations
+               if existing.get(run_key(params), {}).get('status') != 'ok']
+    logger.info(f"Sweep: {len(combinations)} runs, {len(combinations) - len(pending)} already done, "
+                f"{len(pending)} to run")
+
+    # 기존 행은 성공한 것만 남기고 새 열 구성으로 다시 기록 (실패 행은 재실행 결과로 대체)
+    rows = {key: row for key, row in existing.items() if row.get('status') == 'ok'}
+    with open(results_path, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows.values():
+            writer.writerow(row)
+
+        def record(params, summary):
+            row = {'run_key': run_key(params)}
+            row.update(params)
+            row.update(summary)
+            rows[row['run_key']] = row
+            writer.writerow(row)
+            csvfile.flush()  # 중단되어도 완료된 실행은 남김
+            logger.info(f"Sweep run {len(rows)}/{len(combinations)} {summary['status']}: {params}")
+
+        if workers == 1:
+            for params in pending:
+                record(params, runner(params))
+        else:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+                futures = {executor.submit(runner, params): params for params in pending}
+                for future in as_completed(futures):
+                    params = futures[future]
+                    try:
+                        summary = future.result()
+                    except Exception as e:
+                        # 워커 프로세스가 비정상 종료된 경우 (BrokenProcessPool: 메모리 부족 등)
+                        summary = {'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+                    record(params, summary)
+
+    return [rows[run_key(params)] for params in combinations if run_key(params) in rows]
@@ -1,7 +1,9 @@
 import os
-import matplotlib.pyplot as plt
 import logging
+import numpy as np
 from config import DEBUG_MODE
+from core.NodeStore import NodeStore, INACTIVE, AFFECTED, MALICIOUS_INSIDE, MALICIOUS_OUTSIDE
+from core.nodes.HardwareProfile import HardwareProfile
 
 def setup_logging():
     """로깅 설정"""
@@ -43,6 +45,9 @@ logger = logging.getLogger('wsn_simulation')
 
 def classify_wsn_nodes(wsn_field):
     """WSN 노드들을 타입별로 분류"""
+    if isinstance(wsn_field.nodes, NodeStore):
+        return _classify_store_nodes(wsn_field.nodes)
+
     # 노드 분류를 위한 리스트 초기화
     normal_nodes_x = []
     normal_nodes_y = []
@@ -85,8 +90,36 @@ def classify_wsn_nodes(wsn_field):
         'affected': (affected_nodes_x, affected_nodes_y)
     }
 
+def _classify_store_nodes(store):
+    """NodeStore 열에 대한 벡터 연산으로 노드 분류"""
+    xs = store.pos_x
+    ys = store.pos_y
+    node_type = store.node_type
+    
+    dead = store.status == INACTIVE
+    alive = ~dead
+    inside_attack = alive & (node_type == MALICIOUS_INSIDE)
+    outside_attack = alive & (node_type == MALICIOUS_OUTSIDE)
+    affected = alive & (node_type == AFFECTED)
+    normal = ~(dead | inside_attack | outside_attack | affected)
+    
+    # 잔여 에너지 비율에 따른 색상 (프로필별 초기 에너지 기준)
+    initial_energy = HardwareProfile.column('initial_energy')[store.profile[normal]]
+    color_intensity = np.maximum(0.2, store.energy_level[normal] / initial_energy)
+    normal_colors = [(0, 0, intensity) for intensity in color_intensity.tolist()]
+    
+    return {
+        'normal': (xs[normal].tolist(), ys[normal].tolist(), normal_colors),
+        'dead': (xs[dead].tolist(), ys[dead].tolist()),
+        'inside_attack': (xs[inside_attack].tolist(), ys[inside_attack].tolist()),
+        'outside_attack': (xs[outside_attack].tolist(), ys[outside_attack].tolist()),
+        'affected': (xs[affected].tolist(), ys[affected].tolist())
+    }
+
 def plot_wsn_network(wsn_field, classified_nodes, attack_range):
     """WSN 노드 배치 시각화"""
+    import matplotlib.pyplot as plt  # 시각화할 때만 불러옴 (헤드리스 실행 시 import 비용 없음)
+
     # next_hop이 없는 노드 출력
     disconnected_nodes = [node_id for node_id, node in wsn_field.nodes.items() if not node.next_hop]
     if disconnected_nodes: